@@ -1,5 +1,5 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, Response
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
@@ -12,6 +12,9 @@ from app.schemas.analysis import (
     NodeResultResponse,
     ElementResultResponse,
     ModalResultResponse,
+    ModeShapeResponse,
+    BucklingResultResponse,
+    TimeHistoryResponse,
 )
 from app.crud.analysis import (
     create_analysis,
@@ -23,6 +26,9 @@ from app.crud.analysis import (
     get_node_results,
     get_element_results,
     get_modal_results,
+    get_mode_shape,
+    get_buckling_results,
+    get_time_history,
 )
 from app.core.analysis.solver import run_analysis_task
 
@@ -188,26 +194,149 @@ def read_element_results(
     )
 
 
+MODAL_ANALYSIS_TYPES = [AnalysisType.MODAL, AnalysisType.RESPONSE_SPECTRUM, AnalysisType.TIME_HISTORY]
+
+
+def _get_modal_analysis(db: Session, analysis_id: str) -> Analysis:
+    analysis = get_analysis(db=db, analysis_id=analysis_id)
+    if not analysis:
+        raise HTTPException(status_code=404, detail="Analysis not found")
+    
+    if analysis.analysis_type not in MODAL_ANALYSIS_TYPES:
+        raise HTTPException(
+            status_code=400, detail="Analysis is not a modal, response spectrum or time history analysis"
+        )
+    
+    return analysis
+
+
 @router.get("/{analysis_id}/modal-results", response_model=List[ModalResultResponse])
 def read_modal_results(
     analysis_id: str,
     skip: int = 0,
     limit: int = 100,
+    include_mode_shapes: bool = True,
     db: Session = Depends(get_db),
 ):
     """
     Get modal results for an analysis.
     """
+    _get_modal_analysis(db, analysis_id)
+    
+    return get_modal_results(
+        db=db,
+        analysis_id=analysis_id,
+        skip=skip,
+        limit=limit,
+        include_mode_shapes=include_mode_shapes,
+    )
+
+
+@router.get("/{analysis_id}/mode-shapes/{mode_number}", response_model=ModeShapeResponse)
+def read_mode_shape(
+    analysis_id: str,
+    mode_number: int,
+    node_ids: Optional[List[str]] = Query(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Get one mode shape, for all nodes or only the given node IDs.
+    """
+    _get_modal_analysis(db, analysis_id)
+    
+    mode_shape = get_mode_shape(db=db, analysis_id=analysis_id, mode_number=mode_number, node_ids=node_ids)
+    if mode_shape is None:
+        raise HTTPException(status_code=404, detail="Mode shape not found")
+    
+    mode_shape["values"] = mode_shape["values"].tolist()
+    
+    return mode_shape
+
+
+@router.get("/{analysis_id}/mode-shapes/{mode_number}/binary")
+def read_mode_shape_binary(
+    analysis_id: str,
+    mode_number: int,
+    node_ids: Optional[List[str]] = Query(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Get one mode shape as raw little-endian float32 (n_nodes, 6) rows.
+    
+    Rows follow the analysis's mode_shape_node_ids, or the given node IDs, all of which must exist.
+    """
+    _get_modal_analysis(db, analysis_id)
+    
+    mode_shape = get_mode_shape(db=db, analysis_id=analysis_id, mode_number=mode_number, node_ids=node_ids)
+    if mode_shape is None:
+        raise HTTPException(status_code=404, detail="Mode shape not found")
+    
+    if node_ids is not None and len(mode_shape["node_ids"]) != len(node_ids):
+        raise HTTPException(status_code=404, detail="Node not found in mode shape")
+    
+    return Response(content=mode_shape["values"].astype("<f4").tobytes(), media_type="application/octet-stream")
+
+
+@router.get("/{analysis_id}/buckling-results", response_model=List[BucklingResultResponse])
+def read_buckling_results(
+    analysis_id: str,
+    load_case_id: Optional[str] = None,
+    load_combination_id: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+):
+    """
+    Get buckling load factors and mode shapes for an analysis.
+    """
     analysis = get_analysis(db=db, analysis_id=analysis_id)
     if not analysis:
         raise HTTPException(status_code=404, detail="Analysis not found")
     
-    if analysis.analysis_type not in [AnalysisType.MODAL, AnalysisType.RESPONSE_SPECTRUM]:
-        raise HTTPException(status_code=400, detail="Analysis is not a modal or response spectrum analysis")
+    if analysis.analysis_type != AnalysisType.BUCKLING:
+        raise HTTPException(status_code=400, detail="Analysis is not a buckling analysis")
     
-    return get_modal_results(
+    return get_buckling_results(
         db=db,
         analysis_id=analysis_id,
+        load_case_id=load_case_id,
+        load_combination_id=load_combination_id,
         skip=skip,
         limit=limit,
-    )
\ No newline at end of file
+    )
+
+
+@router.get("/{analysis_id}/time-history", response_model=TimeHistoryResponse)
+def read_time_history(
+    analysis_id: str,
+    node_id: Optional[str] = None,
+    element_id: Optional[str] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Get the displacement history of a node or the force history of an element for steps start..stop.
+    """
+    analysis = get_analysis(db=db, analysis_id=analysis_id)
+    if not analysis:
+        raise HTTPException(status_code=404, detail="Analysis not found")
+    
+    if analysis.analysis_type != AnalysisType.TIME_HISTORY:
+        raise HTTPException(status_code=400, detail="Analysis is not a time history analysis")
+    
+    if bool(node_id) == bool(element_id):
+        raise HTTPException(status_code=400, detail="Specify either a node_id or an element_id")
+    
+    history = get_time_history(
+        db=db,
+        analysis_id=analysis_id,
+        node_id=node_id,
+        element_id=element_id,
+        start=start,
+        stop=stop,
+    )
+    if history is None:
+        raise HTTPException(status_code=404, detail="No recorded time history for this node or element")
+    
+    return history
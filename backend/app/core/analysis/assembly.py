@@ -0,0 +1,228 @@
+import os
+import numpy as np
+import scipy.sparse as sp
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from app.core.analysis.shared_arrays import SharedArrays, SharedArraySpec, attach_shared_arrays
+
+ElementKernel = Callable[[Dict[str, np.ndarray]], Dict[str, np.ndarray]]
+
+
+def element_dof_indices(
+    start_node_indices: np.ndarray, end_node_indices: np.ndarray, dof_per_node: int = 6
+) -> np.ndarray:
+    """
+    Build the (n_elem, 2 * dof_per_node) array of global DOF indices for two-node elements.
+    """
+    local_dofs = np.arange(dof_per_node)
+    start_dofs = np.asarray(start_node_indices)[:, None] * dof_per_node + local_dofs
+    end_dofs = np.asarray(end_node_indices)[:, None] * dof_per_node + local_dofs
+
+    return np.hstack([start_dofs, end_dofs]).astype(np.int64)
+
+
+def assemble_sparse_matrix(
+    element_matrices: np.ndarray, element_dofs: np.ndarray, total_dof: int
+) -> sp.csr_matrix:
+    """
+    Assemble a global sparse matrix from a stack of element matrices.
+
+    Every element contributes its full (n, n) block as COO triplets; duplicate
+    entries are summed once during the conversion to CSR, so memory grows with
+    the number of elements rather than with the square of the DOF count.
+    """
+    element_matrices = np.asarray(element_matrices, dtype=float)
+    element_dofs = np.asarray(element_dofs, dtype=np.int64)
+
+    if element_matrices.size == 0:
+        return sp.csr_matrix((total_dof, total_dof))
+
+    n_dof = element_dofs.shape[1]
+
+    # Row/column index of every entry of every element block
+    rows = np.broadcast_to(element_dofs[:, :, None], (len(element_dofs), n_dof, n_dof))
+    cols = np.broadcast_to(element_dofs[:, None, :], (len(element_dofs), n_dof, n_dof))
+
+    matrix = sp.coo_matrix(
+        (element_matrices.ravel(), (rows.ravel(), cols.ravel())),
+        shape=(total_dof, total_dof)
+    )
+
+    return matrix.tocsr()
+
+
+def _assemble_chunk(spec: SharedArraySpec, start: int, stop: int, total_dof: int) -> int:
+    """
+    Worker: assemble elements [start, stop) and write the summed triplets to the chunk's output slice.
+
+    Returns the number of triplets written.
+    """
+    arrays, blocks = attach_shared_arrays(spec)
+    try:
+        chunk = assemble_sparse_matrix(
+            arrays["element_matrices"][start:stop], arrays["element_dofs"][start:stop], total_dof
+        ).tocoo()
+
+        offset = start * arrays["element_matrices"][0].size
+        arrays["rows"][offset:offset + chunk.nnz] = chunk.row
+        arrays["cols"][offset:offset + chunk.nnz] = chunk.col
+        arrays["values"][offset:offset + chunk.nnz] = chunk.data
+
+        return chunk.nnz
+    finally:
+        del arrays
+        for block in blocks:
+            block.close()
+
+
+def assemble_sparse_matrix_parallel(
+    element_matrices: np.ndarray,
+    element_dofs: np.ndarray,
+    total_dof: int,
+    chunk_size: int,
+    max_workers: Optional[int] = None,
+) -> sp.csr_matrix:
+    """
+    Assemble a global sparse matrix from chunks of elements in worker processes.
+
+    Element matrices and DOFs are shared with the workers, which assemble one
+    chunk each and write its triplets, with duplicates already summed, into a
+    shared output buffer at the chunk's offset. The parent merges the chunks
+    into CSR. Falls back to serial assembly for a single chunk or worker.
+    """
+    element_matrices = np.asarray(element_matrices, dtype=float)
+    element_dofs = np.asarray(element_dofs, dtype=np.int64)
+    max_workers = max_workers or os.cpu_count() or 1
+    num_elements = len(element_matrices)
+
+    if num_elements <= chunk_size or max_workers <= 1:
+        return assemble_sparse_matrix(element_matrices, element_dofs, total_dof)
+
+    starts = np.arange(0, num_elements, chunk_size)
+    stops = np.minimum(starts + chunk_size, num_elements)
+    block_size = element_matrices[0].size
+    index_dtype = np.int32 if total_dof < np.iinfo(np.int32).max else np.int64
+
+    with SharedArrays({"element_matrices": element_matrices, "element_dofs": element_dofs}) as shared:
+        rows = shared.allocate("rows", (num_elements * block_size,), index_dtype)
+        cols = shared.allocate("cols", (num_elements * block_size,), index_dtype)
+        values = shared.allocate("values", (num_elements * block_size,), float)
+
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(starts))) as executor:
+            counts = list(executor.map(
+                _assemble_chunk,
+                [shared.spec] * len(starts), starts, stops, [total_dof] * len(starts)
+            ))
+
+        # Merge the written part of every chunk's slice
+        written = np.concatenate([
+            np.arange(start * block_size, start * block_size + count) for start, count in zip(starts, counts)
+        ])
+        matrix = sp.coo_matrix(
+            (values[written], (rows[written], cols[written])), shape=(total_dof, total_dof)
+        ).tocsr()
+
+    return matrix
+
+
+def _assemble_kernel_chunk(
+    spec: SharedArraySpec,
+    kernel: ElementKernel,
+    inputs: Sequence[str],
+    assemble: str,
+    keep: Sequence[str],
+    start: int,
+    stop: int,
+    total_dof: int,
+) -> int:
+    """
+    Worker: run the element kernel on elements [start, stop), write the kept element matrices
+    and the summed triplets of the assembled matrix to the chunk's shared output slices.
+
+    Returns the number of triplets written.
+    """
+    arrays, blocks = attach_shared_arrays(spec)
+    try:
+        outputs = kernel({name: arrays[name][start:stop] for name in inputs})
+
+        for name in keep:
+            arrays[name][start:stop] = outputs[name]
+
+        chunk = assemble_sparse_matrix(outputs[assemble], arrays["element_dofs"][start:stop], total_dof).tocoo()
+
+        offset = start * outputs[assemble][0].size
+        arrays["rows"][offset:offset + chunk.nnz] = chunk.row
+        arrays["cols"][offset:offset + chunk.nnz] = chunk.col
+        arrays["values"][offset:offset + chunk.nnz] = chunk.data
+
+        return chunk.nnz
+    finally:
+        del arrays
+        for block in blocks:
+            block.close()
+
+
+def assemble_element_kernel_parallel(
+    kernel: ElementKernel,
+    element_data: Dict[str, np.ndarray],
+    element_dofs: np.ndarray,
+    total_dof: int,
+    chunk_size: int,
+    max_workers: Optional[int] = None,
+    assemble: str = "K_global",
+    keep: Sequence[str] = (),
+) -> Tuple[sp.csr_matrix, Dict[str, np.ndarray]]:
+    """
+    Calculate element matrices and assemble a global sparse matrix, chunk by chunk in worker processes.
+
+    Only the per-element geometry and properties in ``element_data`` are
+    shared with the workers. Each worker runs the batched ``kernel`` (a
+    module-level function returning named (n, 12, 12) stacks) on its chunk,
+    assembles the ``assemble`` stack into summed triplets and writes the stacks
+    named in ``keep`` into shared output arrays, which are copied out before
+    the shared memory is released. Falls back to one serial kernel call for a
+    single chunk or worker.
+    """
+    element_dofs = np.asarray(element_dofs, dtype=np.int64)
+    max_workers = max_workers or os.cpu_count() or 1
+    num_elements = len(element_dofs)
+
+    if num_elements <= chunk_size or max_workers <= 1:
+        outputs = kernel(element_data)
+        return (
+            assemble_sparse_matrix(outputs[assemble], element_dofs, total_dof),
+            {name: outputs[name] for name in keep}
+        )
+
+    starts = np.arange(0, num_elements, chunk_size)
+    stops = np.minimum(starts + chunk_size, num_elements)
+    sample = kernel({name: array[:1] for name, array in element_data.items()})
+    block_size = sample[assemble][0].size
+    index_dtype = np.int32 if total_dof < np.iinfo(np.int32).max else np.int64
+
+    with SharedArrays({**element_data, "element_dofs": element_dofs}) as shared:
+        for name in keep:
+            shared.allocate(name, (num_elements,) + sample[name].shape[1:], sample[name].dtype)
+
+        rows = shared.allocate("rows", (num_elements * block_size,), index_dtype)
+        cols = shared.allocate("cols", (num_elements * block_size,), index_dtype)
+        values = shared.allocate("values", (num_elements * block_size,), float)
+
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(starts))) as executor:
+            counts = list(executor.map(
+                _assemble_kernel_chunk,
+                [shared.spec] * len(starts), [kernel] * len(starts), [list(element_data)] * len(starts),
+                [assemble] * len(starts), [list(keep)] * len(starts), starts, stops, [total_dof] * len(starts)
+            ))
+
+        # Merge the written part of every chunk's slice
+        written = np.concatenate([
+            np.arange(start * block_size, start * block_size + count) for start, count in zip(starts, counts)
+        ])
+        matrix = sp.coo_matrix(
+            (values[written], (rows[written], cols[written])), shape=(total_dof, total_dof)
+        ).tocsr()
+        stacks = {name: np.array(shared.arrays[name]) for name in keep}
+
+    return matrix, stacks
@@ -0,0 +1,38 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import eigh
+from scipy.sparse.linalg import LinearOperator, eigsh
+from typing import Tuple
+
+from app.core.analysis.linear_solvers import Factorization
+
+
+def buckling_load_factors(
+    K: sp.csr_matrix, Kg: sp.csr_matrix, factorization: Factorization, num_modes: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solve (K + lambda Kg) phi = 0 for the lowest positive load factors lambda.
+
+    The problem is solved in the shift-invert form -Kg phi = mu K phi with
+    mu = 1 / lambda around a shift of zero, so the operator only needs the
+    existing factorization of K: the largest positive mu are the lowest
+    positive load factors and converge first. Returns the load factors in
+    ascending order and the mode shapes as columns.
+    """
+    n = K.shape[0]
+    if n == 0 or Kg.nnz == 0 or not np.any(Kg.data):
+        return np.zeros(0), np.zeros((n, 0))
+
+    if num_modes >= n - 1:
+        # Too few DOFs for ARPACK; solve the small dense problem directly
+        mu, modes = eigh(-Kg.toarray(), K.toarray())
+    else:
+        K_inverse = LinearOperator((n, n), matvec=factorization.solve, dtype=float)
+        mu, modes = eigsh(-Kg, k=num_modes, M=K, Minv=K_inverse, which="LA")
+
+    # Keep positive load factors, lowest first
+    positive = mu > 0
+    load_factors, modes = 1.0 / mu[positive], modes[:, positive]
+    order = np.argsort(load_factors)[:num_modes]
+
+    return load_factors[order], modes[:, order]
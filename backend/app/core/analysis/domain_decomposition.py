@@ -0,0 +1,274 @@
+import logging
+import os
+import time
+import numpy as np
+import scipy.sparse as sp
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from typing import Any, Dict, Optional, Tuple
+from scipy.sparse.csgraph import shortest_path
+
+from app.core.analysis.renumbering import node_adjacency_matrix
+from app.core.analysis.linear_solvers import Factorization, SparseLUSolver, factorize
+from app.core.analysis.shared_arrays import SharedArrays, SharedArraySpec, attach_shared_arrays
+from app.models.analysis import LinearSolverType
+
+logger = logging.getLogger(__name__)
+
+SCHUR_BLOCK_COLUMNS = 256  # Interface columns of K_II^-1 K_IB formed at a time in a worker
+
+# Interior factorizations by (shared loads block, subdomain), kept in a worker between condensation and recovery
+_interior_factorizations: Dict[Tuple[str, int], Factorization] = {}
+
+
+def _bisect(adjacency: sp.csr_matrix) -> np.ndarray:
+    """
+    Split a graph in two halves by the level structure of a pseudo-peripheral node.
+
+    Returns a mask of the nodes in the far half.
+    """
+    n = adjacency.shape[0]
+    start = 0
+    for _ in range(2):
+        distance = shortest_path(adjacency, unweighted=True, indices=start)
+        finite = np.isfinite(distance)
+        start = int(np.flatnonzero(finite)[np.argmax(distance[finite])])
+
+    # Nodes in other connected components count as farthest
+    distance = shortest_path(adjacency, unweighted=True, indices=start)
+    distance[~np.isfinite(distance)] = n
+
+    far = np.zeros(n, dtype=bool)
+    far[np.argsort(distance, kind="stable")[n // 2:]] = True
+
+    return far
+
+
+def partition_nodes(element_nodes: np.ndarray, num_nodes: int, num_parts: int) -> np.ndarray:
+    """
+    Partition the node graph into ``num_parts`` parts by recursive bisection of the largest part.
+    """
+    adjacency = node_adjacency_matrix(element_nodes, num_nodes)
+    parts = np.zeros(num_nodes, dtype=np.int64)
+
+    for new_part in range(1, min(num_parts, num_nodes)):
+        nodes = np.flatnonzero(parts == np.bincount(parts).argmax())
+        far = _bisect(adjacency[nodes][:, nodes])
+        parts[nodes[far]] = new_part
+
+    return parts
+
+
+def _subdomain_matrices(
+    arrays: Dict[str, np.ndarray], elements: np.ndarray, interior: np.ndarray, boundary: np.ndarray
+) -> Tuple[sp.csr_matrix, sp.csr_matrix, sp.csr_matrix]:
+    """
+    Assemble K_II, K_IB and K_BB of one subdomain from the shared element matrices.
+    """
+    num_interior = len(interior)
+    local = np.full(arrays["free_mask"].shape[0], -1, dtype=np.int64)
+    local[interior] = np.arange(num_interior)
+    local[boundary] = num_interior + np.arange(len(boundary))
+
+    dofs = local[arrays["element_dofs"][elements]]
+    rows = np.broadcast_to(dofs[:, :, None], (len(elements), 12, 12))
+    cols = np.broadcast_to(dofs[:, None, :], (len(elements), 12, 12))
+    keep = (rows >= 0) & (cols >= 0)
+
+    size = num_interior + len(boundary)
+    K = sp.coo_matrix(
+        (arrays["element_matrices"][elements][keep], (rows[keep], cols[keep])), shape=(size, size)
+    ).tocsr()
+
+    return K[:num_interior, :num_interior], K[:num_interior, num_interior:], K[num_interior:, num_interior:]
+
+
+def _condense_subdomain(
+    spec: SharedArraySpec, part: int, elements: np.ndarray, interior: np.ndarray, boundary: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Worker: Schur complement K_BB - K_BI K_II^-1 K_IB and condensed loads -K_BI K_II^-1 F_I.
+
+    The Schur complement is returned as (rows, cols, values) triplets in the
+    subdomain's boundary numbering. K_II^-1 K_IB is formed only for boundary
+    DOFs coupled to the interior, a block of columns at a time. The interior
+    factorization is kept in this worker for ``_recover_subdomain``.
+    """
+    arrays, blocks = attach_shared_arrays(spec)
+    try:
+        K_II, K_IB, K_BB = _subdomain_matrices(arrays, elements, interior, boundary)
+        F_I = np.array(arrays["loads"][interior])
+        K_BB = K_BB.tocoo()
+        rows, cols, values = [K_BB.row], [K_BB.col], [K_BB.data]
+        loads = np.zeros((len(boundary), F_I.shape[1]))
+        if len(interior) == 0:
+            return np.concatenate(rows), np.concatenate(cols), np.concatenate(values), loads
+
+        factorization = SparseLUSolver().factorize(K_II)
+        _interior_factorizations[(spec["loads"][0], part)] = factorization
+
+        coupled = np.flatnonzero(K_IB.getnnz(axis=0))
+        K_IC = K_IB[:, coupled].tocsc()
+        K_CI = K_IC.T.tocsr()
+        for first in range(0, len(coupled), SCHUR_BLOCK_COLUMNS):
+            columns = slice(first, first + SCHUR_BLOCK_COLUMNS)
+            block = K_CI @ factorization.solve(K_IC[:, columns].toarray())
+            block_rows, block_cols = np.nonzero(block)
+            rows.append(coupled[block_rows])
+            cols.append(coupled[first + block_cols])
+            values.append(-block[block_rows, block_cols])
+        loads[coupled] = -(K_CI @ factorization.solve(F_I))
+
+        return np.concatenate(rows), np.concatenate(cols), np.concatenate(values), loads
+    finally:
+        del arrays
+        for block in blocks:
+            block.close()
+
+
+def _recover_subdomain(
+    spec: SharedArraySpec,
+    part: int,
+    elements: np.ndarray,
+    interior: np.ndarray,
+    boundary: np.ndarray,
+    U_B: np.ndarray
+) -> np.ndarray:
+    """
+    Worker: interior displacements K_II^-1 (F_I - K_IB U_B) with the factorization kept by condensation.
+    """
+    if len(interior) == 0:
+        return np.zeros((0, U_B.shape[1]))
+
+    factorization = _interior_factorizations.pop((spec["loads"][0], part))
+    arrays, blocks = attach_shared_arrays(spec)
+    try:
+        _, K_IB, _ = _subdomain_matrices(arrays, elements, interior, boundary)
+        F_I = np.array(arrays["loads"][interior])
+
+        return factorization.solve(F_I - K_IB @ U_B)
+    finally:
+        del arrays
+        for block in blocks:
+            block.close()
+
+
+def solve_domain_decomposition(
+    element_matrices: np.ndarray,
+    element_dofs: np.ndarray,
+    element_nodes: np.ndarray,
+    free_mask: np.ndarray,
+    F_global: np.ndarray,
+    num_subdomains: int,
+    max_workers: Optional[int] = None,
+    dof_per_node: int = 6,
+    linear_solver: Optional[LinearSolverType] = None,
+    tolerance: Optional[float] = None,
+    max_iterations: Optional[int] = None,
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Solve K U = F by non-overlapping domain decomposition.
+
+    Elements are split into subdomains by graph bisection of the node
+    adjacency. Each subdomain's interior is condensed onto the interface in a
+    worker process reading the element matrices and loads from shared memory;
+    the sparse interface (Schur complement) system is solved in this process
+    with the ``linear_solver``, ``tolerance`` and ``max_iterations`` overrides
+    and the interior displacements are back-substituted in parallel. Every
+    subdomain stays on one worker, which reuses its interior factorization.
+    Returns the full (total_dof, n_cases) displacements and solve statistics.
+    """
+    total_dof = len(free_mask)
+    num_nodes = total_dof // dof_per_node
+    F_global = np.asarray(F_global, dtype=float).reshape(total_dof, -1)
+
+    # 1. Partition nodes, assign elements by their start node and find the interface
+    start = time.perf_counter()
+    node_part = partition_nodes(element_nodes, num_nodes, num_subdomains)
+    element_part = node_part[element_nodes[:, 0]]
+
+    node_element_parts = np.unique(
+        np.stack([element_nodes.ravel(), np.repeat(element_part, 2)], axis=1), axis=0
+    )
+    interface_nodes = np.bincount(node_element_parts[:, 0], minlength=num_nodes) > 1
+    interface_mask = np.repeat(interface_nodes, dof_per_node) & free_mask
+    interface_dofs = np.flatnonzero(interface_mask)
+    interface_index = np.full(total_dof, -1, dtype=np.int64)
+    interface_index[interface_dofs] = np.arange(len(interface_dofs))
+
+    subdomains = []
+    for part in range(int(element_part.max()) + 1 if len(element_part) else 0):
+        elements = np.flatnonzero(element_part == part)
+        dofs = np.unique(element_dofs[elements])
+        dofs = dofs[free_mask[dofs]]
+        subdomains.append((elements, dofs[~interface_mask[dofs]], dofs[interface_mask[dofs]]))
+    partition_time = time.perf_counter() - start
+
+    num_workers = max(1, min(max_workers or os.cpu_count() or 1, len(subdomains)))
+    with SharedArrays({
+        "element_matrices": element_matrices,
+        "element_dofs": element_dofs,
+        "free_mask": free_mask,
+        "loads": F_global,
+    }) as shared, ExitStack() as stack:
+        # One single-process pool per worker, so each subdomain is condensed and recovered in the same process
+        executors = [stack.enter_context(ProcessPoolExecutor(max_workers=1)) for _ in range(num_workers)]
+
+        # 2. Condense every subdomain onto the interface in parallel
+        start = time.perf_counter()
+        condensed = [
+            executors[part % num_workers].submit(_condense_subdomain, shared.spec, part, *subdomain)
+            for part, subdomain in enumerate(subdomains)
+        ]
+        rows, cols, values = [], [], []
+        g = F_global[interface_dofs].copy()
+        for (_, _, boundary), future in zip(subdomains, condensed):
+            local = interface_index[boundary]
+            schur_rows, schur_cols, schur_values, loads = future.result()
+            rows.append(local[schur_rows])
+            cols.append(local[schur_cols])
+            values.append(schur_values)
+            g[local] += loads
+        condensation_time = time.perf_counter() - start
+
+        # 3. Assemble and solve the sparse interface problem
+        start = time.perf_counter()
+        U_global = np.zeros(F_global.shape)
+        interface_solver = None
+        if len(interface_dofs):
+            S = sp.coo_matrix(
+                (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+                shape=(len(interface_dofs), len(interface_dofs))
+            ).tocsr()
+            factorization, backend, _ = factorize(S, linear_solver, tolerance=tolerance, max_iterations=max_iterations)
+            U_global[interface_dofs] = factorization.solve(g)
+            interface_solver = backend.name
+        interface_time = time.perf_counter() - start
+
+        # 4. Back-substitute interior displacements in parallel
+        start = time.perf_counter()
+        recovered = [
+            executors[part % num_workers].submit(
+                _recover_subdomain, shared.spec, part, *subdomain, U_global[subdomain[2]]
+            )
+            for part, subdomain in enumerate(subdomains)
+        ]
+        for (_, interior, _), future in zip(subdomains, recovered):
+            U_global[interior] = future.result()
+        recovery_time = time.perf_counter() - start
+
+    logger.info(
+        f"Domain decomposition: {len(subdomains)} subdomains, {len(interface_dofs)} interface DOFs; "
+        f"condensation {condensation_time:.3f} s, interface solve {interface_time:.3f} s, "
+        f"back-substitution {recovery_time:.3f} s"
+    )
+
+    return U_global, {
+        "subdomains": len(subdomains),
+        "interface_dof": int(len(interface_dofs)),
+        "interface_solver": interface_solver,
+        "partition_time": partition_time,
+        "condensation_time": condensation_time,
+        "interface_time": interface_time,
+        "recovery_time": recovery_time,
+    }
@@ -0,0 +1,106 @@
+import numpy as np
+from typing import Optional, Tuple
+from scipy.linalg import lu_factor, lu_solve
+
+from app.core.analysis.linear_solvers import Factorization, available_memory, MEMORY_FRACTION
+
+WOODBURY_BLOCK_COLUMNS = 64  # Columns of Z = K0^-1 P solved at a time
+
+
+def changed_elements(
+    base_matrices: np.ndarray, element_matrices: np.ndarray, rtol: float = 1e-12
+) -> np.ndarray:
+    """
+    Indices of elements whose (n_elem, 12, 12) stiffness matrices differ from the base model.
+    """
+    scale = np.abs(base_matrices).max(axis=(1, 2), keepdims=True)
+    difference = np.abs(element_matrices - base_matrices) > rtol * np.maximum(scale, 1e-300)
+
+    return np.flatnonzero(difference.any(axis=(1, 2)))
+
+
+def low_rank_update(
+    element_delta: np.ndarray, element_dofs: np.ndarray, reduced_index: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Express the change of the reduced stiffness matrix as dK = P D P^T.
+
+    ``element_delta`` holds the (m, 12, 12) stiffness changes of the changed
+    elements, ``element_dofs`` their global DOFs and ``reduced_index`` maps
+    global DOFs to reduced (free) DOF indices, -1 for constrained DOFs.
+    Returns the sorted reduced DOFs touched by the change (the columns of P)
+    and the dense symmetric block D.
+    """
+    reduced = reduced_index[element_dofs]
+    dofs = np.unique(reduced[reduced >= 0])
+
+    # Local position of every element DOF in D, -1 for constrained DOFs
+    local = np.where(reduced >= 0, np.searchsorted(dofs, reduced), -1)
+    rows = np.broadcast_to(local[:, :, None], element_delta.shape)
+    cols = np.broadcast_to(local[:, None, :], element_delta.shape)
+    keep = (rows >= 0) & (cols >= 0)
+
+    D = np.zeros((len(dofs), len(dofs)))
+    np.add.at(D, (rows[keep], cols[keep]), element_delta[keep])
+
+    return dofs, D
+
+
+def woodbury_nbytes(size: int, rank: int) -> int:
+    """
+    Memory held by a Woodbury update of the given rank: Z (size x rank), D and the capacitance factor.
+    """
+    return 8 * size * rank + 16 * rank * rank
+
+
+def woodbury_fits(size: int, rank: int, memory: Optional[int] = None) -> bool:
+    """
+    Whether a Woodbury update (and one block of right-hand sides) fits the factorization memory budget.
+    """
+    memory = memory if memory is not None else available_memory()
+    if not memory:
+        return True
+
+    return woodbury_nbytes(size, rank) + 8 * size * WOODBURY_BLOCK_COLUMNS < memory * MEMORY_FRACTION
+
+
+class WoodburyFactorization(Factorization):
+    """
+    Solve (K0 + P D P^T) x = f by reusing a factorization of K0.
+
+    Uses the Sherman-Morrison-Woodbury identity in the form
+    (K0 + P D P^T)^-1 = K0^-1 - Z (I + D P^T Z)^-1 D P^T K0^-1 with
+    Z = K0^-1 P, which does not require D to be invertible. Building Z costs
+    one solve with the base factorization per updated DOF; it is solved in
+    blocks of columns so that P itself is never held.
+    """
+
+    def __init__(self, base: Factorization, size: int, dofs: np.ndarray, D: np.ndarray):
+        self.base = base
+        self.dofs = dofs
+        self.D = D
+
+        self.Z = np.empty((size, len(dofs)))
+        for start in range(0, len(dofs), WOODBURY_BLOCK_COLUMNS):
+            columns = np.arange(start, min(start + WOODBURY_BLOCK_COLUMNS, len(dofs)))
+            P = np.zeros((size, len(columns)))
+            P[dofs[columns], np.arange(len(columns))] = 1.0
+            self.Z[:, columns] = base.solve(P)
+
+        self.capacitance = lu_factor(np.eye(len(dofs)) + D @ self.Z[dofs]) if len(dofs) else None
+
+    @property
+    def rank(self) -> int:
+        return len(self.dofs)
+
+    def solve(self, F: np.ndarray) -> np.ndarray:
+        y = self.base.solve(F)
+        if self.rank == 0:
+            return y
+
+        return y - self.Z @ lu_solve(self.capacitance, self.D @ y[self.dofs])
+
+    @property
+    def nbytes(self) -> int:
+        return self.Z.nbytes + self.D.nbytes + (self.capacitance[0].nbytes if self.rank else 0)
+
@@ -0,0 +1,287 @@
+import numpy as np
+from typing import Dict, Tuple
+
+
+def element_stiffness_matrices(
+    L: np.ndarray,
+    E: np.ndarray,
+    A: np.ndarray,
+    Iy: np.ndarray,
+    Iz: np.ndarray,
+    J: np.ndarray,
+    nu: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate the local stiffness matrices of 3D beam elements as an (n_elem, 12, 12) stack.
+    """
+    L, E, A, Iy, Iz, J, nu = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (L, E, A, Iy, Iz, J, nu))
+    )
+    G = E / (2 * (1 + nu))  # Shear modulus
+
+    K = np.zeros((len(L), 12, 12))
+
+    # Axial terms
+    K[:, 0, 0] = K[:, 6, 6] = E * A / L
+    K[:, 0, 6] = K[:, 6, 0] = -E * A / L
+
+    # Torsional terms
+    K[:, 3, 3] = K[:, 9, 9] = G * J / L
+    K[:, 3, 9] = K[:, 9, 3] = -G * J / L
+
+    # Bending terms (y-axis)
+    K[:, 1, 1] = K[:, 7, 7] = 12 * E * Iz / L**3
+    K[:, 1, 7] = K[:, 7, 1] = -12 * E * Iz / L**3
+    K[:, 1, 5] = K[:, 5, 1] = 6 * E * Iz / L**2
+    K[:, 1, 11] = K[:, 11, 1] = 6 * E * Iz / L**2
+    K[:, 5, 5] = K[:, 11, 11] = 4 * E * Iz / L
+    K[:, 5, 7] = K[:, 7, 5] = -6 * E * Iz / L**2
+    K[:, 5, 11] = K[:, 11, 5] = 2 * E * Iz / L
+    K[:, 7, 11] = K[:, 11, 7] = -6 * E * Iz / L**2
+
+    # Bending terms (z-axis)
+    K[:, 2, 2] = K[:, 8, 8] = 12 * E * Iy / L**3
+    K[:, 2, 8] = K[:, 8, 2] = -12 * E * Iy / L**3
+    K[:, 2, 4] = K[:, 4, 2] = -6 * E * Iy / L**2
+    K[:, 2, 10] = K[:, 10, 2] = -6 * E * Iy / L**2
+    K[:, 4, 4] = K[:, 10, 10] = 4 * E * Iy / L
+    K[:, 4, 8] = K[:, 8, 4] = 6 * E * Iy / L**2
+    K[:, 4, 10] = K[:, 10, 4] = 2 * E * Iy / L
+    K[:, 8, 10] = K[:, 10, 8] = 6 * E * Iy / L**2
+
+    return K
+
+
+def element_geometric_stiffness_matrices(
+    L: np.ndarray, P: np.ndarray, A: np.ndarray, Iy: np.ndarray, Iz: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate the local geometric stiffness matrices of 3D beam elements as an (n_elem, 12, 12) stack.
+
+    ``P`` is the axial force, positive in tension. Uses the consistent
+    (cubic shape function) lateral terms and the Wagner torsion term
+    P (Iy + Iz) / (A L).
+    """
+    L, P, A, Iy, Iz = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (L, P, A, Iy, Iz))
+    )
+    c = P / L
+
+    Kg = np.zeros((len(L), 12, 12))
+
+    # Lateral translation terms (both bending planes)
+    for i in (1, 2):
+        Kg[:, i, i] = Kg[:, i + 6, i + 6] = 6 * c / 5
+        Kg[:, i, i + 6] = Kg[:, i + 6, i] = -6 * c / 5
+
+    # Torsional terms
+    Kg[:, 3, 3] = Kg[:, 9, 9] = c * (Iy + Iz) / A
+    Kg[:, 3, 9] = Kg[:, 9, 3] = -c * (Iy + Iz) / A
+
+    # Translation-rotation coupling (local y with rz, local z with ry)
+    Kg[:, 1, 5] = Kg[:, 5, 1] = Kg[:, 1, 11] = Kg[:, 11, 1] = c * L / 10
+    Kg[:, 5, 7] = Kg[:, 7, 5] = Kg[:, 7, 11] = Kg[:, 11, 7] = -c * L / 10
+    Kg[:, 2, 4] = Kg[:, 4, 2] = Kg[:, 2, 10] = Kg[:, 10, 2] = -c * L / 10
+    Kg[:, 4, 8] = Kg[:, 8, 4] = Kg[:, 8, 10] = Kg[:, 10, 8] = c * L / 10
+
+    # Rotation terms
+    for i in (4, 5):
+        Kg[:, i, i] = Kg[:, i + 6, i + 6] = 2 * c * L**2 / 15
+        Kg[:, i, i + 6] = Kg[:, i + 6, i] = -c * L**2 / 30
+
+    return Kg
+
+
+def _elongation_vector() -> np.ndarray:
+    b = np.zeros(12)
+    b[0], b[6] = -1.0, 1.0
+
+    return b
+
+
+def element_second_order_forces(
+    K_local: np.ndarray, G: np.ndarray, axial_stiffness: np.ndarray, d: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the local internal forces of 3D beams with second-order axial strain.
+
+    The axial strain adds d^T G d / (2 L) to the chord elongation, where G is the
+    geometric stiffness for a unit tensile force, so the axial force (positive in
+    tension) is N = EA/L (u2 - u1 + d^T G d / 2) and the internal force is
+    K_b d + N (b + G d), with K_b the local stiffness without its axial terms and
+    b the elongation vector. ``d`` is (n_elem, 12) local displacements; returns
+    the (n_elem, 12) forces and the (n_elem,) axial forces.
+    """
+    b = _elongation_vector()
+    Gd = np.einsum("nij,nj->ni", G, d)
+    elongation = d @ b
+
+    N = axial_stiffness * (elongation + 0.5 * np.einsum("ni,ni->n", d, Gd))
+    f = np.einsum("nij,nj->ni", K_local, d) - (axial_stiffness * elongation)[:, None] * b + N[:, None] * (b + Gd)
+
+    return f, N
+
+
+def element_second_order_tangents(
+    K_local: np.ndarray, G: np.ndarray, axial_stiffness: np.ndarray, d: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate the (n_elem, 12, 12) local tangent stiffness matrices matching ``element_second_order_forces``.
+
+    The tangent K_b + N G + EA/L (b + G d)(b + G d)^T is symmetric.
+    """
+    b = _elongation_vector()
+    Gd = np.einsum("nij,nj->ni", G, d)
+    a = b + Gd
+    N = axial_stiffness * (d @ b + 0.5 * np.einsum("ni,ni->n", d, Gd))
+
+    K_T = K_local - axial_stiffness[:, None, None] * np.outer(b, b) + N[:, None, None] * G
+    K_T += axial_stiffness[:, None, None] * a[:, :, None] * a[:, None, :]
+
+    return K_T
+
+
+def element_mass_matrices(L: np.ndarray, rho: np.ndarray, A: np.ndarray) -> np.ndarray:
+    """
+    Calculate the local mass matrices of 3D beam elements as an (n_elem, 12, 12) stack.
+    """
+    L, rho, A = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (L, rho, A))
+    )
+    m = rho * A * L  # Total mass of each element
+
+    M = np.zeros((len(L), 12, 12))
+
+    # Translational terms
+    for i in range(3):
+        M[:, i, i] = M[:, i + 6, i + 6] = m / 3
+        M[:, i, i + 6] = M[:, i + 6, i] = m / 6
+
+    # Rotational terms (simplified)
+    for i in range(3, 6):
+        M[:, i, i] = M[:, i + 6, i + 6] = m * L**2 / 3
+        M[:, i, i + 6] = M[:, i + 6, i] = m * L**2 / 6
+
+    return M
+
+
+def rotation_matrices(
+    dx: np.ndarray, dy: np.ndarray, dz: np.ndarray, L: np.ndarray, angle: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate the (n_elem, 3, 3) rotation matrices from global to local element axes.
+    """
+    dx, dy, dz, L, angle = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (dx, dy, dz, L, angle))
+    )
+
+    # Direction cosines (avoid division by zero)
+    L = np.maximum(L, 1e-10)
+    cx = dx / L
+    cy = dy / L
+    cz = dz / L
+
+    # Perpendicular direction; vertical elements use the global X axis
+    vertical = (np.abs(cx) < 1e-10) & (np.abs(cy) < 1e-10)
+    d = np.where(vertical, 1.0, np.sqrt(cx**2 + cy**2))
+    cx_p = np.where(vertical, 1.0, -cy / d)
+    cy_p = np.where(vertical, 0.0, cx / d)
+    cz_p = np.zeros_like(cx)
+
+    # Apply rotation angle
+    angle_rad = np.radians(angle)
+    cos_a = np.cos(angle_rad)
+    sin_a = np.sin(angle_rad)
+
+    cx_pp = cx_p * cos_a + (cy * cz_p - cz * cy_p) * sin_a
+    cy_pp = cy_p * cos_a + (cz * cx_p - cx * cz_p) * sin_a
+    cz_pp = cz_p * cos_a + (cx * cy_p - cy * cx_p) * sin_a
+
+    R = np.empty((len(L), 3, 3))
+    R[:, 0] = np.stack([cx, cy, cz], axis=-1)
+    R[:, 1] = np.stack([cx_pp, cy_pp, cz_pp], axis=-1)
+    R[:, 2] = np.stack([
+        cy * cz_pp - cz * cy_pp,
+        cz * cx_pp - cx * cz_pp,
+        cx * cy_pp - cy * cx_pp
+    ], axis=-1)
+
+    return R
+
+
+def transformation_matrices(
+    dx: np.ndarray, dy: np.ndarray, dz: np.ndarray, L: np.ndarray, angle: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate the (n_elem, 12, 12) transformation matrices from global to local coordinates.
+    """
+    R = rotation_matrices(dx, dy, dz, L, angle)
+
+    T = np.zeros((len(R), 12, 12))
+    for i in range(4):
+        T[:, 3*i:3*i+3, 3*i:3*i+3] = R
+
+    return T
+
+
+def transform_to_global(T: np.ndarray, K_local: np.ndarray) -> np.ndarray:
+    """
+    Compute T.T @ K_local @ T for every element in one batched operation.
+    """
+    return np.matmul(np.swapaxes(T, 1, 2), np.matmul(K_local, T))
+
+
+def element_stiffness_kernel(data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Calculate the transformation, local and global stiffness matrices of a batch of elements.
+
+    ``data`` holds per-element geometry and properties as returned by
+    ``ModelSnapshot.element_properties``.
+    """
+    K_local = element_stiffness_matrices(
+        data["L"], data["E"], data["A"], data["Iy"], data["Iz"], data["J"], data["nu"]
+    )
+    T = transformation_matrices(data["dx"], data["dy"], data["dz"], data["L"], data["angle"])
+
+    return {"T": T, "K_local": K_local, "K_global": transform_to_global(T, K_local)}
+
+
+def element_mass_kernel(data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Calculate the global mass matrices of a batch of elements.
+    """
+    M_local = element_mass_matrices(data["L"], data["rho"], data["A"])
+    T = transformation_matrices(data["dx"], data["dy"], data["dz"], data["L"], data["angle"])
+
+    return {"M_global": transform_to_global(T, M_local)}
+
+
+def element_end_forces(T: np.ndarray, K_local: np.ndarray, U_elements: np.ndarray) -> np.ndarray:
+    """
+    Calculate local end forces from global element displacements.
+
+    ``U_elements`` is (n_elem, 12, n_cases); the result is (n_cases, n_elem, 2, 6)
+    with the start-node forces at position 0 and the sign-flipped end-node
+    forces at position 1.
+    """
+    F_local = np.matmul(K_local, np.matmul(T, U_elements))
+    F_local = np.moveaxis(F_local, 2, 0).reshape(F_local.shape[2], len(F_local), 2, 6)
+    F_local[:, :, 1] *= -1
+
+    return F_local
+
+
+def element_stresses(forces: np.ndarray, A: np.ndarray, Sy: np.ndarray, Sz: np.ndarray) -> np.ndarray:
+    """
+    Calculate axial, bending and von Mises stresses from element end forces.
+
+    ``forces`` is (..., n_elem, n_positions, 6) ordered [N, Vy, Vz, T, My, Mz];
+    the result has the same leading shape with the last axis
+    [axial, bending_y, bending_z, von_mises].
+    """
+    axial = forces[..., 0] / A[:, None]
+    bending_y = forces[..., 4] / Sy[:, None]
+    bending_z = forces[..., 5] / Sz[:, None]
+    von_mises = np.sqrt(axial**2 + 3 * (bending_y**2 + bending_z**2))
+
+    return np.stack([axial, bending_y, bending_z, von_mises], axis=-1)
@@ -0,0 +1,313 @@
+import logging
+import os
+import time
+import numpy as np
+import scipy.sparse as sp
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, Tuple
+from scipy.linalg import cho_factor, cho_solve
+from scipy.sparse.linalg import splu
+
+from app.models.analysis import LinearSolverType
+
+logger = logging.getLogger(__name__)
+
+# Selection heuristics
+DENSE_MAX_DOF = 3000  # Largest system sent to dense LAPACK Cholesky
+MEMORY_FRACTION = 0.5  # Share of available memory a factorization may use
+DEFAULT_TOLERANCE = 1e-8
+DEFAULT_MAX_ITERATIONS = 10000
+INDEFINITE_PIVOT_THRESHOLD = 0.01  # Partial pivoting threshold for symmetric indefinite systems
+
+
+class Factorization(ABC):
+    """
+    A prepared linear system that can be solved for one or more right-hand sides.
+    """
+
+    @abstractmethod
+    def solve(self, F: np.ndarray) -> np.ndarray:
+        """
+        Solve for the right-hand side vector or (n, n_rhs) matrix F.
+        """
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Approximate memory held by the factorization.
+        """
+        return 0
+
+
+class LinearSolver(ABC):
+    """
+    Base class for linear solver backends.
+    """
+    name = "base"
+
+    @abstractmethod
+    def factorize(self, K: sp.spmatrix) -> Factorization:
+        """
+        Prepare K for solves.
+        """
+
+
+class _DenseCholeskyFactorization(Factorization):
+    def __init__(self, factor):
+        self.factor = factor
+
+    def solve(self, F: np.ndarray) -> np.ndarray:
+        return cho_solve(self.factor, F)
+
+    @property
+    def nbytes(self) -> int:
+        return self.factor[0].nbytes
+
+
+class DenseCholeskySolver(LinearSolver):
+    """
+    Dense LAPACK Cholesky factorization, fastest for small models.
+    """
+    name = LinearSolverType.DENSE_CHOLESKY.value
+
+    def factorize(self, K: sp.spmatrix) -> Factorization:
+        dense = K.toarray() if sp.issparse(K) else np.asarray(K)
+        return _DenseCholeskyFactorization(cho_factor(dense, lower=True, check_finite=False))
+
+
+class _SparseLUFactorization(Factorization):
+    def __init__(self, lu):
+        self.lu = lu
+
+    def solve(self, F: np.ndarray) -> np.ndarray:
+        return self.lu.solve(np.asarray(F, dtype=float))
+
+    @property
+    def nbytes(self) -> int:
+        # Values and row indices of L and U
+        return 12 * (self.lu.L.nnz + self.lu.U.nnz)
+
+
+class SparseLUSolver(LinearSolver):
+    """
+    SciPy SuperLU sparse direct factorization.
+
+    With ``pivot_threshold`` 0 the pivots are taken on the diagonal, which is
+    stable for symmetric positive definite K; a positive threshold allows
+    off-diagonal pivots for symmetric indefinite K (e.g. tangent stiffness
+    past a limit point).
+    """
+    name = LinearSolverType.SPARSE_LU.value
+
+    def __init__(self, pivot_threshold: float = 0.0):
+        self.pivot_threshold = pivot_threshold
+
+    def factorize(self, K: sp.spmatrix) -> Factorization:
+        # K is symmetric: order on the structure of K + K^T and prefer diagonal pivots
+        # so that the fill-reducing ordering is kept
+        return _SparseLUFactorization(splu(
+            sp.csc_matrix(K), permc_spec="MMD_AT_PLUS_A", diag_pivot_thresh=self.pivot_threshold,
+            options={"SymmetricMode": True}
+        ))
+
+
+def preconditioned_conjugate_gradient(
+    apply_A: Callable[[np.ndarray], np.ndarray],
+    b: np.ndarray,
+    apply_M: Callable[[np.ndarray], np.ndarray],
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+) -> Tuple[np.ndarray, int, bool]:
+    """
+    Solve A x = b for symmetric positive definite A with preconditioned conjugate gradients.
+
+    Returns the solution, the number of iterations and whether the relative
+    residual dropped below the tolerance.
+    """
+    x = np.zeros_like(b, dtype=float)
+    b_norm = np.linalg.norm(b)
+    if b_norm == 0.0:
+        return x, 0, True
+
+    r = b.astype(float)
+    z = apply_M(r)
+    p = z.copy()
+    rz = r @ z
+
+    for iteration in range(1, max_iterations + 1):
+        Ap = apply_A(p)
+        alpha = rz / (p @ Ap)
+        x += alpha * p
+        r -= alpha * Ap
+
+        if np.linalg.norm(r) <= tolerance * b_norm:
+            return x, iteration, True
+
+        z = apply_M(r)
+        rz_new = r @ z
+        p = z + (rz_new / rz) * p
+        rz = rz_new
+
+    return x, max_iterations, False
+
+
+class IterativeFactorization(Factorization):
+    """
+    Preconditioned CG applied through callables, for assembled or matrix-free operators.
+
+    ``iterations`` holds the CG iteration counts per right-hand side of the last solve.
+    """
+
+    def __init__(self, apply_A, apply_M, tolerance: float, max_iterations: int):
+        self.apply_A = apply_A
+        self.apply_M = apply_M
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.iterations = []
+
+    def solve(self, F: np.ndarray) -> np.ndarray:
+        F = np.asarray(F, dtype=float)
+        columns = F.reshape(F.shape[0], -1)
+        U = np.zeros_like(columns)
+        self.iterations = []
+
+        # Solve each right-hand side independently
+        for j in range(columns.shape[1]):
+            U[:, j], iterations, converged = preconditioned_conjugate_gradient(
+                self.apply_A, columns[:, j], self.apply_M, self.tolerance, self.max_iterations
+            )
+            self.iterations.append(iterations)
+            if not converged:
+                raise RuntimeError(
+                    f"Conjugate gradient did not converge in {self.max_iterations} iterations"
+                )
+
+        return U.reshape(F.shape)
+
+
+class IterativeSolver(LinearSolver):
+    """
+    Jacobi-preconditioned conjugate gradient solver for very large assembled systems.
+    """
+    name = LinearSolverType.ITERATIVE.value
+
+    def __init__(self, tolerance: float = DEFAULT_TOLERANCE, max_iterations: int = DEFAULT_MAX_ITERATIONS):
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+
+    def factorize(self, K: sp.spmatrix) -> Factorization:
+        K = sp.csr_matrix(K)
+        inverse_diagonal = 1.0 / K.diagonal()
+
+        return IterativeFactorization(
+            lambda v: K @ v, lambda r: inverse_diagonal * r, self.tolerance, self.max_iterations
+        )
+
+
+def available_memory() -> Optional[int]:
+    """
+    Return the available physical memory in bytes, or None if it cannot be determined.
+    """
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_AVPHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def estimate_factor_nonzeros(K: sp.spmatrix) -> int:
+    """
+    Estimate the fill of a sparse factorization from the envelope (profile) of K.
+
+    A banded/profile ordering bounds the fill of the factor by the envelope, so
+    this is a cheap upper estimate that does not require a symbolic factorization.
+    """
+    K = sp.csr_matrix(K)
+    n = K.shape[0]
+    if n == 0:
+        return 0
+
+    rows = np.repeat(np.arange(n), np.diff(K.indptr))
+    first_column = np.arange(n)
+    np.minimum.at(first_column, rows, K.indices)
+
+    return int((np.arange(n) - first_column).sum() + n)
+
+
+def select_linear_solver(
+    K: sp.spmatrix,
+    override: Optional[LinearSolverType] = None,
+    memory: Optional[int] = None,
+    tolerance: Optional[float] = None,
+    max_iterations: Optional[int] = None,
+    indefinite: bool = False,
+) -> LinearSolver:
+    """
+    Choose a linear solver backend from the DOF count, estimated fill and available memory.
+
+    With ``indefinite`` K may not be positive definite, so Cholesky and
+    conjugate gradients are ruled out and sparse LU with pivoting is used
+    whatever the override.
+    """
+    if indefinite:
+        if override and override not in (LinearSolverType.AUTO, LinearSolverType.SPARSE_LU):
+            logger.info(
+                f"Using {LinearSolverType.SPARSE_LU.value} instead of {LinearSolverType(override).value} "
+                f"for an indefinite system"
+            )
+        return SparseLUSolver(INDEFINITE_PIVOT_THRESHOLD)
+
+    iterative = IterativeSolver(
+        tolerance or DEFAULT_TOLERANCE, max_iterations or DEFAULT_MAX_ITERATIONS
+    )
+
+    if override and override != LinearSolverType.AUTO:
+        override = LinearSolverType(override)
+        # An assembled matrix cannot use the matrix-free operator; use assembled PCG instead
+        if override in (LinearSolverType.ITERATIVE, LinearSolverType.MATRIX_FREE_PCG):
+            return iterative
+        # Domain decomposition applies to the whole model; single matrices use automatic selection
+        if override != LinearSolverType.DOMAIN_DECOMPOSITION:
+            return _BACKENDS[override]()
+
+    n = K.shape[0]
+    memory = memory if memory is not None else available_memory()
+    budget = memory * MEMORY_FRACTION if memory else np.inf
+
+    # Small models: dense Cholesky if the full matrix fits comfortably
+    if n <= DENSE_MAX_DOF and 8 * n * n < budget:
+        return DenseCholeskySolver()
+
+    # Sparse direct if the estimated L and U factors (values + indices) fit
+    if 2 * 12 * estimate_factor_nonzeros(K) < budget:
+        return SparseLUSolver()
+
+    return iterative
+
+
+def factorize(
+    K: sp.spmatrix,
+    override: Optional[LinearSolverType] = None,
+    tolerance: Optional[float] = None,
+    max_iterations: Optional[int] = None,
+    indefinite: bool = False,
+) -> Tuple[Factorization, LinearSolver, float]:
+    """
+    Select a backend and factorize K, returning the factorization, the backend and the elapsed time.
+    """
+    backend = select_linear_solver(
+        K, override, tolerance=tolerance, max_iterations=max_iterations, indefinite=indefinite
+    )
+
+    start = time.perf_counter()
+    factorization = backend.factorize(K)
+    elapsed = time.perf_counter() - start
+
+    logger.info(f"Factorized {K.shape[0]} DOFs with {backend.name} in {elapsed:.3f} s")
+
+    return factorization, backend, elapsed
+
+
+_BACKENDS = {
+    LinearSolverType.DENSE_CHOLESKY: DenseCholeskySolver,
+    LinearSolverType.SPARSE_LU: SparseLUSolver,
+}
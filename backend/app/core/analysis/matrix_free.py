@@ -0,0 +1,122 @@
+import numpy as np
+from typing import Callable
+from scipy.sparse.linalg import LinearOperator
+
+
+class ElementOperator:
+    """
+    Matrix-free global stiffness operator restricted to the free DOFs.
+
+    K @ v is applied element by element from cached (n_elem, 12, 12) global
+    element matrices, so memory stays proportional to the number of elements
+    and the global matrix is never formed.
+    """
+
+    def __init__(
+        self,
+        element_matrices: np.ndarray,
+        element_dofs: np.ndarray,
+        free_mask: np.ndarray,
+        dof_per_node: int = 6,
+    ):
+        self.element_matrices = np.asarray(element_matrices, dtype=float)
+        self.element_dofs = np.asarray(element_dofs, dtype=np.int64)
+        self.free_mask = np.asarray(free_mask, dtype=bool)
+        self.dof_per_node = dof_per_node
+
+        self.total_dof = len(self.free_mask)
+        self.free_dofs = np.flatnonzero(self.free_mask)
+        self.num_free = len(self.free_dofs)
+
+    def _expand(self, v: np.ndarray) -> np.ndarray:
+        full = np.zeros(self.total_dof)
+        full[self.free_dofs] = v
+        return full
+
+    def _product(self, v: np.ndarray) -> np.ndarray:
+        u_elements = self._expand(v)[self.element_dofs]
+        f_elements = np.einsum("nij,nj->ni", self.element_matrices, u_elements)
+        return np.bincount(
+            self.element_dofs.ravel(), weights=f_elements.ravel(), minlength=self.total_dof
+        )
+
+    def matvec(self, v: np.ndarray) -> np.ndarray:
+        """
+        Compute K_ff @ v.
+        """
+        return self._product(v)[self.free_dofs]
+
+    def coupling_operator(self) -> LinearOperator:
+        """
+        K_cf as a linear operator, for recovering support reactions from free displacements.
+        """
+        constrained_dofs = np.flatnonzero(~self.free_mask)
+
+        return LinearOperator(
+            (len(constrained_dofs), self.num_free),
+            matvec=lambda v: self._product(np.ravel(v))[constrained_dofs],
+            dtype=float
+        )
+
+    def diagonal(self) -> np.ndarray:
+        """
+        Diagonal of K_ff, accumulated from the element diagonals.
+        """
+        element_diagonals = np.diagonal(self.element_matrices, axis1=1, axis2=2)
+        diagonal = np.bincount(
+            self.element_dofs.ravel(), weights=element_diagonals.ravel(), minlength=self.total_dof
+        )
+        return diagonal[self.free_dofs]
+
+    def nodal_blocks(self) -> np.ndarray:
+        """
+        The (n_nodes, dof_per_node, dof_per_node) nodal diagonal blocks of K.
+
+        Constrained DOFs are replaced by identity rows and columns so that every
+        block stays invertible.
+        """
+        n = self.dof_per_node
+        num_nodes = self.total_dof // n
+        blocks = np.zeros((num_nodes, n, n))
+
+        # Each two-node element contributes its start/start and end/end blocks
+        nodes = self.element_dofs[:, ::n] // n
+        np.add.at(blocks, nodes[:, 0], self.element_matrices[:, :n, :n])
+        np.add.at(blocks, nodes[:, 1], self.element_matrices[:, n:, n:])
+
+        constrained = ~self.free_mask.reshape(num_nodes, n)
+        blocks[np.broadcast_to(constrained[:, :, None], blocks.shape)] = 0.0
+        blocks[np.broadcast_to(constrained[:, None, :], blocks.shape)] = 0.0
+
+        # Unit diagonal for constrained DOFs and for DOFs without stiffness
+        index = np.arange(n)
+        diagonal = blocks[:, index, index]
+        diagonal[constrained | (diagonal == 0.0)] = 1.0
+        blocks[:, index, index] = diagonal
+
+        return blocks
+
+
+def jacobi_preconditioner(operator: ElementOperator) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Point Jacobi preconditioner: r -> r / diag(K_ff).
+    """
+    diagonal = operator.diagonal()
+    inverse_diagonal = 1.0 / np.where(diagonal != 0.0, diagonal, 1.0)
+
+    return lambda r: inverse_diagonal * r
+
+
+def block_jacobi_preconditioner(operator: ElementOperator) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Block Jacobi preconditioner using the inverted 6x6 nodal diagonal blocks of K.
+    """
+    n = operator.dof_per_node
+    inverse_blocks = np.linalg.inv(operator.nodal_blocks())
+
+    def apply(r: np.ndarray) -> np.ndarray:
+        full = operator._expand(r).reshape(-1, n)
+        z = np.einsum("nij,nj->ni", inverse_blocks, full).ravel()
+        return z[operator.free_dofs]
+
+    return apply
@@ -0,0 +1,59 @@
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+
+MODE_SHAPE_DTYPE = np.float32
+MODE_SHAPE_COLUMNS = 6  # dx, dy, dz, rx, ry, rz
+
+
+def encode_mode_shape(mode_shape: np.ndarray, normalize: bool = True) -> bytes:
+    """
+    Pack a (n_nodes, 6) mode shape as float32 bytes, scaled to a largest component of 1 if ``normalize``.
+    """
+    mode_shape = np.asarray(mode_shape, dtype=float).reshape(-1, MODE_SHAPE_COLUMNS)
+    scale = np.abs(mode_shape).max() if normalize else 0
+    if scale > 0:
+        mode_shape = mode_shape / scale
+
+    return mode_shape.astype(MODE_SHAPE_DTYPE).tobytes()
+
+
+def decode_mode_shape(data: Optional[bytes]) -> Optional[np.ndarray]:
+    """
+    Unpack float32 mode shape bytes into a (n_nodes, 6) array.
+    """
+    if data is None:
+        return None
+
+    return np.frombuffer(data, dtype=MODE_SHAPE_DTYPE).reshape(-1, MODE_SHAPE_COLUMNS)
+
+
+def mode_shape_by_node(data: Optional[bytes], node_ids: Sequence[str]) -> Optional[Dict[str, List[float]]]:
+    """
+    Unpack a mode shape into {node_id: [dx, dy, dz, rx, ry, rz]} using the analysis's node order.
+    """
+    mode_shape = decode_mode_shape(data)
+    if mode_shape is None:
+        return None
+
+    return {node_id: row.tolist() for node_id, row in zip(node_ids, mode_shape.astype(float))}
+
+
+def mode_shape_rows(
+    data: Optional[bytes], node_ids: Sequence[str], selected_node_ids: Optional[Sequence[str]] = None
+) -> Optional[Tuple[List[str], np.ndarray]]:
+    """
+    Pick the (n_selected, 6) rows of the selected nodes (all nodes if None) from a packed mode shape.
+
+    Reads the bytes in place and copies only the selected rows; unknown node IDs are skipped.
+    """
+    mode_shape = decode_mode_shape(data)
+    if mode_shape is None:
+        return None
+
+    if selected_node_ids is None:
+        return list(node_ids), mode_shape
+
+    index = {node_id: i for i, node_id in enumerate(node_ids)}
+    found = [node_id for node_id in selected_node_ids if node_id in index]
+
+    return found, mode_shape[[index[node_id] for node_id in found]]
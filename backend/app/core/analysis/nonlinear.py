@@ -0,0 +1,342 @@
+import logging
+import time
+import numpy as np
+import scipy.sparse as sp
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.models.analysis import NonlinearSolverType
+from app.core.analysis.linear_solvers import Factorization
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOAD_STEPS = 10
+DEFAULT_NONLINEAR_TOLERANCE = 1e-6  # Residual norm relative to the applied load
+DEFAULT_NONLINEAR_MAX_ITERATIONS = 25  # Per load step
+DEFAULT_REFACTORIZE_INTERVAL = 10  # Iterations between tangent factorizations for modified Newton and BFGS
+MAX_STEP_CUTS = 8  # Halvings of one load step before the analysis stops
+STEP_GROWTH_ITERATIONS = 4  # A step converging in at most this many iterations lets the next one double
+LINE_SEARCH_TOLERANCE = 0.5  # Accept a step length once |d . R| drops below this fraction of its start value
+LINE_SEARCH_MAX_ITERATIONS = 5
+FACTORIZATION_ERRORS = (np.linalg.LinAlgError, RuntimeError)  # Singular tangent or failed iterative solve
+
+
+class TangentOperator:
+    """
+    Solves with the tangent stiffness, refactorizing as the strategy requires.
+
+    Full Newton refactorizes every iteration. Modified Newton and BFGS reuse a
+    factorization for ``refactorize_interval`` iterations (and after a step cut);
+    BFGS additionally applies the rank-two updates of the iterations since the
+    last factorization (two-loop recursion with the factorized tangent as the
+    initial inverse).
+    """
+
+    def __init__(
+        self,
+        tangent: Callable[[np.ndarray], sp.csr_matrix],
+        factorize_matrix: Callable[[sp.csr_matrix], Factorization],
+        method: NonlinearSolverType,
+        refactorize_interval: int = DEFAULT_REFACTORIZE_INTERVAL,
+    ):
+        self.tangent = tangent
+        self.factorize_matrix = factorize_matrix
+        self.method = method
+        self.refactorize_interval = max(refactorize_interval, 1)
+
+        self.factorization: Optional[Factorization] = None
+        self.iterations_since_factorization = 0
+        self.updates: List[Tuple[np.ndarray, np.ndarray]] = []  # BFGS (displacement, internal force) changes
+
+        self.factorizations = 0
+        self.factorization_time = 0.0
+
+    def reset(self) -> None:
+        """
+        Force a refactorization at the next update.
+        """
+        self.factorization = None
+
+    def update(self, U: np.ndarray) -> None:
+        """
+        Prepare to solve at displacements U, refactorizing if the strategy asks for it.
+        """
+        if (
+            self.factorization is None
+            or self.method == NonlinearSolverType.NEWTON_RAPHSON
+            or self.iterations_since_factorization >= self.refactorize_interval
+        ):
+            start = time.perf_counter()
+            self.factorization = self.factorize_matrix(self.tangent(U))
+            self.factorization_time += time.perf_counter() - start
+            self.factorizations += 1
+            self.iterations_since_factorization = 0
+            self.updates.clear()
+
+        self.iterations_since_factorization += 1
+
+    def add_update(self, s: np.ndarray, y: np.ndarray) -> None:
+        """
+        Record the displacement change s and internal force change y of an iteration (BFGS only).
+        """
+        if self.method == NonlinearSolverType.BFGS and s @ y > 0:
+            self.updates.append((s, y))
+
+    def solve(self, R: np.ndarray) -> np.ndarray:
+        q = np.array(R, dtype=float)
+        alphas = []
+        for s, y in reversed(self.updates):
+            alpha = (s @ q) / (y @ s)
+            q -= alpha * y
+            alphas.append(alpha)
+
+        r = self.factorization.solve(q)
+        for (s, y), alpha in zip(self.updates, reversed(alphas)):
+            r += s * (alpha - (y @ r) / (y @ s))
+
+        return r
+
+
+def line_search(
+    internal_force: Callable[[np.ndarray], np.ndarray], U: np.ndarray, d: np.ndarray, F: np.ndarray, R: np.ndarray
+) -> Tuple[float, np.ndarray]:
+    """
+    Find a step length eta along d where the residual is nearly orthogonal to d (secant method).
+
+    Returns eta and the internal force at U + eta d.
+    """
+    s0 = d @ R
+    eta_previous, s_previous = 0.0, s0
+    eta = 1.0
+    f = internal_force(U + d)
+    s = d @ (F - f)
+
+    for _ in range(LINE_SEARCH_MAX_ITERATIONS):
+        if abs(s) <= LINE_SEARCH_TOLERANCE * abs(s0) or s == s_previous:
+            break
+
+        eta_next = float(np.clip(eta - s * (eta - eta_previous) / (s - s_previous), 0.1, 2.0))
+        eta_previous, s_previous = eta, s
+        eta = eta_next
+        f = internal_force(U + eta * d)
+        s = d @ (F - f)
+
+    return eta, f
+
+
+def _converged(R: np.ndarray, F: np.ndarray, tolerance: float) -> bool:
+    return bool(np.linalg.norm(R) <= tolerance * max(np.linalg.norm(F), 1e-300))
+
+
+def _load_control_step(
+    internal_force: Callable[[np.ndarray], np.ndarray],
+    operator: TangentOperator,
+    F: np.ndarray,
+    U: np.ndarray,
+    f: np.ndarray,
+    load_factor: float,
+    use_line_search: bool,
+    tolerance: float,
+    max_iterations: int,
+) -> Optional[Tuple[np.ndarray, np.ndarray, float, int]]:
+    """
+    Iterate to equilibrium at a fixed load factor; returns (U, f, load factor, iterations) or None.
+    """
+    F_step = load_factor * F
+
+    for iteration in range(max_iterations + 1):
+        R = F_step - f
+        if not np.all(np.isfinite(R)):
+            return None
+        if _converged(R, F_step, tolerance):
+            return U, f, load_factor, iteration
+        if iteration == max_iterations:
+            return None
+
+        try:
+            operator.update(U)
+            d = operator.solve(R)
+        except FACTORIZATION_ERRORS as e:
+            logger.debug(f"Tangent solve failed at load factor {load_factor:.4f}: {e}")
+            return None
+        if use_line_search:
+            eta, f_next = line_search(internal_force, U, d, F_step, R)
+            d = eta * d
+        else:
+            f_next = internal_force(U + d)
+
+        operator.add_update(d, f_next - f)
+        U, f = U + d, f_next
+
+    return None
+
+
+def _arc_length_step(
+    internal_force: Callable[[np.ndarray], np.ndarray],
+    operator: TangentOperator,
+    F: np.ndarray,
+    U: np.ndarray,
+    f: np.ndarray,
+    load_factor: float,
+    arc_length: float,
+    previous_increment: np.ndarray,
+    tolerance: float,
+    max_iterations: int,
+) -> Optional[Tuple[np.ndarray, np.ndarray, float, int]]:
+    """
+    Iterate along a cylindrical arc ||dU|| = arc_length (Crisfield); returns (U, f, load factor, iterations) or None.
+
+    Returns the start state unchanged with 0 iterations if the predictor would pass
+    the full load, so that the caller can finish with load control.
+    """
+    # 1. Predictor along the tangent, in the direction of the previous increment
+    try:
+        operator.update(U)
+        U_F = operator.solve(F)
+    except FACTORIZATION_ERRORS as e:
+        logger.debug(f"Tangent solve failed at load factor {load_factor:.4f}: {e}")
+        return None
+    sign = 1.0 if previous_increment @ U_F >= 0 else -1.0
+    dlambda = sign * arc_length / np.linalg.norm(U_F)
+    if load_factor + dlambda >= 1.0:
+        return U, f, load_factor, 0
+    dU = dlambda * U_F
+    f_trial = internal_force(U + dU)
+
+    # 2. Corrector on the arc
+    for iteration in range(1, max_iterations + 1):
+        R = (load_factor + dlambda) * F - f_trial
+        if not np.all(np.isfinite(R)):
+            return None
+        if _converged(R, (load_factor + dlambda) * F, tolerance):
+            return U + dU, f_trial, load_factor + dlambda, iteration
+
+        try:
+            operator.update(U + dU)
+            U_R, U_F = operator.solve(R), operator.solve(F)
+        except FACTORIZATION_ERRORS as e:
+            logger.debug(f"Tangent solve failed at load factor {load_factor + dlambda:.4f}: {e}")
+            return None
+
+        a = U_F @ U_F
+        b = 2 * U_F @ (dU + U_R)
+        c = (dU + U_R) @ (dU + U_R) - arc_length**2
+        discriminant = b**2 - 4 * a * c
+        if discriminant < 0:
+            return None
+
+        # Root keeping the increment closest to its current direction
+        roots = (-b + np.array([1.0, -1.0]) * np.sqrt(discriminant)) / (2 * a)
+        root = max(roots, key=lambda r: (dU + U_R + r * U_F) @ dU)
+
+        correction = U_R + root * U_F
+        f_next = internal_force(U + dU + correction)
+        operator.add_update(correction, f_next - f_trial)
+        dU, dlambda, f_trial = dU + correction, dlambda + root, f_next
+
+    return None
+
+
+def solve_nonlinear(
+    internal_force: Callable[[np.ndarray], np.ndarray],
+    tangent: Callable[[np.ndarray], sp.csr_matrix],
+    factorize_matrix: Callable[[sp.csr_matrix], Factorization],
+    F: np.ndarray,
+    method: NonlinearSolverType = NonlinearSolverType.NEWTON_RAPHSON,
+    load_steps: int = DEFAULT_LOAD_STEPS,
+    refactorize_interval: int = DEFAULT_REFACTORIZE_INTERVAL,
+    use_line_search: bool = False,
+    use_arc_length: bool = False,
+    tolerance: float = DEFAULT_NONLINEAR_TOLERANCE,
+    max_iterations: int = DEFAULT_NONLINEAR_MAX_ITERATIONS,
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Solve f_int(U) = F incrementally, from zero to the full load F.
+
+    Load steps start at 1 / ``load_steps`` of F. With ``use_arc_length`` the
+    first step sets the arc length and later steps follow the equilibrium
+    path by arc-length control (through limit points) until the next step
+    would pass the full load, which is then reached by load control. Line
+    search applies to load-controlled steps. A step that does not converge
+    (or whose tangent cannot be factorized) is halved and retried from the
+    last converged state, up to ``MAX_STEP_CUTS`` times per step; after a
+    step that converges quickly the step size doubles again, up to its
+    initial size. Returns the displacements and per-step statistics (load
+    factor, iterations, factorizations and wall time).
+    """
+    operator = TangentOperator(tangent, factorize_matrix, method, refactorize_interval)
+
+    U = np.zeros(len(F))
+    f = internal_force(U)
+    load_factor = 0.0
+    initial_increment = increment = 1.0 / load_steps
+    initial_arc_length = arc_length = None
+    previous_increment = np.zeros(len(F))
+
+    steps = []
+    cuts = 0  # Of the current step
+    total_cuts = 0
+    converged = True
+
+    while load_factor < 1.0 - 1e-12:
+        start = time.perf_counter()
+        factorizations = operator.factorizations
+
+        result = None
+        if use_arc_length and arc_length is not None:
+            result = _arc_length_step(
+                internal_force, operator, F, U, f, load_factor, arc_length, previous_increment,
+                tolerance, max_iterations
+            )
+        if result is None or result[3] == 0:
+            result = _load_control_step(
+                internal_force, operator, F, U, f, min(load_factor + increment, 1.0), use_line_search,
+                tolerance, max_iterations
+            )
+
+        if result is None:
+            cuts += 1
+            total_cuts += 1
+            if cuts > MAX_STEP_CUTS:
+                converged = False
+                logger.warning(f"Nonlinear analysis stopped at load factor {load_factor:.4f}: step did not converge")
+                break
+
+            increment /= 2
+            arc_length = arc_length / 2 if arc_length is not None else None
+            operator.reset()
+            continue
+
+        U_next, f, load_factor, iterations = result
+        previous_increment = U_next - U
+        U = U_next
+        if use_arc_length and arc_length is None:
+            initial_arc_length = arc_length = float(np.linalg.norm(previous_increment))
+
+        # Grow the step back after an easy one
+        cuts = 0
+        if iterations <= STEP_GROWTH_ITERATIONS:
+            increment = min(2 * increment, initial_increment)
+            if arc_length is not None:
+                arc_length = min(2 * arc_length, initial_arc_length)
+
+        steps.append({
+            "load_factor": float(load_factor),
+            "iterations": iterations,
+            "factorizations": operator.factorizations - factorizations,
+            "time": time.perf_counter() - start,
+        })
+
+    logger.info(
+        f"Nonlinear {method.value}: {len(steps)} steps, {sum(step['iterations'] for step in steps)} iterations, "
+        f"{operator.factorizations} factorizations in {operator.factorization_time:.3f} s"
+    )
+
+    return U, {
+        "converged": converged,
+        "load_factor": float(load_factor),
+        "steps": steps,
+        "step_cuts": total_cuts,
+        "iterations": sum(step["iterations"] for step in steps),
+        "factorizations": operator.factorizations,
+        "factorization_time": operator.factorization_time,
+    }
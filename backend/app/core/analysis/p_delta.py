@@ -0,0 +1,132 @@
+import logging
+import numpy as np
+import scipy.sparse as sp
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.models.analysis import AccelerationType
+from app.core.analysis.linear_solvers import Factorization
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_P_DELTA_TOLERANCE = 1e-6  # Relative displacement change between iterations
+DEFAULT_P_DELTA_MAX_ITERATIONS = 30
+ANDERSON_DEPTH = 5  # Previous iterates used by Anderson acceleration
+
+
+def aitken_relaxation(omega: float, residual: np.ndarray, previous_residual: np.ndarray) -> float:
+    """
+    Update the Aitken (Irons-Tuck) relaxation factor of a vector fixed-point iteration.
+    """
+    difference = residual - previous_residual
+    denominator = float(difference @ difference)
+    if denominator == 0.0:
+        return omega
+
+    return -omega * float(previous_residual @ difference) / denominator
+
+
+class AndersonMixer:
+    """
+    Anderson acceleration of a fixed-point iteration U <- G(U).
+
+    Keeps the differences of the last ``depth`` residuals r = G(U) - U and
+    images G(U), and returns the combination of images whose residuals best
+    cancel in the least-squares sense.
+    """
+
+    def __init__(self, depth: int = ANDERSON_DEPTH):
+        self.depth = depth
+        self.residual_differences: List[np.ndarray] = []
+        self.image_differences: List[np.ndarray] = []
+        self.previous: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def update(self, U: np.ndarray, residual: np.ndarray) -> np.ndarray:
+        image = U + residual
+
+        if self.previous is not None:
+            self.residual_differences.append(residual - self.previous[0])
+            self.image_differences.append(image - self.previous[1])
+            del self.residual_differences[:-self.depth], self.image_differences[:-self.depth]
+        self.previous = (residual, image)
+
+        if not self.residual_differences:
+            return image
+
+        gamma = np.linalg.lstsq(np.stack(self.residual_differences, axis=1), residual, rcond=None)[0]
+        return image - np.stack(self.image_differences, axis=1) @ gamma
+
+
+def solve_p_delta(
+    K: sp.csr_matrix,
+    F: np.ndarray,
+    U0: np.ndarray,
+    geometric_stiffness: Callable[[np.ndarray], sp.csr_matrix],
+    factorize_matrix: Callable[[sp.csr_matrix], Factorization],
+    constant_kg: bool = False,
+    acceleration: AccelerationType = AccelerationType.ANDERSON,
+    tolerance: float = DEFAULT_P_DELTA_TOLERANCE,
+    max_iterations: int = DEFAULT_P_DELTA_MAX_ITERATIONS,
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Iterate (K + Kg(U)) U = F for one load vector, starting from the linear solution U0.
+
+    ``geometric_stiffness`` returns the reduced geometric stiffness matrix for
+    the axial forces of a displacement vector. By default K + Kg is
+    refactorized every iteration; with ``constant_kg`` it is factorized once
+    with Kg from the linear solution and later iterations only correct the
+    residual F - (K + Kg(U)) U. The displacement updates are accelerated by
+    Aitken relaxation or Anderson mixing. Returns the displacements and the
+    iteration history.
+    """
+    U = U0
+    Kg = geometric_stiffness(U)
+    factorization = factorize_matrix(K + Kg)
+    factorizations = 1
+
+    history = []
+    converged = False
+    omega, previous_residual = 1.0, None
+    mixer = AndersonMixer()
+
+    for iteration in range(1, max_iterations + 1):
+        # 1. Fixed-point residual with the current (or the constant) tangent
+        if constant_kg:
+            residual = factorization.solve(F - (K + Kg) @ U)
+        else:
+            residual = factorization.solve(F) - U
+
+        # 2. Accelerated displacement update
+        if acceleration == AccelerationType.ANDERSON:
+            U_next = mixer.update(U, residual)
+        else:
+            if acceleration == AccelerationType.AITKEN and previous_residual is not None:
+                omega = aitken_relaxation(omega, residual, previous_residual)
+            previous_residual = residual
+            U_next = U + omega * residual
+
+        change = float(np.linalg.norm(U_next - U) / max(np.linalg.norm(U_next), 1e-300))
+        history.append(change)
+        U = U_next
+
+        if change < tolerance:
+            converged = True
+            break
+
+        # 3. Geometric stiffness from the updated axial forces
+        Kg = geometric_stiffness(U)
+        if not constant_kg:
+            factorization = factorize_matrix(K + Kg)
+            factorizations += 1
+
+    if not converged:
+        logger.warning(
+            f"P-Delta iteration did not converge in {max_iterations} iterations "
+            f"(last change {history[-1]:.2e})"
+        )
+
+    return U, {
+        "iterations": len(history),
+        "converged": converged,
+        "factorizations": factorizations,
+        "history": history,
+    }
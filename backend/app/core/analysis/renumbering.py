@@ -0,0 +1,70 @@
+import numpy as np
+import scipy.sparse as sp
+from typing import Tuple
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+
+def node_adjacency_matrix(element_nodes: np.ndarray, num_nodes: int) -> sp.csr_matrix:
+    """
+    Build the symmetric node adjacency graph of two-node elements.
+    """
+    element_nodes = np.asarray(element_nodes, dtype=np.int64).reshape(-1, 2)
+    rows = np.concatenate([element_nodes[:, 0], element_nodes[:, 1]])
+    cols = np.concatenate([element_nodes[:, 1], element_nodes[:, 0]])
+
+    adjacency = sp.coo_matrix(
+        (np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(num_nodes, num_nodes)
+    ).tocsr()
+    adjacency.data[:] = 1
+
+    return adjacency
+
+
+def reverse_cuthill_mckee_order(element_nodes: np.ndarray, num_nodes: int) -> np.ndarray:
+    """
+    Compute a bandwidth-reducing node order.
+
+    Returns ``order`` such that ``order[k]`` is the original index of the node
+    placed at position ``k``.
+    """
+    adjacency = node_adjacency_matrix(element_nodes, num_nodes)
+
+    return np.asarray(reverse_cuthill_mckee(adjacency, symmetric_mode=True), dtype=np.int64)
+
+
+def inverse_permutation(order: np.ndarray) -> np.ndarray:
+    """
+    Invert a permutation: ``position[order[k]] == k``.
+    """
+    position = np.empty_like(order)
+    position[order] = np.arange(len(order))
+
+    return position
+
+
+def bandwidth_and_profile(
+    element_nodes: np.ndarray, node_position: np.ndarray, dof_per_node: int = 6
+) -> Tuple[int, int]:
+    """
+    Compute the half-bandwidth and the profile (envelope size) of the DOF-level stiffness matrix.
+    """
+    num_nodes = len(node_position)
+    if num_nodes == 0:
+        return 0, 0
+
+    positions = np.asarray(node_position)[np.asarray(element_nodes, dtype=np.int64).reshape(-1, 2)]
+
+    # Leftmost coupled node for every node row (each node is coupled to itself)
+    first_column = np.arange(num_nodes)
+    np.minimum.at(first_column, positions[:, 0], positions[:, 1])
+    np.minimum.at(first_column, positions[:, 1], positions[:, 0])
+    node_distance = np.arange(num_nodes) - first_column
+
+    # Expand to DOFs: row (dof_per_node * p + a) starts at column dof_per_node * q
+    bandwidth = dof_per_node * int(node_distance.max()) + dof_per_node - 1
+    profile = int(
+        dof_per_node**2 * node_distance.sum()
+        + num_nodes * dof_per_node * (dof_per_node - 1) // 2
+    )
+
+    return bandwidth, profile
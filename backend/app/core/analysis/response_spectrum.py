@@ -0,0 +1,76 @@
+import numpy as np
+import scipy.sparse as sp
+from typing import Sequence, Tuple
+
+# Global translation directions and their DOF offset within a node
+SPECTRUM_DIRECTIONS = {"x": 0, "y": 1, "z": 2}
+
+
+def influence_vectors(dofs: np.ndarray, directions: Sequence[str], dof_per_node: int = 6) -> np.ndarray:
+    """
+    Build the (len(dofs), n_directions) rigid-body influence vectors of unit ground translations.
+    """
+    components = np.asarray(dofs) % dof_per_node
+
+    return np.stack(
+        [(components == SPECTRUM_DIRECTIONS[direction]).astype(float) for direction in directions], axis=1
+    )
+
+
+def participation_factors(
+    modes: np.ndarray, M: sp.spmatrix, influence: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute modal masses, participation factors and effective masses.
+
+    Returns the (n_modes,) generalized masses phi^T M phi and the
+    (n_modes, n_directions) participation factors phi^T M r / (phi^T M phi)
+    and effective masses (phi^T M r)^2 / (phi^T M phi).
+    """
+    M_modes = M @ modes
+    modal_masses = np.einsum("ij,ij->j", modes, M_modes)
+    excitation = M_modes.T @ influence
+
+    gamma = excitation / modal_masses[:, None]
+
+    return modal_masses, gamma, excitation * gamma
+
+
+def spectral_accelerations(periods: np.ndarray, spectrum: Sequence[Sequence[float]], scale: float = 1.0) -> np.ndarray:
+    """
+    Interpolate spectral accelerations at the modal periods from a [[period, acceleration], ...] spectrum.
+
+    Periods outside the spectrum take the value at the nearest end.
+    """
+    spectrum = np.asarray(spectrum, dtype=float)
+    spectrum = spectrum[np.argsort(spectrum[:, 0])]
+
+    return scale * np.interp(periods, spectrum[:, 0], spectrum[:, 1])
+
+
+def cqc_correlation(omega: np.ndarray, damping_ratio: float) -> np.ndarray:
+    """
+    Build the (n_modes, n_modes) CQC correlation matrix for equal modal damping (Der Kiureghian).
+
+    Modes with equal frequencies are fully correlated, also without damping.
+    """
+    r = omega[None, :] / omega[:, None]
+    zeta2 = damping_ratio**2
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rho = 8 * zeta2 * (1 + r) * r**1.5 / ((1 - r**2)**2 + 4 * zeta2 * r * (1 + r)**2)
+
+    return np.where(r == 1.0, 1.0, rho)
+
+
+def combine_modal_responses(responses: np.ndarray, correlation: np.ndarray) -> np.ndarray:
+    """
+    Combine (n_modes, ...) peak modal responses as sqrt(R^T rho R) for every response component.
+
+    The correlation is applied to all components at once as one matrix product;
+    an identity correlation gives SRSS.
+    """
+    R = responses.reshape(len(responses), -1)
+    combined = np.einsum("im,im->m", R, correlation @ R)
+
+    return np.sqrt(np.maximum(combined, 0.0)).reshape(responses.shape[1:])
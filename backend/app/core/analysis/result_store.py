@@ -0,0 +1,378 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.models.analysis import NodeResult, ElementResult
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.json"
+NODE_DISPLACEMENT_COLUMNS = ("dx", "dy", "dz", "rx", "ry", "rz")
+NODE_REACTION_COLUMNS = ("fx", "fy", "fz", "mx", "my", "mz")
+ELEMENT_FORCE_COLUMNS = (
+    "axial_force", "shear_force_y", "shear_force_z",
+    "torsional_moment", "bending_moment_y", "bending_moment_z"
+)
+ELEMENT_STRESS_COLUMNS = ("axial_stress", "bending_stress_y", "bending_stress_z", "von_mises_stress")
+
+# Array files of a result store
+NODE_DISPLACEMENTS = "node_displacements"  # (n_results, n_nodes, 6)
+NODE_REACTIONS = "node_reactions"  # (n_results, n_nodes, 6), NaN where no reaction
+ELEMENT_FORCES = "element_forces"  # (n_results, n_elements, n_positions, 6)
+ELEMENT_STRESSES = "element_stresses"  # (n_results, n_elements, n_positions, 4)
+NODE_DISPLACEMENT_HISTORY = "node_displacement_history"  # (n_steps + 1, n_history_nodes, 6)
+ELEMENT_FORCE_HISTORY = "element_force_history"  # (n_steps + 1, n_history_elements, n_positions, 6)
+
+ResultKey = Tuple[Optional[str], Optional[str]]  # (load_case_id, load_combination_id)
+
+
+def _result_keys(
+    num_results: int,
+    load_case_ids: Optional[Sequence[str]],
+    load_combination_ids: Optional[Sequence[str]]
+) -> List[ResultKey]:
+    return [
+        (
+            load_case_ids[i] if load_case_ids else None,
+            load_combination_ids[i] if load_combination_ids else None
+        )
+        for i in range(num_results)
+    ]
+
+
+class ResultStoreBuilder:
+    """
+    Collects an analysis's result arrays and saves them as a columnar result store.
+
+    A store is a directory holding one ``.npy`` file per result array plus an
+    ``index.json`` with the node and element ids (in solver order), the element
+    result positions and the load case/combination of every result row. Arrays
+    are stored uncompressed so that they can be memory-mapped for reads.
+
+    Time histories are appended to files as they are computed and moved into
+    the store on save, so they are never held in memory.
+    """
+
+    def __init__(self, node_ids: List[str], element_ids: List[str], positions: Sequence[float]):
+        self.node_ids = list(node_ids)
+        self.element_ids = list(element_ids)
+        self.positions = [float(p) for p in positions]
+
+        self.node_keys: List[ResultKey] = []
+        self.element_keys: List[ResultKey] = []
+        self.blocks: Dict[str, List[np.ndarray]] = {
+            NODE_DISPLACEMENTS: [], NODE_REACTIONS: [], ELEMENT_FORCES: [], ELEMENT_STRESSES: []
+        }
+
+        self.history_dir: Optional[str] = None
+        self.history_index: Optional[Dict[str, Any]] = None
+        self.histories: Dict[str, Any] = {}  # Open history files
+
+    def add_node_results(
+        self,
+        displacements: np.ndarray,
+        reactions: np.ndarray,
+        load_case_ids: Optional[Sequence[str]] = None,
+        load_combination_ids: Optional[Sequence[str]] = None
+    ) -> None:
+        """
+        Add (n_results, n_nodes, 6) displacements and reactions.
+        """
+        self.node_keys += _result_keys(len(displacements), load_case_ids, load_combination_ids)
+        self.blocks[NODE_DISPLACEMENTS].append(np.asarray(displacements, dtype=float))
+        self.blocks[NODE_REACTIONS].append(np.asarray(reactions, dtype=float))
+
+    def add_element_results(
+        self,
+        forces: np.ndarray,
+        stresses: np.ndarray,
+        load_case_ids: Optional[Sequence[str]] = None,
+        load_combination_ids: Optional[Sequence[str]] = None
+    ) -> None:
+        """
+        Add (n_results, n_elements, n_positions, ...) element forces and stresses.
+        """
+        self.element_keys += _result_keys(len(forces), load_case_ids, load_combination_ids)
+        self.blocks[ELEMENT_FORCES].append(np.asarray(forces, dtype=float))
+        self.blocks[ELEMENT_STRESSES].append(np.asarray(stresses, dtype=float))
+
+    def add_time_history(
+        self,
+        time_step: float,
+        num_steps: int,
+        node_ids: Sequence[str],
+        element_ids: Sequence[str],
+        directory: Optional[str] = None,
+        first_step: int = 0
+    ) -> None:
+        """
+        Start the node displacement and element force histories of the given nodes and elements.
+
+        Steps first_step..num_steps are then appended in order with
+        ``write_time_history`` to files in ``directory`` (ideally on the same
+        file system as the store, a temporary directory if not given). With
+        ``first_step`` > 0 the steps before it are kept from the files already there.
+        """
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.history_dir = directory or tempfile.mkdtemp(prefix="history-")
+        self.history_index = {
+            "time_step": float(time_step),
+            "num_steps": int(num_steps),
+            "node_ids": list(node_ids),
+            "element_ids": list(element_ids),
+        }
+
+        shapes = {
+            NODE_DISPLACEMENT_HISTORY: (num_steps + 1, len(node_ids), len(NODE_DISPLACEMENT_COLUMNS)),
+            ELEMENT_FORCE_HISTORY: (
+                num_steps + 1, len(element_ids), len(self.positions), len(ELEMENT_FORCE_COLUMNS)
+            ),
+        }
+        for name, shape in shapes.items():
+            path = os.path.join(self.history_dir, f"{name}.npy")
+            f = open(path, "r+b" if first_step and os.path.exists(path) else "w+b")
+            f.seek(0)
+            np.lib.format.write_array_header_1_0(
+                f, {"descr": np.dtype(np.float64).str, "fortran_order": False, "shape": shape}
+            )
+            f.seek(f.tell() + first_step * int(np.prod(shape[1:])) * np.dtype(np.float64).itemsize)
+            f.truncate()
+            self.histories[name] = f
+
+    def write_time_history(self, displacements: np.ndarray, forces: np.ndarray) -> None:
+        """
+        Append the next (n, n_nodes, 6) displacements and (n, n_elements, n_positions, 6) forces.
+        """
+        self.histories[NODE_DISPLACEMENT_HISTORY].write(np.ascontiguousarray(displacements, dtype=np.float64).tobytes())
+        self.histories[ELEMENT_FORCE_HISTORY].write(np.ascontiguousarray(forces, dtype=np.float64).tobytes())
+
+    def flush_time_history(self) -> None:
+        """
+        Make the history steps written so far durable, e.g. before checkpointing.
+        """
+        for f in self.histories.values():
+            f.flush()
+            os.fsync(f.fileno())
+
+    def save(self, path: str) -> int:
+        """
+        Write the store to ``path``, replacing any previous store there. Returns the size in bytes.
+        """
+        shapes = {
+            NODE_DISPLACEMENTS: (0, len(self.node_ids), len(NODE_DISPLACEMENT_COLUMNS)),
+            NODE_REACTIONS: (0, len(self.node_ids), len(NODE_REACTION_COLUMNS)),
+            ELEMENT_FORCES: (0, len(self.element_ids), len(self.positions), len(ELEMENT_FORCE_COLUMNS)),
+            ELEMENT_STRESSES: (0, len(self.element_ids), len(self.positions), len(ELEMENT_STRESS_COLUMNS)),
+        }
+
+        # Write into a temporary directory and swap it in once complete
+        staging = f"{path}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+
+        size = 0
+        for name, blocks in self.blocks.items():
+            array = np.concatenate(blocks) if blocks else np.zeros(shapes[name])
+            np.save(os.path.join(staging, f"{name}.npy"), array)
+            size += array.nbytes
+
+        for name, f in self.histories.items():
+            size += f.tell()
+            f.close()
+            shutil.move(os.path.join(self.history_dir, f"{name}.npy"), os.path.join(staging, f"{name}.npy"))
+        if self.history_dir:
+            shutil.rmtree(self.history_dir, ignore_errors=True)
+        self.histories.clear()
+
+        with open(os.path.join(staging, INDEX_FILE), "w") as f:
+            json.dump({
+                "node_ids": self.node_ids,
+                "element_ids": self.element_ids,
+                "positions": self.positions,
+                "node_results": self.node_keys,
+                "element_results": self.element_keys,
+                "time_history": self.history_index,
+            }, f)
+
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(staging, path)
+
+        logger.info(f"Saved result store {path} ({size / 1e6:.1f} MB)")
+
+        return size
+
+
+class ResultStore:
+    """
+    Read access to a saved result store; arrays are memory-mapped, not loaded.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        with open(os.path.join(path, INDEX_FILE)) as f:
+            index = json.load(f)
+
+        self.node_ids: List[str] = index["node_ids"]
+        self.element_ids: List[str] = index["element_ids"]
+        self.positions: List[float] = index["positions"]
+        self.node_keys: List[ResultKey] = [tuple(key) for key in index["node_results"]]
+        self.element_keys: List[ResultKey] = [tuple(key) for key in index["element_results"]]
+        self.time_history: Optional[Dict[str, Any]] = index.get("time_history")
+
+        self.node_index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        self.element_index = {element_id: i for i, element_id in enumerate(self.element_ids)}
+
+    @classmethod
+    def exists(cls, path: Optional[str]) -> bool:
+        return bool(path) and os.path.exists(os.path.join(path, INDEX_FILE))
+
+    def array(self, name: str) -> np.ndarray:
+        return np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode="r")
+
+    def _select(
+        self,
+        keys: List[ResultKey],
+        load_case_id: Optional[str],
+        load_combination_id: Optional[str]
+    ) -> np.ndarray:
+        return np.array([
+            i for i, (case_id, combination_id) in enumerate(keys)
+            if (not load_case_id or case_id == load_case_id)
+            and (not load_combination_id or combination_id == load_combination_id)
+        ], dtype=np.int64)
+
+    def _entities(self, index: Dict[str, int], entity_id: Optional[str], count: int) -> np.ndarray:
+        if entity_id:
+            return np.array([index[entity_id]] if entity_id in index else [], dtype=np.int64)
+        return np.arange(count)
+
+    def node_results(
+        self,
+        analysis_id: str,
+        node_id: Optional[str] = None,
+        load_case_id: Optional[str] = None,
+        load_combination_id: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[NodeResult]:
+        """
+        Read node results as (unsaved) NodeResult objects, filtered like the database query.
+        """
+        results = self._select(self.node_keys, load_case_id, load_combination_id)
+        nodes = self._entities(self.node_index, node_id, len(self.node_ids))
+
+        # Rows are ordered by result, then node
+        rows = np.arange(skip, min(skip + limit, len(results) * len(nodes)))
+        if len(rows) == 0:
+            return []
+
+        r = results[rows // len(nodes)]
+        n = nodes[rows % len(nodes)]
+        displacements = self.array(NODE_DISPLACEMENTS)[r, n]
+        reactions = self.array(NODE_REACTIONS)[r, n]
+
+        return [
+            NodeResult(
+                analysis_id=analysis_id,
+                node_id=self.node_ids[n[k]],
+                load_case_id=self.node_keys[r[k]][0],
+                load_combination_id=self.node_keys[r[k]][1],
+                **_row(NODE_DISPLACEMENT_COLUMNS, displacements[k]),
+                **_row(NODE_REACTION_COLUMNS, reactions[k])
+            )
+            for k in range(len(rows))
+        ]
+
+    def element_results(
+        self,
+        analysis_id: str,
+        element_id: Optional[str] = None,
+        load_case_id: Optional[str] = None,
+        load_combination_id: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+    ) -> List[ElementResult]:
+        """
+        Read element results as (unsaved) ElementResult objects, filtered like the database query.
+
+        A ``limit`` of None reads all matching rows.
+        """
+        results = self._select(self.element_keys, load_case_id, load_combination_id)
+        elements = self._entities(self.element_index, element_id, len(self.element_ids))
+        num_positions = len(self.positions)
+
+        # Rows are ordered by result, then element, then position
+        num_rows = len(results) * len(elements) * num_positions
+        rows = np.arange(skip, num_rows if limit is None else min(skip + limit, num_rows))
+        if len(rows) == 0:
+            return []
+
+        r = results[rows // (len(elements) * num_positions)]
+        e = elements[rows // num_positions % len(elements)]
+        p = rows % num_positions
+        forces = self.array(ELEMENT_FORCES)[r, e, p]
+        stresses = self.array(ELEMENT_STRESSES)[r, e, p]
+
+        return [
+            ElementResult(
+                analysis_id=analysis_id,
+                element_id=self.element_ids[e[k]],
+                load_case_id=self.element_keys[r[k]][0],
+                load_combination_id=self.element_keys[r[k]][1],
+                position=self.positions[p[k]],
+                **_row(ELEMENT_FORCE_COLUMNS, forces[k]),
+                **_row(ELEMENT_STRESS_COLUMNS, stresses[k])
+            )
+            for k in range(len(rows))
+        ]
+
+    def history(
+        self,
+        node_id: Optional[str] = None,
+        element_id: Optional[str] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read the displacement history of a node or the force history of an element for steps start..stop.
+
+        Returns None if the store has no history for it.
+        """
+        if not self.time_history:
+            return None
+
+        if node_id:
+            ids, name, key = self.time_history["node_ids"], NODE_DISPLACEMENT_HISTORY, "displacements"
+            entity_id = node_id
+        else:
+            ids, name, key = self.time_history["element_ids"], ELEMENT_FORCE_HISTORY, "forces"
+            entity_id = element_id
+        if entity_id not in ids:
+            return None
+
+        values = self.array(name)[start:stop, ids.index(entity_id)]
+        steps = np.arange(self.time_history["num_steps"] + 1)[start:stop]
+
+        return {
+            "node_id": node_id,
+            "element_id": element_id if not node_id else None,
+            "positions": self.positions if not node_id else None,
+            "times": (steps * self.time_history["time_step"]).tolist(),
+            key: np.asarray(values).tolist(),
+        }
+
+
+def _row(columns: Sequence[str], values: np.ndarray) -> Dict[str, Any]:
+    """
+    Map one row of values to columns, with NaN as None.
+    """
+    return {
+        column: None if np.isnan(value) else float(value)
+        for column, value in zip(columns, values)
+    }
@@ -0,0 +1,113 @@
+import csv
+import io
+import itertools
+import logging
+import time
+import uuid
+import numpy as np
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ResultWriter:
+    """
+    Bulk writer for analysis result tables.
+
+    Rows are streamed in batches with ``COPY ... FROM STDIN`` on PostgreSQL
+    (psycopg2), multi-row ``INSERT ... VALUES`` on other PostgreSQL drivers and
+    executemany ``INSERT`` batches elsewhere. Rows are written on the session's
+    connection and nothing is committed, so an analysis is stored in one
+    transaction owned by the caller.
+    """
+
+    def __init__(self, db: Session, batch_size: Optional[int] = None):
+        self.db = db
+        self.batch_size = batch_size or settings.RESULT_BATCH_SIZE
+
+        self.rows_written = 0
+        self.elapsed = 0.0
+
+    def write(self, model: Any, columns: Dict[str, Any], num_rows: int) -> None:
+        """
+        Write ``num_rows`` rows of an ORM model's table.
+
+        Each column value is either a scalar shared by all rows or a sequence of
+        length ``num_rows``; NaN values in float arrays are stored as NULL. The
+        id and timestamp columns are generated here.
+        """
+        if num_rows == 0:
+            return
+
+        start = time.perf_counter()
+
+        table = model.__table__
+        now = datetime.utcnow()
+        names = ["id", "created_at", "updated_at"] + list(columns)
+        values = [
+            (str(uuid.uuid4()) for _ in range(num_rows)),
+            itertools.repeat(now),
+            itertools.repeat(now),
+        ] + [self._column_values(value) for value in columns.values()]
+
+        connection = self.db.connection()
+        dialect = connection.dialect
+        rows = zip(*values)
+
+        for batch in iter(lambda: list(itertools.islice(rows, self.batch_size)), []):
+            if dialect.name == "postgresql" and dialect.driver == "psycopg2":
+                self._copy_batch(connection, table.name, names, batch)
+            elif dialect.name == "postgresql":
+                connection.execute(insert(table).values([dict(zip(names, row)) for row in batch]))
+            else:
+                connection.execute(insert(table), [dict(zip(names, row)) for row in batch])
+
+        elapsed = time.perf_counter() - start
+        self.rows_written += num_rows
+        self.elapsed += elapsed
+
+        logger.info(
+            f"Wrote {num_rows} {table.name} rows in {elapsed:.3f} s "
+            f"({num_rows / max(elapsed, 1e-9):.0f} rows/s)"
+        )
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_written / max(self.elapsed, 1e-9)
+
+    def _column_values(self, value: Any) -> Iterable[Any]:
+        """
+        Convert a column value to an iterable of Python values.
+        """
+        if isinstance(value, np.ndarray):
+            if value.dtype.kind == "f":
+                converted = value.astype(object)
+                converted[np.isnan(value)] = None
+                return converted.tolist()
+            return value.tolist()
+
+        if isinstance(value, (list, tuple)):
+            return value
+
+        return itertools.repeat(value)
+
+    def _copy_batch(self, connection, table_name: str, names: List[str], batch: List[tuple]) -> None:
+        """
+        Stream a batch of rows through COPY FROM STDIN in CSV format (empty fields are NULL).
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(batch)
+        buffer.seek(0)
+
+        cursor = connection.connection.driver_connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table_name} ({', '.join(names)}) FROM STDIN WITH (FORMAT csv)", buffer
+            )
+        finally:
+            cursor.close()
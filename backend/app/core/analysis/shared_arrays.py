@@ -0,0 +1,60 @@
+import numpy as np
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+SharedArraySpec = Dict[str, Tuple[str, tuple, str]]  # name -> (block name, shape, dtype)
+
+
+class SharedArrays:
+    """
+    NumPy arrays in shared memory, described by a picklable spec for worker processes.
+
+    Input arrays are copied in on construction; output buffers are added with
+    ``allocate``. Blocks are released when the context exits.
+    """
+
+    def __init__(self, arrays: Optional[Dict[str, np.ndarray]] = None):
+        self.blocks = []
+        self.arrays: Dict[str, np.ndarray] = {}
+        self.spec: SharedArraySpec = {}
+
+        for name, array in (arrays or {}).items():
+            array = np.ascontiguousarray(array)
+            self.allocate(name, array.shape, array.dtype)[...] = array
+
+    def allocate(self, name: str, shape: tuple, dtype: Any) -> np.ndarray:
+        """
+        Add an uninitialized shared array and return a view of it.
+        """
+        dtype = np.dtype(dtype)
+        block = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+        self.blocks.append(block)
+        self.arrays[name] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        self.spec[name] = (block.name, tuple(shape), dtype.str)
+
+        return self.arrays[name]
+
+    def close(self) -> None:
+        self.arrays.clear()
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+
+    def __enter__(self) -> "SharedArrays":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def attach_shared_arrays(spec: SharedArraySpec) -> Tuple[Dict[str, np.ndarray], List[shared_memory.SharedMemory]]:
+    """
+    Map the arrays of a spec in a worker process; close the returned blocks when done.
+    """
+    blocks = {name: shared_memory.SharedMemory(name=block_name) for name, (block_name, _, _) in spec.items()}
+    arrays = {
+        name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=blocks[name].buf)
+        for name, (_, shape, dtype) in spec.items()
+    }
+
+    return arrays, list(blocks.values())
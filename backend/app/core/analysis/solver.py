@@ -1,20 +1,83 @@
 import logging
+import os
+import time
 import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import eigh
+from scipy.sparse.linalg import eigsh
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
 
 from app.models.analysis import (
-    Analysis, AnalysisType, NodeResult, ElementResult, ModalResult
+    Analysis, AnalysisType, NodeResult, ElementResult, ModalResult, BucklingResult,
+    LinearSolverType, PreconditionerType, AccelerationType, ModalCombinationType,
+    TimeIntegrationType, NonlinearSolverType
 )
-from app.models.node import Node
 from app.models.element import Element
-from app.models.load import Load, LoadCase, LoadCombination, LoadCombinationCase
-from app.models.material import Material
-from app.models.section import Section
+from app.core.config import settings
+from app.core.snapshot import ModelSnapshot
+from app.core.analysis.assembly import (
+    assemble_sparse_matrix, assemble_sparse_matrix_parallel, assemble_element_kernel_parallel,
+    element_dof_indices, ElementKernel
+)
+from app.core.analysis.renumbering import (
+    reverse_cuthill_mckee_order, inverse_permutation, bandwidth_and_profile
+)
+from app.core.analysis.linear_solvers import (
+    Factorization, IterativeFactorization, factorize, DEFAULT_TOLERANCE, DEFAULT_MAX_ITERATIONS
+)
+from app.core.analysis.matrix_free import (
+    ElementOperator, jacobi_preconditioner, block_jacobi_preconditioner
+)
+from app.core.analysis.superposition import superpose
+from app.core.analysis.stiffness_cache import stiffness_cache, model_hash
+from app.core.analysis.incremental import (
+    changed_elements, low_rank_update, woodbury_fits, WoodburyFactorization
+)
+from app.core.analysis.superelements import Substructure, find_repeated_stories, build_superelement
+from app.core.analysis.domain_decomposition import solve_domain_decomposition
+from app.core.analysis.buckling import buckling_load_factors
+from app.core.analysis.response_spectrum import (
+    SPECTRUM_DIRECTIONS, influence_vectors, participation_factors, spectral_accelerations,
+    cqc_correlation, combine_modal_responses
+)
+from app.core.analysis.mode_shapes import encode_mode_shape
+from app.core.analysis.time_history import integrate_modes
+from app.core.analysis.direct_integration import (
+    DEFAULT_HHT_ALPHA, HHTIntegrator, rayleigh_coefficients, rayleigh_damping, save_checkpoint, load_checkpoint
+)
+from app.core.analysis.nonlinear import (
+    solve_nonlinear, DEFAULT_LOAD_STEPS, DEFAULT_NONLINEAR_TOLERANCE, DEFAULT_NONLINEAR_MAX_ITERATIONS,
+    DEFAULT_REFACTORIZE_INTERVAL
+)
+from app.core.analysis.p_delta import solve_p_delta, DEFAULT_P_DELTA_TOLERANCE, DEFAULT_P_DELTA_MAX_ITERATIONS
+from app.core.analysis.result_writer import ResultWriter
+from app.core.analysis.result_store import (
+    ResultStoreBuilder, ELEMENT_FORCE_COLUMNS, ELEMENT_STRESS_COLUMNS,
+    NODE_DISPLACEMENT_COLUMNS, NODE_REACTION_COLUMNS
+)
+from app.core.analysis.kernels import (
+    element_stiffness_matrices, element_mass_matrices, element_geometric_stiffness_matrices,
+    element_second_order_forces, element_second_order_tangents, element_stiffness_kernel, element_mass_kernel,
+    transformation_matrices, transform_to_global, element_end_forces, element_stresses
+)
 
 logger = logging.getLogger(__name__)
 
+# Element result positions along the element
+ELEMENT_RESULT_POSITIONS = (0.0, 1.0)
+
+# Per-element geometry and properties shipped to the element kernel workers
+ELEMENT_KERNEL_INPUTS = ("dx", "dy", "dz", "L", "E", "nu", "rho", "A", "Iy", "Iz", "J", "angle")
+
+# Buckling modes per reference load unless the analysis sets num_modes
+DEFAULT_BUCKLING_MODES = 6
+
+# Response spectrum defaults
+DEFAULT_SPECTRUM_DIRECTIONS = ("x", "y")
+DEFAULT_DAMPING_RATIO = 0.05
+
 
 class StructuralAnalysisSolver:
     """
@@ -34,22 +97,24 @@ class StructuralAnalysisSolver:
         
         self.project_id = self.analysis.project_id
         
-        # Load model data
-        self.nodes = db.query(Node).filter(Node.project_id == self.project_id).all()
-        self.elements = db.query(Element).filter(Element.project_id == self.project_id).all()
+        # Load model data, load cases and combinations in bulk
+        self.snapshot = ModelSnapshot(
+            db,
+            self.project_id,
+            load_case_ids=self.analysis.load_case_ids,
+            load_combination_ids=self.analysis.load_combination_ids
+        )
+        self.snapshot.check_elements()
         
-        # Load cases and combinations
-        self.load_cases = []
-        if self.analysis.load_case_ids:
-            self.load_cases = db.query(LoadCase).filter(
-                LoadCase.id.in_(self.analysis.load_case_ids)
-            ).all()
+        # Renumber nodes to reduce the bandwidth and fill-in of the assembled matrices;
+        # self.nodes is kept in DOF order
+        self.node_order = self._renumber_nodes()
+        self.node_position = inverse_permutation(self.node_order)
         
-        self.load_combinations = []
-        if self.analysis.load_combination_ids:
-            self.load_combinations = db.query(LoadCombination).filter(
-                LoadCombination.id.in_(self.analysis.load_combination_ids)
-            ).all()
+        self.nodes = [self.snapshot.nodes[i] for i in self.node_order]
+        self.elements = self.snapshot.elements
+        self.load_cases = self.snapshot.load_cases
+        self.load_combinations = self.snapshot.load_combinations
         
         # Initialize matrices
         self.num_nodes = len(self.nodes)
@@ -59,7 +124,40 @@ class StructuralAnalysisSolver:
         
         # Node and element mapping for easy access
         self.node_map = {node.id: i for i, node in enumerate(self.nodes)}
-        self.element_map = {element.id: i for i, element in enumerate(self.elements)}
+        self.element_map = self.snapshot.element_index
+        
+        # Restrained DOF mask in DOF order, built once from the node restraint columns
+        self.constrained_mask = self.snapshot.node_restraints[self.node_order].ravel()
+        self.free_dofs = np.flatnonzero(~self.constrained_mask)
+        self.constrained_dofs = np.flatnonzero(self.constrained_mask)
+        
+        # Nodal load matrix (n_dof, n_load_cases), built on first use
+        self._load_matrix = None
+        
+        # Element transformation, local and global stiffness matrices, built on first use
+        self._element_matrices = None
+        
+        # Content hashes of the stiffness-relevant model data and of its topology alone
+        self._model_hash = None
+        self._topology_hash = None
+        
+        # Groups of identical stories with interior nodes, found on first use
+        self._substructures = None
+        
+        # Bulk writer for result rows; results are stored in one transaction per analysis
+        self.result_writer = ResultWriter(db)
+        
+        # Opt-in columnar result store replacing node and element result rows
+        self.result_store = None
+        if self.analysis.use_result_store:
+            self.result_store = ResultStoreBuilder(
+                [node.id for node in self.nodes],
+                [element.id for element in self.elements],
+                ELEMENT_RESULT_POSITIONS
+            )
+        
+        # Statistics recorded on the analysis after the run
+        self.solver_statistics: Dict[str, Any] = {}
     
     def run_analysis(self) -> None:
         """
@@ -73,7 +171,10 @@ class StructuralAnalysisSolver:
             
             # Run the appropriate analysis
             if self.analysis.analysis_type == AnalysisType.LINEAR_STATIC:
-                self._run_linear_static_analysis()
+                if self.analysis.include_p_delta:
+                    self._run_p_delta_analysis()
+                else:
+                    self._run_linear_static_analysis()
             elif self.analysis.analysis_type == AnalysisType.NONLINEAR_STATIC:
                 self._run_nonlinear_static_analysis()
             elif self.analysis.analysis_type == AnalysisType.MODAL:
@@ -89,323 +190,1352 @@ class StructuralAnalysisSolver:
             else:
                 raise ValueError(f"Unsupported analysis type: {self.analysis.analysis_type}")
             
+            # Save the result store and point the analysis at it
+            self.analysis.result_store_path = None
+            if self.result_store is not None:
+                path = os.path.join(settings.RESULTS_DIR, self.analysis_id)
+                self.solver_statistics["result_store_bytes"] = self.result_store.save(path)
+                self.analysis.result_store_path = path
+            
             # Update analysis status
+            self.solver_statistics.update({
+                "result_rows": self.result_writer.rows_written,
+                "result_write_time": self.result_writer.elapsed,
+            })
+            self.analysis.solver_statistics = self.solver_statistics
             self.analysis.is_complete = True
             self.analysis.run_date = datetime.utcnow()
             self.db.commit()
             
-            logger.info(f"Analysis {self.analysis.name} completed successfully")
+            logger.info(
+                f"Analysis {self.analysis.name} completed successfully; stored "
+                f"{self.result_writer.rows_written} result rows at "
+                f"{self.result_writer.rows_per_second:.0f} rows/s"
+            )
         
         except Exception as e:
             self.db.rollback()
             logger.error(f"Error running analysis {self.analysis.name}: {str(e)}")
             raise
     
+    def _renumber_nodes(self) -> np.ndarray:
+        """
+        Compute a reverse Cuthill-McKee node order and log the bandwidth and profile before and after.
+        """
+        num_nodes = self.snapshot.num_nodes
+        element_nodes = self.snapshot.element_nodes
+        
+        order = reverse_cuthill_mckee_order(element_nodes, num_nodes)
+        
+        bandwidth_before, profile_before = bandwidth_and_profile(element_nodes, np.arange(num_nodes))
+        bandwidth_after, profile_after = bandwidth_and_profile(element_nodes, inverse_permutation(order))
+        
+        # Keep the original numbering if it is already at least as compact
+        if profile_after >= profile_before:
+            order = np.arange(num_nodes)
+            bandwidth_after, profile_after = bandwidth_before, profile_before
+        
+        logger.info(
+            f"DOF renumbering for analysis {self.analysis_id}: "
+            f"bandwidth {bandwidth_before} -> {bandwidth_after}, "
+            f"profile {profile_before} -> {profile_after}"
+        )
+        
+        return order
+    
     def _clear_previous_results(self) -> None:
         """
         Clear previous analysis results.
+        
+        The deletion is committed together with the new results at the end of the run.
         """
         self.db.query(NodeResult).filter(NodeResult.analysis_id == self.analysis_id).delete()
         self.db.query(ElementResult).filter(ElementResult.analysis_id == self.analysis_id).delete()
         self.db.query(ModalResult).filter(ModalResult.analysis_id == self.analysis_id).delete()
-        self.db.commit()
+        self.db.query(BucklingResult).filter(BucklingResult.analysis_id == self.analysis_id).delete()
     
     def _run_linear_static_analysis(self) -> None:
         """
         Run linear static analysis.
         """
-        # For each load case
-        for load_case in self.load_cases:
-            # 1. Assemble global stiffness matrix
-            K_global = self._assemble_global_stiffness_matrix()
-            
-            # 2. Assemble load vector
-            F_global = self._assemble_load_vector(load_case.id)
-            
-            # 3. Apply boundary conditions
-            K_reduced, F_reduced, bc_data = self._apply_boundary_conditions(K_global, F_global)
+        # Per-load-case displacements and reactions, one column per load case
+        U_global = np.zeros((self.total_dof, len(self.load_cases)))
+        R_global = np.zeros((self.total_dof, len(self.load_cases)))
+        
+        if self.load_cases:
+            # 1. Assemble load vectors for all load cases as columns of one matrix
+            F_global = self._assemble_load_matrix()
             
-            # 4. Solve the system of equations
-            U_reduced = np.linalg.solve(K_reduced, F_reduced)
+            if self.analysis.linear_solver == LinearSolverType.MATRIX_FREE_PCG:
+                # 2-4. Solve with element-by-element products, without assembling K
+                U_reduced, bc_data = self._solve_matrix_free(F_global)
+            elif self.analysis.linear_solver == LinearSolverType.DOMAIN_DECOMPOSITION:
+                # 2-4. Condense subdomains in parallel worker processes and solve the interface problem
+                U_reduced, bc_data = self._solve_domain_decomposition(F_global)
+            elif self.analysis.use_superelements and self._find_substructures():
+                # 2-4. Condense repeated stories to superelements and solve for their boundary DOFs
+                U_reduced, bc_data = self._solve_with_superelements(F_global)
+            else:
+                # 2. Assemble and partition the global stiffness matrix (reused for an unchanged model)
+                stiffness = self._get_stiffness_matrices()
+                
+                # 3. Apply boundary conditions
+                K_reduced, F_reduced, bc_data = self._apply_boundary_conditions(stiffness, F_global)
+                
+                # 4. Factorize once and solve for all load cases in one pass
+                factorization = self._factorize_stiffness_matrix(K_reduced)
+                U_reduced = factorization.solve(F_reduced)
             
-            # 5. Recover full displacement vector
+            # 5. Recover full displacements and support reactions for all load cases
             U_global = self._recover_full_displacement_vector(U_reduced, bc_data)
-            
-            # 6. Calculate element forces and stresses
-            self._calculate_element_results(U_global, load_case.id)
-            
-            # 7. Store node results
-            self._store_node_results(U_global, load_case.id)
-        
-        # For each load combination
-        for load_combination in self.load_combinations:
-            # Get load cases and factors
-            combination_cases = self.db.query(LoadCombinationCase).filter(
-                LoadCombinationCase.load_combination_id == load_combination.id
-            ).all()
-            
-            # Combine results
-            self._combine_results(load_combination.id, combination_cases)
+            R_global = self._calculate_reactions(U_reduced, bc_data)
+        
+        # 6. Calculate element forces and stresses for all load cases at once
+        forces = self._calculate_element_forces(U_global)
+        stresses = self._calculate_element_stresses(forces)
+        load_case_ids = [load_case.id for load_case in self.load_cases]
+        self._store_element_results(forces, stresses, load_case_ids=load_case_ids)
+        
+        # 7. Store node results
+        self._store_node_results(U_global, R_global, load_case_ids=load_case_ids)
+        
+        # 8. Combine results for all load combinations by superposition
+        if self.load_combinations:
+            self._combine_results(U_global, R_global, forces)
     
     def _run_nonlinear_static_analysis(self) -> None:
         """
         Run nonlinear static analysis.
+        
+        With include_large_deformation the elements use second-order axial
+        strain (large displacements, moderate rotations); otherwise the
+        response is linear and every load step converges in one iteration.
+        Like P-Delta, every load case and combination is solved separately,
+        incrementally from zero load. Results are stored like those of a linear
+        static analysis, with the per-step iterations, factorizations and wall
+        time in the solver statistics.
         """
-        # Implementation for nonlinear static analysis
-        pass
+        if not self.load_cases:
+            return
+        
+        start = time.perf_counter()
+        
+        # 1. Load sets: every load case, then every load combination
+        F_global = self._assemble_load_matrix()
+        factors = self.snapshot.combination_factor_matrix()
+        F_sets = np.hstack([F_global, F_global @ factors.T])
+        
+        method = NonlinearSolverType(self.analysis.nonlinear_solver or NonlinearSolverType.NEWTON_RAPHSON)
+        large_deformation = bool(self.analysis.include_large_deformation)
+        options = {
+            "method": method,
+            "load_steps": self.analysis.load_steps or DEFAULT_LOAD_STEPS,
+            "refactorize_interval": self.analysis.refactorize_interval or DEFAULT_REFACTORIZE_INTERVAL,
+            "use_line_search": bool(self.analysis.line_search),
+            "use_arc_length": bool(self.analysis.arc_length),
+            "tolerance": self.analysis.nonlinear_tolerance or DEFAULT_NONLINEAR_TOLERANCE,
+            "max_iterations": self.analysis.nonlinear_max_iterations or DEFAULT_NONLINEAR_MAX_ITERATIONS,
+        }
+        
+        # 2. Element data for the batched internal force and tangent kernels
+        stiffness = self._get_stiffness_matrices()
+        matrices = self._calculate_element_matrices()
+        data = self._collect_element_data()
+        T, K_local, dof_indices = matrices["T"], matrices["K_local"], matrices["dof_indices"]
+        axial_stiffness = data["E"] * data["A"] / data["L"]
+        if large_deformation:
+            G = element_geometric_stiffness_matrices(data["L"], 1.0, data["A"], data["Iy"], data["Iz"])
+        else:
+            G = np.zeros_like(K_local)
+        
+        def local_displacements(U_reduced: np.ndarray) -> np.ndarray:
+            U_global = np.zeros(self.total_dof)
+            U_global[self.free_dofs] = U_reduced
+            return np.einsum("nij,nj->ni", T, U_global[dof_indices])
+        
+        def global_internal_force(U_reduced: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            f_local, _ = element_second_order_forces(K_local, G, axial_stiffness, local_displacements(U_reduced))
+            f_global = np.einsum("nji,nj->ni", T, f_local)
+            return np.bincount(dof_indices.ravel(), f_global.ravel(), minlength=self.total_dof), f_local
+        
+        def internal_force(U_reduced: np.ndarray) -> np.ndarray:
+            return global_internal_force(U_reduced)[0][self.free_dofs]
+        
+        def tangent(U_reduced: np.ndarray) -> sp.csr_matrix:
+            if not large_deformation:
+                return stiffness["K_reduced"]
+            K_T = element_second_order_tangents(K_local, G, axial_stiffness, local_displacements(U_reduced))
+            return self._partition_matrix(self._assemble_matrix(transform_to_global(T, K_T), dof_indices))[0]
+        
+        def factorize_matrix(K: sp.csr_matrix) -> Factorization:
+            if not large_deformation:
+                # The tangent is the linear stiffness, whose factorization is cached
+                return self._factorize_stiffness_matrix(K)
+            # The tangent loses positive definiteness at limit points
+            return factorize(K, self.analysis.linear_solver, indefinite=True)[0]
+        
+        # 3. Solve every load set and recover its displacements, reactions and element forces
+        U_global = np.zeros((self.total_dof, F_sets.shape[1]))
+        R_global = np.zeros((self.total_dof, F_sets.shape[1]))
+        forces = np.zeros((F_sets.shape[1], self.num_elements, len(ELEMENT_RESULT_POSITIONS), 6))
+        histories = []
+        
+        for j in range(F_sets.shape[1]):
+            U_reduced, history = solve_nonlinear(
+                internal_force, tangent, factorize_matrix, F_sets[self.free_dofs, j], **options
+            )
+            histories.append(history)
+            
+            U_global[self.free_dofs, j] = U_reduced
+            f_global, f_local = global_internal_force(U_reduced)
+            R_global[self.constrained_dofs, j] = f_global[self.constrained_dofs] - F_sets[self.constrained_dofs, j]
+            forces[j] = f_local.reshape(self.num_elements, 2, 6)
+            forces[j, :, 1] *= -1
+        
+        elapsed = time.perf_counter() - start
+        num_cases = len(self.load_cases)
+        load_case_ids = [load_case.id for load_case in self.load_cases]
+        load_combination_ids = [load_combination.id for load_combination in self.load_combinations]
+        
+        logger.info(
+            f"Nonlinear static analysis of {len(histories)} load cases and combinations in {elapsed:.3f} s "
+            f"({sum(h['iterations'] for h in histories)} iterations, "
+            f"{sum(h['factorizations'] for h in histories)} factorizations)"
+        )
+        
+        self.solver_statistics["nonlinear"] = {
+            **options,
+            "method": method.value,
+            "large_deformation": large_deformation,
+            "converged": all(h["converged"] for h in histories),
+            "iterations": sum(h["iterations"] for h in histories),
+            "factorizations": sum(h["factorizations"] for h in histories),
+            "factorization_time": sum(h["factorization_time"] for h in histories),
+            "time": elapsed,
+            "load_cases": dict(zip(load_case_ids, histories[:num_cases])),
+            "load_combinations": dict(zip(load_combination_ids, histories[num_cases:])),
+        }
+        
+        # 4. Store load case and load combination results
+        stresses = self._calculate_element_stresses(forces)
+        self._store_element_results(forces[:num_cases], stresses[:num_cases], load_case_ids=load_case_ids)
+        self._store_node_results(U_global[:, :num_cases], R_global[:, :num_cases], load_case_ids=load_case_ids)
+        
+        if self.load_combinations:
+            self._store_node_results(
+                U_global[:, num_cases:], R_global[:, num_cases:], load_combination_ids=load_combination_ids
+            )
+            self._store_element_results(
+                forces[num_cases:], stresses[num_cases:], load_combination_ids=load_combination_ids
+            )
     
-    def _run_modal_analysis(self) -> None:
+    def _solve_modes(self) -> Tuple[np.ndarray, np.ndarray, sp.csr_matrix, Dict[str, Any]]:
         """
-        Run modal analysis.
+        Assemble the stiffness and mass matrices and solve for the requested number of modes.
+        
+        Returns the eigenvalues, the reduced mode shapes, the reduced mass matrix and the boundary condition data.
         """
-        # 1. Assemble global stiffness matrix
-        K_global = self._assemble_global_stiffness_matrix()
+        # 1. Assemble global stiffness matrix (reused for an unchanged model)
+        stiffness = self._get_stiffness_matrices()
         
         # 2. Assemble global mass matrix
         M_global = self._assemble_global_mass_matrix()
         
         # 3. Apply boundary conditions
-        K_reduced, M_reduced, bc_data = self._apply_boundary_conditions_modal(K_global, M_global)
+        K_reduced, M_reduced, bc_data = self._apply_boundary_conditions_modal(stiffness, M_global)
         
         # 4. Solve the generalized eigenvalue problem
         eigenvalues, eigenvectors = self._solve_eigenvalue_problem(K_reduced, M_reduced)
         
-        # 5. Store modal results
-        self._store_modal_results(eigenvalues, eigenvectors, bc_data)
+        return eigenvalues, eigenvectors, M_reduced, bc_data
+    
+    def _run_modal_analysis(self) -> None:
+        """
+        Run modal analysis.
+        """
+        # 1-4. Solve the generalized eigenvalue problem
+        eigenvalues, eigenvectors, M_reduced, bc_data = self._solve_modes()
+        
+        # 5. Modal masses and participation factors for unit ground translations
+        modal_masses, participation, _ = participation_factors(
+            eigenvectors, M_reduced, influence_vectors(self.free_dofs, SPECTRUM_DIRECTIONS, self.dof_per_node)
+        )
+        
+        # 6. Store modal results
+        self._store_modal_results(eigenvalues, eigenvectors, bc_data, modal_masses, participation)
     
     def _run_response_spectrum_analysis(self) -> None:
         """
         Run response spectrum analysis.
+        
+        Peak modal displacements, reactions and element forces are computed as
+        arrays from one set of unit modal responses, scaled per direction and
+        combined over modes with CQC (or SRSS) as one correlation matrix product
+        per direction. Directions are combined by SRSS. Modal results are
+        stored as for a modal analysis.
         """
-        # Implementation for response spectrum analysis
-        pass
+        if not self.analysis.spectrum:
+            raise ValueError("Response spectrum analysis requires a spectrum")
+        
+        directions = list(self.analysis.spectrum_directions or DEFAULT_SPECTRUM_DIRECTIONS)
+        damping_ratio = self.analysis.damping_ratio if self.analysis.damping_ratio is not None else DEFAULT_DAMPING_RATIO
+        combination = ModalCombinationType(self.analysis.modal_combination or ModalCombinationType.CQC)
+        
+        # 1. Modes and participation factors
+        eigenvalues, modes, M_reduced, bc_data = self._solve_modes()
+        modal_masses, participation, effective_masses = participation_factors(
+            modes, M_reduced, influence_vectors(self.free_dofs, SPECTRUM_DIRECTIONS, self.dof_per_node)
+        )
+        self._store_modal_results(eigenvalues, modes, bc_data, modal_masses, participation)
+        
+        start = time.perf_counter()
+        
+        # 2. Spectral accelerations and peak modal displacements q = gamma Sa / omega^2 per direction
+        omega = np.sqrt(np.maximum(eigenvalues, 1e-300))
+        accelerations = spectral_accelerations(
+            2 * np.pi / omega, self.analysis.spectrum, self.analysis.spectrum_scale_factor or 1.0
+        )
+        columns = [list(SPECTRUM_DIRECTIONS).index(direction) for direction in directions]
+        q = participation[:, columns] * (accelerations / omega**2)[:, None]
+        
+        # 3. Displacements, reactions and element forces of every mode at unit amplitude
+        U_modes = self._recover_full_displacement_vector(modes, bc_data)
+        R_modes = np.zeros_like(U_modes)
+        R_modes[self.constrained_dofs] = bc_data["K_cf"] @ modes
+        forces_modes = self._calculate_element_forces(U_modes)
+        
+        # 4. Combine over modes for each direction, then over directions by SRSS
+        correlation = (
+            cqc_correlation(omega, damping_ratio) if combination == ModalCombinationType.CQC
+            else np.eye(len(omega))
+        )
+        U_total = np.zeros(self.total_dof)
+        R_total = np.zeros(self.total_dof)
+        forces_total = np.zeros(forces_modes.shape[1:])
+        base_shear = {}
+        
+        for k, direction in enumerate(directions):
+            U_total += combine_modal_responses(U_modes.T * q[:, k, None], correlation)**2
+            R_total += combine_modal_responses(R_modes.T * q[:, k, None], correlation)**2
+            forces_total += combine_modal_responses(
+                forces_modes * q[:, k, None, None, None], correlation
+            )**2
+            
+            modal_base_shear = accelerations * effective_masses[:, columns[k]]
+            base_shear[direction] = float(combine_modal_responses(modal_base_shear, correlation))
+        
+        U_total, R_total, forces_total = np.sqrt(U_total), np.sqrt(R_total), np.sqrt(forces_total)
+        elapsed = time.perf_counter() - start
+        
+        logger.info(
+            f"Combined {len(omega)} modes in {len(directions)} directions by {combination.value.upper()} "
+            f"in {elapsed:.3f} s"
+        )
+        
+        total_mass = influence_vectors(self.free_dofs, directions, self.dof_per_node).T @ (
+            M_reduced @ influence_vectors(self.free_dofs, directions, self.dof_per_node)
+        )
+        self.solver_statistics["response_spectrum"] = {
+            "num_modes": int(len(omega)),
+            "directions": directions,
+            "modal_combination": combination.value,
+            "damping_ratio": damping_ratio,
+            "base_shear": base_shear,
+            "mass_participation": {
+                direction: float(effective_masses[:, columns[k]].sum() / total_mass[k, k])
+                for k, direction in enumerate(directions)
+            },
+            "combination_time": elapsed,
+        }
+        
+        # 5. Store the combined (peak, unsigned) node and element results
+        forces_total = forces_total[None]
+        self._store_element_results(forces_total, self._calculate_element_stresses(forces_total))
+        self._store_node_results(U_total[:, None], R_total[:, None])
     
     def _run_time_history_analysis(self) -> None:
         """
-        Run time history analysis.
+        Run time history analysis for a ground acceleration record.
+        
+        Modes are superposed unless the analysis selects direct (Newmark or
+        HHT-alpha) integration. Displacements of the selected nodes and forces of
+        the selected elements are written to the result store chunk by chunk,
+        so memory does not grow with the record length.
         """
-        # Implementation for time history analysis
-        pass
+        integration = TimeIntegrationType(self.analysis.time_integration or TimeIntegrationType.MODAL)
+        
+        if integration == TimeIntegrationType.MODAL:
+            self._run_modal_time_history_analysis()
+        else:
+            self._run_direct_time_history_analysis(integration)
     
-    def _run_buckling_analysis(self) -> None:
+    def _time_history_setup(self) -> Dict[str, Any]:
         """
-        Run buckling analysis.
+        Read the ground motion record and the recorded nodes and elements, and open their histories.
+        
+        Node histories default to all nodes, element histories to none.
         """
-        # Implementation for buckling analysis
-        pass
+        if not self.analysis.time_step or not self.analysis.ground_motion:
+            raise ValueError("Time history analysis requires a time step and a ground motion record")
+        
+        ground_acceleration = (self.analysis.ground_motion_scale_factor or 1.0) * np.asarray(
+            self.analysis.ground_motion, dtype=float
+        )
+        node_ids = self.analysis.history_node_ids or [node.id for node in self.nodes]
+        element_ids = self.analysis.history_element_ids or []
+        
+        if self.result_store is None:
+            self.result_store = ResultStoreBuilder(
+                [node.id for node in self.nodes],
+                [element.id for element in self.elements],
+                ELEMENT_RESULT_POSITIONS
+            )
+        
+        return {
+            "time_step": self.analysis.time_step,
+            "ground_acceleration": ground_acceleration,
+            "num_steps": self.analysis.num_steps or len(ground_acceleration),
+            "direction": self.analysis.ground_motion_direction or "x",
+            "damping_ratio": (
+                self.analysis.damping_ratio if self.analysis.damping_ratio is not None else DEFAULT_DAMPING_RATIO
+            ),
+            "node_ids": node_ids,
+            "element_ids": element_ids,
+            "node_indices": np.array([self.node_map[node_id] for node_id in node_ids], dtype=np.int64),
+            "element_indices": np.array(
+                [self.element_map[element_id] for element_id in element_ids], dtype=np.int64
+            ),
+            "directory": os.path.join(settings.RESULTS_DIR, f"{self.analysis_id}.history"),
+        }
     
-    def _run_p_delta_analysis(self) -> None:
+    def _run_modal_time_history_analysis(self) -> None:
         """
-        Run P-Delta analysis.
+        Run modal time history analysis.
+        
+        All modes are integrated at once with the exact recurrence for a
+        piecewise linear record, and responses are recovered from the modal
+        displacements of each chunk of steps.
         """
-        # Implementation for P-Delta analysis
-        pass
+        record = self._time_history_setup()
+        node_ids, element_ids = record["node_ids"], record["element_ids"]
+        
+        # 1. Modes and participation factors
+        eigenvalues, modes, M_reduced, bc_data = self._solve_modes()
+        modal_masses, participation, _ = participation_factors(
+            modes, M_reduced, influence_vectors(self.free_dofs, SPECTRUM_DIRECTIONS, self.dof_per_node)
+        )
+        self._store_modal_results(eigenvalues, modes, bc_data, modal_masses, participation)
+        omega = np.sqrt(np.maximum(eigenvalues, 1e-300))
+        
+        # 2. Mode shapes at the recorded nodes and element forces of every mode at unit amplitude
+        U_modes = self._recover_full_displacement_vector(modes, bc_data)
+        node_modes = U_modes.reshape(self.num_nodes, self.dof_per_node, -1)[record["node_indices"]]
+        node_modes = node_modes.reshape(-1, len(omega))
+        if len(element_ids):
+            element_modes = self._calculate_element_forces(U_modes)[:, record["element_indices"]]
+            element_modes = element_modes.reshape(len(omega), -1)
+        else:
+            element_modes = np.zeros((len(omega), 0))
+        
+        # 3. Integrate the modes and stream the recovered responses to the result store
+        self.result_store.add_time_history(
+            record["time_step"], record["num_steps"], node_ids, element_ids, record["directory"]
+        )
+        
+        integration_time = recovery_time = 0.0
+        peak_displacement = 0.0
+        start = time.perf_counter()
+        for _, q in integrate_modes(
+            omega, record["damping_ratio"], record["time_step"], record["ground_acceleration"],
+            participation[:, SPECTRUM_DIRECTIONS[record["direction"]]], record["num_steps"],
+            settings.TIME_HISTORY_CHUNK_STEPS
+        ):
+            integration_time += time.perf_counter() - start
+            start = time.perf_counter()
+            
+            displacements = q @ node_modes.T
+            self.result_store.write_time_history(
+                displacements.reshape(len(q), len(node_ids), self.dof_per_node),
+                (q @ element_modes).reshape(
+                    len(q), len(element_ids), len(ELEMENT_RESULT_POSITIONS), len(ELEMENT_FORCE_COLUMNS)
+                )
+            )
+            if displacements.size:
+                peak_displacement = max(peak_displacement, float(np.abs(displacements).max()))
+            
+            recovery_time += time.perf_counter() - start
+            start = time.perf_counter()
+        
+        logger.info(
+            f"Integrated {len(omega)} modes over {record['num_steps']} steps in {integration_time:.3f} s; "
+            f"recovered {len(node_ids)} nodes and {len(element_ids)} elements in {recovery_time:.3f} s"
+        )
+        
+        self.solver_statistics["time_history"] = {
+            "integration": TimeIntegrationType.MODAL.value,
+            "num_modes": int(len(omega)),
+            "num_steps": int(record["num_steps"]),
+            "direction": record["direction"],
+            "damping_ratio": record["damping_ratio"],
+            "recorded_nodes": len(node_ids),
+            "recorded_elements": len(element_ids),
+            "peak_displacement": peak_displacement,
+            "integration_time": integration_time,
+            "recovery_time": recovery_time,
+        }
     
-    def _assemble_global_stiffness_matrix(self) -> np.ndarray:
+    def _run_direct_time_history_analysis(self, integration: TimeIntegrationType) -> None:
         """
-        Assemble the global stiffness matrix.
+        Run time history analysis by direct (Newmark or HHT-alpha) integration.
+        
+        The damping is Rayleigh damping from the analysis coefficients or, if
+        they are not set, matched to the damping ratio at the first and last of
+        the lowest num_modes modes. The effective stiffness is factorized once.
+        With a checkpoint interval the integrator state is saved every that many
+        steps, and a rerun of the same analysis resumes from the last checkpoint.
         """
-        # Initialize global stiffness matrix
-        K_global = np.zeros((self.total_dof, self.total_dof))
+        record = self._time_history_setup()
+        node_ids, element_ids = record["node_ids"], record["element_ids"]
+        time_step, num_steps = record["time_step"], record["num_steps"]
+        ground_acceleration = record["ground_acceleration"]
+        alpha = 0.0
+        if integration == TimeIntegrationType.HHT_ALPHA:
+            alpha = self.analysis.hht_alpha if self.analysis.hht_alpha is not None else DEFAULT_HHT_ALPHA
         
-        # For each element
-        for element in self.elements:
-            # Get element properties
-            material = self.db.query(Material).filter(Material.id == element.material_id).first()
-            section = self.db.query(Section).filter(Section.id == element.section_id).first()
-            
-            # Get element nodes
-            start_node = self.db.query(Node).filter(Node.id == element.start_node_id).first()
-            end_node = self.db.query(Node).filter(Node.id == element.end_node_id).first()
-            
-            # Calculate element length and direction cosines
-            dx = end_node.x - start_node.x
-            dy = end_node.y - start_node.y
-            dz = end_node.z - start_node.z
-            L = np.sqrt(dx**2 + dy**2 + dz**2)
-            
-            # Calculate element stiffness matrix in local coordinates
-            K_local = self._calculate_element_stiffness_matrix(
-                L, material.elastic_modulus, section.area, 
-                section.moment_of_inertia_y, section.moment_of_inertia_z, 
-                section.torsional_constant, material.poisson_ratio
+        # 1. Reduced stiffness, mass and Rayleigh damping matrices
+        stiffness = self._get_stiffness_matrices()
+        K, M, bc_data = self._apply_boundary_conditions_modal(stiffness, self._assemble_global_mass_matrix())
+        
+        mass_coefficient = self.analysis.rayleigh_mass_coefficient
+        stiffness_coefficient = self.analysis.rayleigh_stiffness_coefficient
+        if mass_coefficient is None or stiffness_coefficient is None:
+            omega = np.sqrt(np.maximum(self._solve_eigenvalue_problem(K, M)[0], 1e-300))
+            mass_coefficient, stiffness_coefficient = rayleigh_coefficients(
+                record["damping_ratio"], omega[0], omega[-1]
             )
+        C = rayleigh_damping(M, K, mass_coefficient, stiffness_coefficient)
+        
+        # 2. Load pattern of a unit ground acceleration, F(t) = -M r a_g(t)
+        load = -(M @ influence_vectors(self.free_dofs, (record["direction"],), self.dof_per_node)[:, 0])
+        
+        def loads(step: int) -> np.ndarray:
+            return (ground_acceleration[step] if step < len(ground_acceleration) else 0.0) * load
+        
+        def factorize_matrix(K: sp.csr_matrix) -> Factorization:
+            return factorize(
+                K,
+                self.analysis.linear_solver,
+                tolerance=self.analysis.solver_tolerance,
+                max_iterations=self.analysis.solver_max_iterations
+            )[0]
+        
+        # 3. Factorize the effective stiffness once
+        start = time.perf_counter()
+        integrator = HHTIntegrator(M, C, K, time_step, alpha, factorize_matrix)
+        factorization_time = time.perf_counter() - start
+        
+        # 4. Resume from a checkpoint of the same model and inputs, or start from rest
+        signature = model_hash([
+            np.frombuffer(self.model_hash.encode(), dtype=np.uint8),
+            ground_acceleration,
+            np.array([
+                time_step, num_steps, alpha, record["damping_ratio"], self.analysis.num_modes or 0,
+                np.nan if self.analysis.rayleigh_mass_coefficient is None else self.analysis.rayleigh_mass_coefficient,
+                np.nan if self.analysis.rayleigh_stiffness_coefficient is None
+                else self.analysis.rayleigh_stiffness_coefficient,
+            ]),
+            np.array([SPECTRUM_DIRECTIONS[record["direction"]]]),
+            record["node_indices"],
+            record["element_indices"],
+        ])
+        checkpoint = None
+        if self.analysis.checkpoint_interval:
+            checkpoint = load_checkpoint(record["directory"], signature)
+        
+        if checkpoint:
+            first_step, U, V, A, peak_displacement = checkpoint
+            logger.info(f"Resuming time history from checkpoint at step {first_step}")
+        else:
+            first_step, peak_displacement = 0, 0.0
+            U, V = np.zeros(len(load)), np.zeros(len(load))
+            A = factorize_matrix(M).solve(loads(0)) if loads(0).any() else np.zeros(len(load))
+        
+        self.result_store.add_time_history(
+            time_step, num_steps, node_ids, element_ids, record["directory"],
+            first_step=first_step + 1 if checkpoint else 0
+        )
+        
+        # 5. Recorded DOFs: recorded nodes and the ends of recorded elements, as positions in U
+        matrices = self._calculate_element_matrices()
+        node_dofs = (record["node_indices"][:, None] * self.dof_per_node + np.arange(self.dof_per_node)).ravel()
+        element_dofs = matrices["dof_indices"][record["element_indices"]]
+        recorded = np.unique(np.concatenate([node_dofs, element_dofs.ravel()]))
+        recorded = recorded[~self.constrained_mask[recorded]]
+        free_position = np.full(self.total_dof, -1, dtype=np.int64)
+        free_position[self.free_dofs] = np.arange(len(self.free_dofs))
+        recorded_position = np.full(self.total_dof, len(recorded), dtype=np.int64)  # Last row is zero
+        recorded_position[recorded] = np.arange(len(recorded))
+        
+        def write(rows: List[np.ndarray]) -> None:
+            nonlocal peak_displacement
+            values = np.vstack([np.stack(rows, axis=1), np.zeros((1, len(rows)))])
+            displacements = values[recorded_position[node_dofs]].T
+            forces = element_end_forces(
+                matrices["T"][record["element_indices"]],
+                matrices["K_local"][record["element_indices"]],
+                values[recorded_position[element_dofs]]
+            )
+            self.result_store.write_time_history(
+                displacements.reshape(len(rows), len(node_ids), self.dof_per_node), forces
+            )
+            if displacements.size:
+                peak_displacement = max(peak_displacement, float(np.abs(displacements).max()))
+        
+        # 6. Step through the record, writing chunks and saving checkpoints
+        interval = self.analysis.checkpoint_interval or 0
+        chunk_steps = settings.TIME_HISTORY_CHUNK_STEPS
+        rows = [] if checkpoint else [U[free_position[recorded]]]
+        checkpoints = 0
+        
+        start = time.perf_counter()
+        for step in range(first_step, num_steps):
+            U, V, A = integrator.step(U, V, A, loads(step), loads(step + 1))
+            rows.append(U[free_position[recorded]])
             
-            # Transform to global coordinates
-            T = self._calculate_transformation_matrix(dx, dy, dz, L, element.angle)
-            K_element = T.T @ K_local @ T
-            
-            # Assemble into global stiffness matrix
-            dof_indices = self._get_element_dof_indices(element)
-            for i, row in enumerate(dof_indices):
-                for j, col in enumerate(dof_indices):
-                    K_global[row, col] += K_element[i, j]
+            at_checkpoint = interval and (step + 1) % interval == 0
+            if len(rows) >= chunk_steps or at_checkpoint or step + 1 == num_steps:
+                write(rows)
+                rows = []
+            if at_checkpoint and step + 1 < num_steps:
+                self.result_store.flush_time_history()
+                save_checkpoint(record["directory"], signature, step + 1, U, V, A, peak_displacement)
+                checkpoints += 1
+        if rows:
+            write(rows)
+        integration_time = time.perf_counter() - start
+        
+        logger.info(
+            f"Integrated {len(load)} DOFs over {num_steps - first_step} steps with "
+            f"{integration.value} in {integration_time:.3f} s"
+        )
         
-        return K_global
+        self.solver_statistics["time_history"] = {
+            "integration": integration.value,
+            "hht_alpha": alpha,
+            "num_steps": int(num_steps),
+            "first_step": int(first_step),
+            "direction": record["direction"],
+            "rayleigh_mass_coefficient": float(mass_coefficient),
+            "rayleigh_stiffness_coefficient": float(stiffness_coefficient),
+            "recorded_nodes": len(node_ids),
+            "recorded_elements": len(element_ids),
+            "peak_displacement": peak_displacement,
+            "checkpoints": checkpoints,
+            "factorization_time": factorization_time,
+            "integration_time": integration_time,
+        }
     
-    def _assemble_global_mass_matrix(self) -> np.ndarray:
+    def _run_buckling_analysis(self) -> None:
         """
-        Assemble the global mass matrix.
+        Run linear buckling analysis.
+        
+        Every load case and load combination is a reference load. Its axial
+        forces come from a static solve with the (cached) stiffness
+        factorization, which is reused by the eigensolver, so each reference
+        load costs one geometric stiffness assembly and a few Lanczos iterations.
         """
-        # Initialize global mass matrix
-        M_global = np.zeros((self.total_dof, self.total_dof))
+        if not self.load_cases:
+            return
         
-        # For each element
-        for element in self.elements:
-            # Get element properties
-            material = self.db.query(Material).filter(Material.id == element.material_id).first()
-            section = self.db.query(Section).filter(Section.id == element.section_id).first()
-            
-            # Get element nodes
-            start_node = self.db.query(Node).filter(Node.id == element.start_node_id).first()
-            end_node = self.db.query(Node).filter(Node.id == element.end_node_id).first()
+        start = time.perf_counter()
+        num_modes = self.analysis.num_modes or DEFAULT_BUCKLING_MODES
+        
+        # 1. Static solve of all reference loads with the stiffness factorization
+        F_global = self._assemble_load_matrix()
+        stiffness = self._get_stiffness_matrices()
+        K_reduced, F_reduced, bc_data = self._apply_boundary_conditions(stiffness, F_global)
+        factorization = self._factorize_stiffness_matrix(K_reduced)
+        U_reduced = factorization.solve(F_reduced)
+        U_reduced = np.hstack([U_reduced, U_reduced @ self.snapshot.combination_factor_matrix().T])
+        
+        reference_loads = (
+            [(load_case.id, None) for load_case in self.load_cases] +
+            [(None, load_combination.id) for load_combination in self.load_combinations]
+        )
+        self.analysis.mode_shape_node_ids = [node.id for node in self.nodes]
+        
+        # 2. Lowest positive load factors of every reference load
+        lowest = {}
+        for j, (load_case_id, load_combination_id) in enumerate(reference_loads):
+            _, Kg_global = self._calculate_geometric_stiffness(
+                self._recover_full_displacement_vector(U_reduced[:, j], bc_data)
+            )
+            Kg_reduced, _ = self._partition_matrix(Kg_global)
+            load_factors, modes = buckling_load_factors(K_reduced, Kg_reduced, factorization, num_modes)
             
-            # Calculate element length
-            dx = end_node.x - start_node.x
-            dy = end_node.y - start_node.y
-            dz = end_node.z - start_node.z
-            L = np.sqrt(dx**2 + dy**2 + dz**2)
+            self._store_buckling_results(load_factors, modes, bc_data, load_case_id, load_combination_id)
+            lowest[load_case_id or load_combination_id] = float(load_factors[0]) if len(load_factors) else None
+        
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"Buckling analysis of {len(reference_loads)} reference loads with {num_modes} modes "
+            f"in {elapsed:.3f} s"
+        )
+        
+        self.solver_statistics["buckling"] = {
+            "num_modes": num_modes,
+            "time": elapsed,
+            "lowest_load_factors": lowest,
+        }
+    
+    def _run_p_delta_analysis(self) -> None:
+        """
+        Run P-Delta analysis.
+        
+        The geometric stiffness depends on the axial forces of the loads acting
+        together, so every load case and every load combination is iterated
+        separately, starting from its linear solution. Results are stored like
+        those of a linear static analysis, with the iteration history of each
+        load case and combination in the solver statistics.
+        """
+        if not self.load_cases:
+            return
+        
+        start = time.perf_counter()
+        
+        # 1. Linear solution for all load cases with the (cached) stiffness factorization
+        F_global = self._assemble_load_matrix()
+        stiffness = self._get_stiffness_matrices()
+        K_reduced, F_reduced, bc_data = self._apply_boundary_conditions(stiffness, F_global)
+        U_linear = self._factorize_stiffness_matrix(K_reduced).solve(F_reduced)
+        
+        # 2. Load sets: every load case, then every load combination
+        factors = self.snapshot.combination_factor_matrix()
+        F_sets = np.hstack([F_global, F_global @ factors.T])
+        U_linear = np.hstack([U_linear, U_linear @ factors.T])
+        
+        constant_kg = bool(self.analysis.p_delta_constant_kg)
+        acceleration = AccelerationType(self.analysis.p_delta_acceleration or AccelerationType.ANDERSON)
+        tolerance = self.analysis.p_delta_tolerance or DEFAULT_P_DELTA_TOLERANCE
+        max_iterations = self.analysis.p_delta_max_iterations or DEFAULT_P_DELTA_MAX_ITERATIONS
+        
+        def geometric_stiffness(U_reduced: np.ndarray) -> sp.csr_matrix:
+            _, Kg_global = self._calculate_geometric_stiffness(
+                self._recover_full_displacement_vector(U_reduced, bc_data)
+            )
+            return self._partition_matrix(Kg_global)[0]
+        
+        def factorize_matrix(K: sp.csr_matrix) -> Factorization:
+            return factorize(
+                K,
+                self.analysis.linear_solver,
+                tolerance=self.analysis.solver_tolerance,
+                max_iterations=self.analysis.solver_max_iterations
+            )[0]
+        
+        # 3. Iterate every load set and recover its displacements, reactions and element forces
+        matrices = self._calculate_element_matrices()
+        U_global = np.zeros((self.total_dof, F_sets.shape[1]))
+        R_global = np.zeros((self.total_dof, F_sets.shape[1]))
+        forces = np.zeros((F_sets.shape[1], self.num_elements, len(ELEMENT_RESULT_POSITIONS), 6))
+        histories = []
+        
+        for j in range(F_sets.shape[1]):
+            U_reduced, history = solve_p_delta(
+                K_reduced,
+                F_sets[self.free_dofs, j],
+                U_linear[:, j],
+                geometric_stiffness,
+                factorize_matrix,
+                constant_kg=constant_kg,
+                acceleration=acceleration,
+                tolerance=tolerance,
+                max_iterations=max_iterations
+            )
+            histories.append(history)
             
-            # Calculate element mass matrix in local coordinates
-            M_local = self._calculate_element_mass_matrix(
-                L, material.density, section.area
+            U_global[:, j] = self._recover_full_displacement_vector(U_reduced, bc_data)
+            Kg_local, Kg_global = self._calculate_geometric_stiffness(U_global[:, j])
+            _, Kg_cf = self._partition_matrix(Kg_global)
+            R_global[self.constrained_dofs, j] = (
+                (bc_data["K_cf"] + Kg_cf) @ U_reduced - F_sets[self.constrained_dofs, j]
             )
+            forces[j] = element_end_forces(
+                matrices["T"], matrices["K_local"] + Kg_local, U_global[matrices["dof_indices"], j][:, :, None]
+            )[0]
+        
+        elapsed = time.perf_counter() - start
+        num_cases = len(self.load_cases)
+        load_case_ids = [load_case.id for load_case in self.load_cases]
+        load_combination_ids = [load_combination.id for load_combination in self.load_combinations]
+        
+        logger.info(
+            f"P-Delta analysis of {len(histories)} load cases and combinations in {elapsed:.3f} s "
+            f"({sum(h['iterations'] for h in histories)} iterations, "
+            f"{sum(h['factorizations'] for h in histories)} factorizations)"
+        )
+        
+        self.solver_statistics["p_delta"] = {
+            "constant_kg": constant_kg,
+            "acceleration": acceleration.value,
+            "tolerance": tolerance,
+            "max_iterations": max_iterations,
+            "iterations": sum(h["iterations"] for h in histories),
+            "factorizations": sum(h["factorizations"] for h in histories),
+            "time": elapsed,
+            "load_cases": dict(zip(load_case_ids, histories[:num_cases])),
+            "load_combinations": dict(zip(load_combination_ids, histories[num_cases:])),
+        }
+        
+        # 4. Store load case and load combination results
+        stresses = self._calculate_element_stresses(forces)
+        self._store_element_results(forces[:num_cases], stresses[:num_cases], load_case_ids=load_case_ids)
+        self._store_node_results(U_global[:, :num_cases], R_global[:, :num_cases], load_case_ids=load_case_ids)
+        
+        if self.load_combinations:
+            self._store_node_results(
+                U_global[:, num_cases:], R_global[:, num_cases:], load_combination_ids=load_combination_ids
+            )
+            self._store_element_results(
+                forces[num_cases:], stresses[num_cases:], load_combination_ids=load_combination_ids
+            )
+    
+    def _collect_element_data(self) -> Dict[str, np.ndarray]:
+        """
+        Gather element geometry, properties and DOF indices into arrays for the batched kernels.
+        """
+        data = self.snapshot.element_properties()
+        element_nodes = self.node_position[self.snapshot.element_nodes]
+        data["dof_indices"] = element_dof_indices(
+            element_nodes[:, 0], element_nodes[:, 1], self.dof_per_node
+        )
+        
+        return data
+    
+    def _calculate_element_matrices(self) -> Dict[str, np.ndarray]:
+        """
+        Calculate the (n_elem, 12, 12) transformation, local and global element stiffness matrices.
+        
+        The result is cached together with the element DOF indices.
+        """
+        if self._element_matrices is None:
+            cached = stiffness_cache.get(self.model_hash)
+            if cached is not None:
+                self._element_matrices = cached["element_matrices"]
+                return self._element_matrices
             
-            # Transform to global coordinates
-            T = self._calculate_transformation_matrix(dx, dy, dz, L, element.angle)
-            M_element = T.T @ M_local @ T
+            data = self._collect_element_data()
+            self._element_matrices = {**element_stiffness_kernel(data), "dof_indices": data["dof_indices"]}
+        
+        return self._element_matrices
+    
+    def _calculate_element_stiffness_matrices(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate the (n_elem, 12, 12) global-coordinate element stiffness matrices and their DOF indices.
+        """
+        matrices = self._calculate_element_matrices()
+        
+        return matrices["K_global"], matrices["dof_indices"]
+    
+    def _assemble_global_stiffness_matrix(self) -> sp.csr_matrix:
+        """
+        Assemble the global stiffness matrix in sparse (CSR) format.
+        
+        Element matrices that are not calculated yet are calculated by the
+        assembly workers, chunk by chunk, and kept for result recovery.
+        """
+        if self._element_matrices is None:
+            data = self._collect_element_data()
+            K_global, matrices = self._assemble_element_kernel(
+                element_stiffness_kernel, data, "K_global", keep=("T", "K_local", "K_global")
+            )
+            self._element_matrices = {**matrices, "dof_indices": data["dof_indices"]}
+            return K_global
+        
+        K_elements, dof_indices = self._calculate_element_stiffness_matrices()
+        
+        # Assemble into global stiffness matrix
+        return self._assemble_matrix(K_elements, dof_indices)
+    
+    def _assemble_element_kernel(
+        self, kernel: ElementKernel, data: Dict[str, np.ndarray], assemble: str, keep: Tuple[str, ...] = ()
+    ) -> Tuple[sp.csr_matrix, Dict[str, np.ndarray]]:
+        """
+        Calculate element matrices with a batched kernel and assemble one of them, in parallel chunks for large models.
+        """
+        return assemble_element_kernel_parallel(
+            kernel,
+            {key: data[key] for key in ELEMENT_KERNEL_INPUTS},
+            data["dof_indices"],
+            self.total_dof,
+            settings.ASSEMBLY_CHUNK_SIZE,
+            max_workers=settings.ASSEMBLY_WORKERS or settings.ANALYSIS_WORKERS or None,
+            assemble=assemble,
+            keep=keep
+        )
+    
+    def _assemble_matrix(self, element_matrices: np.ndarray, dof_indices: np.ndarray) -> sp.csr_matrix:
+        """
+        Assemble element matrices into a global matrix, in parallel chunks for large models.
+        """
+        return assemble_sparse_matrix_parallel(
+            element_matrices,
+            dof_indices,
+            self.total_dof,
+            settings.ASSEMBLY_CHUNK_SIZE,
+            max_workers=settings.ASSEMBLY_WORKERS or settings.ANALYSIS_WORKERS or None
+        )
+    
+    @property
+    def model_hash(self) -> str:
+        """
+        Hash of everything the stiffness matrix depends on, in DOF order.
+        
+        Covers node coordinates and restraints, element connectivity, section and
+        material properties and element angles.
+        """
+        if self._model_hash is None:
+            data = self.snapshot.element_properties()
+            self._model_hash = model_hash([
+                np.array([self.dof_per_node]),
+                self.snapshot.node_coordinates[self.node_order],
+                self.snapshot.node_restraints[self.node_order],
+                self.node_position[self.snapshot.element_nodes],
+                *(data[key] for key in ("E", "nu", "A", "Iy", "Iz", "J", "angle")),
+            ])
+        
+        return self._model_hash
+    
+    @property
+    def topology_hash(self) -> str:
+        """
+        Hash of the node coordinates, restraints and element connectivity, in DOF order.
+        
+        Models with the same topology differ only in element properties, so their
+        stiffness matrices differ by a sum of element contributions.
+        """
+        if self._topology_hash is None:
+            self._topology_hash = model_hash([
+                np.array([self.dof_per_node]),
+                self.snapshot.node_coordinates[self.node_order],
+                self.snapshot.node_restraints[self.node_order],
+                self.node_position[self.snapshot.element_nodes],
+            ])
+        
+        return self._topology_hash
+    
+    def _get_stiffness_matrices(self) -> Dict[str, Any]:
+        """
+        Get the element matrices, the global stiffness matrix and its free/constrained partition.
+        
+        They are taken from the stiffness cache when the model is unchanged since a
+        previous analysis, otherwise assembled and cached.
+        """
+        stiffness = stiffness_cache.get(self.model_hash)
+        
+        if stiffness is None:
+            K_global = self._assemble_global_stiffness_matrix()
+            element_matrices = self._calculate_element_matrices()
+            K_reduced, K_cf = self._partition_matrix(K_global)
             
-            # Assemble into global mass matrix
-            dof_indices = self._get_element_dof_indices(element)
-            for i, row in enumerate(dof_indices):
-                for j, col in enumerate(dof_indices):
-                    M_global[row, col] += M_element[i, j]
+            stiffness = {
+                "element_matrices": element_matrices,
+                "K_global": K_global,
+                "K_reduced": K_reduced,
+                "K_cf": K_cf,
+            }
+            stiffness_cache.put(self.model_hash, stiffness, persist=True)
+            self.solver_statistics["stiffness_cache"] = "miss"
+        else:
+            logger.info(f"Reusing cached stiffness matrix for model {self.model_hash[:12]}")
+            self.solver_statistics["stiffness_cache"] = "hit"
         
-        return M_global
+        return stiffness
+    
+    def _assemble_global_mass_matrix(self) -> sp.csr_matrix:
+        """
+        Assemble the global mass matrix in sparse (CSR) format.
+        """
+        return self._assemble_element_kernel(element_mass_kernel, self._collect_element_data(), "M_global")[0]
+    
+    def _assemble_load_matrix(self) -> np.ndarray:
+        """
+        Assemble the (total_dof, n_load_cases) matrix of load vectors, one column per load case.
+        """
+        # Nodal loads for every load case, built once from the snapshot
+        if self._load_matrix is None:
+            self._load_matrix = self.snapshot.nodal_load_matrix(self.dof_per_node, self.node_position)
+        
+        # Element loads (distributed, etc.) are not yet supported
+        return self._load_matrix.copy()
     
     def _assemble_load_vector(self, load_case_id: str) -> np.ndarray:
         """
         Assemble the load vector for a given load case.
         """
-        # Initialize load vector
-        F_global = np.zeros(self.total_dof)
-        
-        # Get loads for this load case
-        loads = self.db.query(Load).filter(
-            Load.load_case_id == load_case_id,
-            Load.project_id == self.project_id
-        ).all()
-        
-        # Process nodal loads
-        for load in loads:
-            if load.node_id:
-                node_index = self.node_map.get(load.node_id)
-                if node_index is not None:
-                    dof_start = node_index * self.dof_per_node
-                    
-                    # Apply forces
-                    if load.fx is not None:
-                        F_global[dof_start] += load.fx
-                    if load.fy is not None:
-                        F_global[dof_start + 1] += load.fy
-                    if load.fz is not None:
-                        F_global[dof_start + 2] += load.fz
-                    
-                    # Apply moments
-                    if load.mx is not None:
-                        F_global[dof_start + 3] += load.mx
-                    if load.my is not None:
-                        F_global[dof_start + 4] += load.my
-                    if load.mz is not None:
-                        F_global[dof_start + 5] += load.mz
+        return self._assemble_load_matrix()[:, self.snapshot.load_case_index[load_case_id]]
+    
+    def _factorize_stiffness_matrix(self, K_reduced: sp.csr_matrix) -> Factorization:
+        """
+        Factorize the reduced stiffness matrix once for reuse across right-hand sides.
+        
+        The backend is chosen automatically unless the analysis overrides it. The
+        factorization is cached with the model hash and solver options, so repeat
+        runs on an unchanged model skip it.
+        """
+        options = (
+            f"{self.analysis.linear_solver}:{self.analysis.solver_tolerance}:"
+            f"{self.analysis.solver_max_iterations}"
+        )
+        key = f"{self.model_hash}:factorization:{options}"
+        cached = stiffness_cache.get(key)
+        
+        if cached is None and self.analysis.incremental_reanalysis:
+            cached = self._update_factorization(K_reduced, f"{self.topology_hash}:base:{options}")
+            if cached is not None:
+                stiffness_cache.put(key, cached)
+                self.solver_statistics["factorization_cache"] = "incremental"
+                return cached["factorization"]
+        
+        if cached is None:
+            factorization, backend, elapsed = factorize(
+                K_reduced,
+                self.analysis.linear_solver,
+                tolerance=self.analysis.solver_tolerance,
+                max_iterations=self.analysis.solver_max_iterations
+            )
+            cached = {"factorization": factorization, "linear_solver": backend.name}
+            stiffness_cache.put(key, cached)
+            self.solver_statistics["factorization_cache"] = "miss"
             
-            # Process element loads (distributed, etc.)
-            elif load.element_id:
-                # Implementation for element loads
-                pass
+            # Keep the factorization as the base for incremental re-analysis of this topology
+            if self.analysis.incremental_reanalysis:
+                stiffness_cache.put(f"{self.topology_hash}:base:{options}", {
+                    **cached, "element_matrices": self._calculate_element_stiffness_matrices()[0]
+                })
+        else:
+            elapsed = 0.0
+            self.solver_statistics["factorization_cache"] = "hit"
+        
+        self.solver_statistics.update({
+            "linear_solver": cached["linear_solver"],
+            "num_dof": int(K_reduced.shape[0]),
+            "factorization_time": elapsed,
+        })
         
-        return F_global
+        return cached["factorization"]
     
-    def _apply_boundary_conditions(
-        self, K_global: np.ndarray, F_global: np.ndarray
-    ) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+    def _update_factorization(self, K_reduced: sp.csr_matrix, base_key: str) -> Optional[Dict[str, Any]]:
         """
-        Apply boundary conditions to the global stiffness matrix and load vector.
+        Update the base factorization of this topology with the changed elements' stiffness.
+        
+        Returns None, so that the caller refactorizes, when there is no base, the
+        rank of the update exceeds INCREMENTAL_MAX_RANK or the dense update
+        would not fit the factorization memory budget.
         """
-        # Identify constrained DOFs
-        constrained_dofs = []
-        for i, node in enumerate(self.nodes):
-            if node.is_support:
-                dof_start = i * self.dof_per_node
+        base = stiffness_cache.get(base_key)
+        if base is None:
+            return None
+        
+        start = time.perf_counter()
+        
+        # 1. Find the elements whose stiffness changed since the base factorization
+        K_elements, dof_indices = self._calculate_element_stiffness_matrices()
+        changed = changed_elements(base["element_matrices"], K_elements)
+        
+        # 2. Express the change as dK = P D P^T on the free DOFs
+        reduced_index = np.full(self.total_dof, -1)
+        reduced_index[self.free_dofs] = np.arange(len(self.free_dofs))
+        dofs, D = low_rank_update(
+            K_elements[changed] - base["element_matrices"][changed], dof_indices[changed], reduced_index
+        )
+        
+        self.solver_statistics.update({
+            "changed_elements": int(len(changed)),
+            "update_rank": int(len(dofs)),
+        })
+        
+        if len(dofs) > settings.INCREMENTAL_MAX_RANK:
+            logger.info(
+                f"Update of rank {len(dofs)} from {len(changed)} changed elements exceeds "
+                f"{settings.INCREMENTAL_MAX_RANK}; refactorizing"
+            )
+            return None
+        
+        if not woodbury_fits(K_reduced.shape[0], len(dofs)):
+            logger.info(f"Update of rank {len(dofs)} does not fit the memory budget; refactorizing")
+            return None
+        
+        # 3. Re-solve through the Woodbury identity with the base factorization
+        factorization = WoodburyFactorization(base["factorization"], K_reduced.shape[0], dofs, D)
+        elapsed = time.perf_counter() - start
+        
+        logger.info(
+            f"Updated factorization with rank {len(dofs)} from {len(changed)} changed elements "
+            f"in {elapsed:.3f} s"
+        )
+        
+        self.solver_statistics.update({
+            "linear_solver": base["linear_solver"],
+            "num_dof": int(K_reduced.shape[0]),
+            "factorization_time": elapsed,
+        })
+        
+        return {"factorization": factorization, "linear_solver": base["linear_solver"]}
+    
+    def _find_substructures(self) -> List[List[Substructure]]:
+        """
+        Find the repeated stories, grouped into sets of identical stories.
+        """
+        if self._substructures is None:
+            data = self.snapshot.element_properties()
+            properties = np.stack([data[key] for key in ("E", "nu", "A", "Iy", "Iz", "J", "angle")], axis=1)
+            fixed = (
+                self.snapshot.node_restraints[self.node_order].any(axis=1)
+                | self.snapshot.node_is_support[self.node_order]
+            )
+            
+            self._substructures = find_repeated_stories(
+                self.snapshot.node_coordinates[self.node_order],
+                self.node_position[self.snapshot.element_nodes],
+                properties,
+                fixed
+            )
+        
+        return self._substructures
+    
+    def _solve_with_superelements(self, F_global: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Solve K U = F with repeated stories condensed to superelements.
+        
+        Each group of identical stories is condensed once; the condensed matrix is
+        scattered for every repetition, the global system is solved for the
+        remaining DOFs and the interior displacements are recovered per story.
+        """
+        groups = self._find_substructures()
+        K_elements, dof_indices = self._calculate_element_stiffness_matrices()
+        element_nodes = self.node_position[self.snapshot.element_nodes]
+        
+        # 1. Condense each unique story once
+        start = time.perf_counter()
+        superelements = [
+            build_superelement(group[0], K_elements, element_nodes, self.dof_per_node) for group in groups
+        ]
+        condensation_time = time.perf_counter() - start
+        
+        # 2. Assemble the remaining elements and the condensed matrix of every repetition
+        in_substructure = np.zeros(self.num_elements, dtype=bool)
+        interior_mask = np.zeros(self.total_dof, dtype=bool)
+        rows, cols, values = [], [], []
+        for superelement, group in zip(superelements, groups):
+            for substructure in group:
+                in_substructure[substructure.elements] = True
+                interior_mask[substructure.dofs(substructure.interior, self.dof_per_node)] = True
                 
-                # Check each DOF constraint
-                if node.restraint_x:
-                    constrained_dofs.append(dof_start)
-                if node.restraint_y:
-                    constrained_dofs.append(dof_start + 1)
-                if node.restraint_z:
-                    constrained_dofs.append(dof_start + 2)
-                if node.restraint_rx:
-                    constrained_dofs.append(dof_start + 3)
-                if node.restraint_ry:
-                    constrained_dofs.append(dof_start + 4)
-                if node.restraint_rz:
-                    constrained_dofs.append(dof_start + 5)
-        
-        # Get free DOFs
-        all_dofs = set(range(self.total_dof))
-        free_dofs = list(all_dofs - set(constrained_dofs))
-        
-        # Reduce matrices
-        K_reduced = K_global[np.ix_(free_dofs, free_dofs)]
-        F_reduced = F_global[free_dofs]
-        
-        # Store boundary condition data for recovery
+                boundary = substructure.dofs(~substructure.interior, self.dof_per_node)
+                condensed = superelement.condensed.tocoo()
+                rows.append(boundary[condensed.row])
+                cols.append(boundary[condensed.col])
+                values.append(condensed.data)
+        
+        K_global = assemble_sparse_matrix(
+            K_elements[~in_substructure], dof_indices[~in_substructure], self.total_dof
+        ) + sp.coo_matrix(
+            (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(self.total_dof, self.total_dof)
+        ).tocsr()
+        
+        retained = np.flatnonzero(~self.constrained_mask & ~interior_mask)
+        K_retained = sp.csc_matrix(K_global)[:, retained].tocsr()[retained]
+        
+        # 3. Condense interior loads to the story boundaries
+        F_condensed = F_global.copy()
+        for superelement, group in zip(superelements, groups):
+            for substructure in group:
+                F_i = F_global[substructure.dofs(substructure.interior, self.dof_per_node)]
+                F_condensed[substructure.dofs(~substructure.interior, self.dof_per_node)] += (
+                    superelement.condense_loads(F_i)
+                )
+        
+        # 4. Solve the condensed system
+        factorization, backend, elapsed = factorize(
+            K_retained,
+            self.analysis.linear_solver,
+            tolerance=self.analysis.solver_tolerance,
+            max_iterations=self.analysis.solver_max_iterations
+        )
+        U_global = np.zeros(F_global.shape)
+        U_global[retained] = factorization.solve(F_condensed[retained])
+        
+        # 5. Recover interior displacements story by story
+        for superelement, group in zip(superelements, groups):
+            for substructure in group:
+                interior = substructure.dofs(substructure.interior, self.dof_per_node)
+                boundary = substructure.dofs(~substructure.interior, self.dof_per_node)
+                U_global[interior] = superelement.recover_interior(F_global[interior], U_global[boundary])
+        
+        logger.info(
+            f"Condensed {sum(len(group) for group in groups)} stories with {len(groups)} superelements "
+            f"({int(interior_mask.sum())} interior DOFs) in {condensation_time:.3f} s"
+        )
+        
+        self.solver_statistics.update({
+            "linear_solver": backend.name,
+            "num_dof": int(len(retained)),
+            "factorization_time": elapsed,
+            "superelements": len(groups),
+            "substructures": sum(len(group) for group in groups),
+            "condensed_dof": int(interior_mask.sum()),
+            "condensation_time": condensation_time,
+        })
+        
+        # Reactions from element-by-element products, since the full K is not assembled
+        operator = ElementOperator(K_elements, dof_indices, ~self.constrained_mask, self.dof_per_node)
         bc_data = {
-            "free_dofs": free_dofs,
-            "constrained_dofs": constrained_dofs
+            "free_dofs": self.free_dofs,
+            "constrained_dofs": self.constrained_dofs,
+            "K_cf": operator.coupling_operator(),
+            "F_c": F_global[self.constrained_dofs]
+        }
+        
+        return U_global[self.free_dofs], bc_data
+    
+    def _solve_domain_decomposition(self, F_global: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Solve K U = F by domain decomposition across worker processes.
+        
+        The element graph is bisected into subdomains (one per worker unless
+        num_subdomains is set), whose interiors are condensed and recovered in
+        parallel around a single interface solve.
+        """
+        K_elements, dof_indices = self._calculate_element_stiffness_matrices()
+        workers = settings.ANALYSIS_WORKERS or os.cpu_count() or 1
+        num_subdomains = self.analysis.num_subdomains or workers
+        
+        U_global, statistics = solve_domain_decomposition(
+            K_elements,
+            dof_indices,
+            self.node_position[self.snapshot.element_nodes],
+            ~self.constrained_mask,
+            F_global,
+            num_subdomains,
+            max_workers=min(workers, num_subdomains),
+            dof_per_node=self.dof_per_node,
+            linear_solver=self.analysis.linear_solver,
+            tolerance=self.analysis.solver_tolerance,
+            max_iterations=self.analysis.solver_max_iterations
+        )
+        
+        self.solver_statistics.update({
+            "linear_solver": LinearSolverType.DOMAIN_DECOMPOSITION.value,
+            "num_dof": int(len(self.free_dofs)),
+            "workers": min(workers, num_subdomains),
+            **statistics,
+        })
+        
+        # Reactions from element-by-element products, since the full K is not assembled
+        operator = ElementOperator(K_elements, dof_indices, ~self.constrained_mask, self.dof_per_node)
+        bc_data = {
+            "free_dofs": self.free_dofs,
+            "constrained_dofs": self.constrained_dofs,
+            "K_cf": operator.coupling_operator(),
+            "F_c": F_global[self.constrained_dofs]
+        }
+        
+        return U_global[self.free_dofs], bc_data
+    
+    def _solve_matrix_free(self, F_global: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Solve K U = F for all load cases with matrix-free preconditioned conjugate gradients.
+        
+        K is applied element by element from the cached element matrices, so memory
+        stays linear in the number of elements.
+        """
+        K_elements, dof_indices = self._calculate_element_stiffness_matrices()
+        operator = ElementOperator(K_elements, dof_indices, ~self.constrained_mask, self.dof_per_node)
+        
+        # Preconditioner from the nodal diagonal blocks or the point diagonal of K
+        preconditioner = PreconditionerType(self.analysis.preconditioner or PreconditionerType.BLOCK_JACOBI)
+        if preconditioner == PreconditionerType.JACOBI:
+            apply_M = jacobi_preconditioner(operator)
+        else:
+            apply_M = block_jacobi_preconditioner(operator)
+        
+        tolerance = self.analysis.solver_tolerance or DEFAULT_TOLERANCE
+        max_iterations = self.analysis.solver_max_iterations or DEFAULT_MAX_ITERATIONS
+        factorization = IterativeFactorization(operator.matvec, apply_M, tolerance, max_iterations)
+        
+        start = time.perf_counter()
+        U_reduced = factorization.solve(F_global[operator.free_dofs])
+        elapsed = time.perf_counter() - start
+        
+        logger.info(
+            f"Solved {operator.num_free} DOFs matrix-free with {preconditioner.value} PCG in {elapsed:.3f} s "
+            f"(iterations per load case: {factorization.iterations})"
+        )
+        
+        self.solver_statistics.update({
+            "linear_solver": LinearSolverType.MATRIX_FREE_PCG.value,
+            "preconditioner": preconditioner.value,
+            "num_dof": int(operator.num_free),
+            "tolerance": tolerance,
+            "max_iterations": max_iterations,
+            "iterations": factorization.iterations,
+            "solve_time": elapsed,
+        })
+        
+        bc_data = {
+            "free_dofs": self.free_dofs,
+            "constrained_dofs": self.constrained_dofs,
+            "K_cf": operator.coupling_operator(),
+            "F_c": F_global[self.constrained_dofs]
+        }
+        
+        return U_reduced, bc_data
+    
+    def _partition_matrix(self, A: sp.spmatrix) -> Tuple[sp.csr_matrix, sp.csr_matrix]:
+        """
+        Split a global matrix into its free-free and constrained-free blocks.
+        
+        Columns are selected on the CSC form and rows on the CSR form, so the
+        partition stays sparse.
+        """
+        A_free_columns = sp.csc_matrix(A)[:, self.free_dofs].tocsr()
+        
+        return A_free_columns[self.free_dofs], A_free_columns[self.constrained_dofs]
+    
+    def _apply_boundary_conditions(
+        self, stiffness: Dict[str, Any], F_global: np.ndarray
+    ) -> Tuple[sp.csr_matrix, np.ndarray, Dict[str, Any]]:
+        """
+        Apply boundary conditions to the partitioned stiffness matrix and load vector.
+        """
+        K_reduced, K_cf = stiffness["K_reduced"], stiffness["K_cf"]
+        F_reduced = F_global[self.free_dofs]
+        
+        # Store boundary condition data for recovery of displacements and reactions
+        bc_data = {
+            "free_dofs": self.free_dofs,
+            "constrained_dofs": self.constrained_dofs,
+            "K_cf": K_cf,
+            "F_c": F_global[self.constrained_dofs]
         }
         
         return K_reduced, F_reduced, bc_data
     
     def _apply_boundary_conditions_modal(
-        self, K_global: np.ndarray, M_global: np.ndarray
-    ) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+        self, stiffness: Dict[str, Any], M_global: sp.csr_matrix
+    ) -> Tuple[sp.csr_matrix, sp.csr_matrix, Dict[str, Any]]:
         """
         Apply boundary conditions for modal analysis.
         """
-        # Identify constrained DOFs (similar to _apply_boundary_conditions)
-        constrained_dofs = []
-        for i, node in enumerate(self.nodes):
-            if node.is_support:
-                dof_start = i * self.dof_per_node
-                
-                # Check each DOF constraint
-                if node.restraint_x:
-                    constrained_dofs.append(dof_start)
-                if node.restraint_y:
-                    constrained_dofs.append(dof_start + 1)
-                if node.restraint_z:
-                    constrained_dofs.append(dof_start + 2)
-                if node.restraint_rx:
-                    constrained_dofs.append(dof_start + 3)
-                if node.restraint_ry:
-                    constrained_dofs.append(dof_start + 4)
-                if node.restraint_rz:
-                    constrained_dofs.append(dof_start + 5)
-        
-        # Get free DOFs
-        all_dofs = set(range(self.total_dof))
-        free_dofs = list(all_dofs - set(constrained_dofs))
-        
-        # Reduce matrices
-        K_reduced = K_global[np.ix_(free_dofs, free_dofs)]
-        M_reduced = M_global[np.ix_(free_dofs, free_dofs)]
-        
-        # Store boundary condition data for recovery
+        K_reduced = stiffness["K_reduced"]
+        M_reduced, _ = self._partition_matrix(M_global)
+        
         bc_data = {
-            "free_dofs": free_dofs,
-            "constrained_dofs": constrained_dofs
+            "free_dofs": self.free_dofs,
+            "constrained_dofs": self.constrained_dofs,
+            "K_cf": stiffness["K_cf"]
         }
         
         return K_reduced, M_reduced, bc_data
@@ -414,329 +1544,191 @@ class StructuralAnalysisSolver:
         self, U_reduced: np.ndarray, bc_data: Dict[str, Any]
     ) -> np.ndarray:
         """
-        Recover the full displacement vector from the reduced solution.
+        Recover the full displacement vector (or matrix, one column per load case) from the reduced solution.
         """
-        # Initialize full displacement vector with zeros
-        U_global = np.zeros(self.total_dof)
-        
-        # Fill in the computed displacements
-        for i, dof in enumerate(bc_data["free_dofs"]):
-            U_global[dof] = U_reduced[i]
+        U_global = np.zeros((self.total_dof,) + U_reduced.shape[1:])
+        U_global[bc_data["free_dofs"]] = U_reduced
         
         return U_global
     
-    def _calculate_element_results(
-        self, U_global: np.ndarray, load_case_id: Optional[str] = None, load_combination_id: Optional[str] = None
+    def _calculate_reactions(self, U_reduced: np.ndarray, bc_data: Dict[str, Any]) -> np.ndarray:
+        """
+        Calculate support reactions R_c = K_cf U_f - F_c, scattered to a full-size vector or matrix.
+        
+        Entries at free DOFs are zero.
+        """
+        R_global = np.zeros((self.total_dof,) + U_reduced.shape[1:])
+        R_global[bc_data["constrained_dofs"]] = bc_data["K_cf"] @ U_reduced - bc_data["F_c"]
+        
+        return R_global
+    
+    def _calculate_element_forces(self, U_global: np.ndarray) -> np.ndarray:
+        """
+        Calculate local element end forces for every element and load case.
+        
+        ``U_global`` is (total_dof, n_cases); the result is (n_cases, n_elem, 2, 6)
+        with positions ELEMENT_RESULT_POSITIONS and columns ELEMENT_FORCE_COLUMNS.
+        """
+        matrices = self._calculate_element_matrices()
+        if U_global.ndim == 1:
+            U_global = U_global[:, None]
+        
+        # Gather element displacements with one fancy-index: (n_elem, 12, n_cases)
+        U_elements = U_global[matrices["dof_indices"]]
+        
+        return element_end_forces(matrices["T"], matrices["K_local"], U_elements)
+    
+    def _calculate_geometric_stiffness(self, U_global: np.ndarray) -> Tuple[np.ndarray, sp.csr_matrix]:
+        """
+        Calculate the local element geometric stiffness matrices and the global Kg for one displacement vector.
+        
+        Axial forces (positive in tension) are taken from the linear element end forces.
+        """
+        matrices = self._calculate_element_matrices()
+        data = self._collect_element_data()
+        
+        P = -self._calculate_element_forces(U_global)[0, :, 0, 0]
+        Kg_local = element_geometric_stiffness_matrices(data["L"], P, data["A"], data["Iy"], data["Iz"])
+        
+        return Kg_local, self._assemble_matrix(transform_to_global(matrices["T"], Kg_local), matrices["dof_indices"])
+    
+    def _calculate_element_stresses(self, forces: np.ndarray) -> np.ndarray:
+        """
+        Calculate element stresses (columns ELEMENT_STRESS_COLUMNS) from element end forces.
+        """
+        section = self.snapshot.element_section
+        
+        return element_stresses(
+            forces,
+            self.snapshot.section_area[section],
+            self.snapshot.section_elastic_modulus_y[section],
+            self.snapshot.section_elastic_modulus_z[section]
+        )
+    
+    def _store_element_results(
+        self,
+        forces: np.ndarray,
+        stresses: np.ndarray,
+        load_case_ids: Optional[List[str]] = None,
+        load_combination_ids: Optional[List[str]] = None
     ) -> None:
         """
-        Calculate element forces and stresses from the displacement vector.
+        Store (n_cases, n_elem, n_positions, ...) element forces and stresses, one row per element and position.
         """
-        # For each element
-        for element in self.elements:
-            # Get element properties
-            material = self.db.query(Material).filter(Material.id == element.material_id).first()
-            section = self.db.query(Section).filter(Section.id == element.section_id).first()
-            
-            # Get element nodes
-            start_node = self.db.query(Node).filter(Node.id == element.start_node_id).first()
-            end_node = self.db.query(Node).filter(Node.id == element.end_node_id).first()
-            
-            # Calculate element length and direction cosines
-            dx = end_node.x - start_node.x
-            dy = end_node.y - start_node.y
-            dz = end_node.z - start_node.z
-            L = np.sqrt(dx**2 + dy**2 + dz**2)
-            
-            # Get element DOF indices
-            dof_indices = self._get_element_dof_indices(element)
-            
-            # Extract element displacements
-            U_element = U_global[dof_indices]
-            
-            # Transform to local coordinates
-            T = self._calculate_transformation_matrix(dx, dy, dz, L, element.angle)
-            U_local = T @ U_element
-            
-            # Calculate element forces in local coordinates
-            K_local = self._calculate_element_stiffness_matrix(
-                L, material.elastic_modulus, section.area, 
-                section.moment_of_inertia_y, section.moment_of_inertia_z, 
-                section.torsional_constant, material.poisson_ratio
-            )
-            F_local = K_local @ U_local
-            
-            # Calculate stresses
-            axial_force = F_local[0]  # Axial force at start node
-            shear_force_y = F_local[1]  # Shear force in y direction at start node
-            shear_force_z = F_local[2]  # Shear force in z direction at start node
-            torsional_moment = F_local[3]  # Torsional moment at start node
-            bending_moment_y = F_local[4]  # Bending moment about y axis at start node
-            bending_moment_z = F_local[5]  # Bending moment about z axis at start node
-            
-            # Calculate stresses
-            axial_stress = axial_force / section.area
-            bending_stress_y = bending_moment_y / section.elastic_modulus_y
-            bending_stress_z = bending_moment_z / section.elastic_modulus_z
-            
-            # Store results at start of element (position = 0.0)
-            element_result_start = ElementResult(
-                analysis_id=self.analysis_id,
-                element_id=element.id,
-                load_case_id=load_case_id,
-                load_combination_id=load_combination_id,
-                position=0.0,
-                axial_force=axial_force,
-                shear_force_y=shear_force_y,
-                shear_force_z=shear_force_z,
-                torsional_moment=torsional_moment,
-                bending_moment_y=bending_moment_y,
-                bending_moment_z=bending_moment_z,
-                axial_stress=axial_stress,
-                bending_stress_y=bending_stress_y,
-                bending_stress_z=bending_stress_z,
-                von_mises_stress=np.sqrt(axial_stress**2 + 3 * (bending_stress_y**2 + bending_stress_z**2))
-            )
-            self.db.add(element_result_start)
-            
-            # Calculate and store results at end of element (position = 1.0)
-            # Note: For a beam element, the end forces are related to the start forces
-            axial_force_end = -F_local[6]  # Axial force at end node
-            shear_force_y_end = -F_local[7]  # Shear force in y direction at end node
-            shear_force_z_end = -F_local[8]  # Shear force in z direction at end node
-            torsional_moment_end = -F_local[9]  # Torsional moment at end node
-            bending_moment_y_end = -F_local[10]  # Bending moment about y axis at end node
-            bending_moment_z_end = -F_local[11]  # Bending moment about z axis at end node
-            
-            # Calculate stresses at end
-            axial_stress_end = axial_force_end / section.area
-            bending_stress_y_end = bending_moment_y_end / section.elastic_modulus_y
-            bending_stress_z_end = bending_moment_z_end / section.elastic_modulus_z
-            
-            element_result_end = ElementResult(
-                analysis_id=self.analysis_id,
-                element_id=element.id,
-                load_case_id=load_case_id,
-                load_combination_id=load_combination_id,
-                position=1.0,
-                axial_force=axial_force_end,
-                shear_force_y=shear_force_y_end,
-                shear_force_z=shear_force_z_end,
-                torsional_moment=torsional_moment_end,
-                bending_moment_y=bending_moment_y_end,
-                bending_moment_z=bending_moment_z_end,
-                axial_stress=axial_stress_end,
-                bending_stress_y=bending_stress_y_end,
-                bending_stress_z=bending_stress_z_end,
-                von_mises_stress=np.sqrt(axial_stress_end**2 + 3 * (bending_stress_y_end**2 + bending_stress_z_end**2))
-            )
-            self.db.add(element_result_end)
-            
-            # Optionally, calculate and store results at midpoint (position = 0.5)
-            # This would require interpolation of the results
-            
-            self.db.commit()
+        if self.result_store is not None:
+            self.result_store.add_element_results(forces, stresses, load_case_ids, load_combination_ids)
+            return
+        
+        num_cases, num_elements, num_positions = forces.shape[:3]
+        rows_per_case = num_elements * num_positions
+        values = np.concatenate([forces, stresses], axis=-1).reshape(-1, forces.shape[-1] + stresses.shape[-1])
+        
+        columns = {
+            "analysis_id": self.analysis_id,
+            "element_id": np.tile(
+                np.repeat([element.id for element in self.elements], num_positions), num_cases
+            ),
+            "load_case_id": np.repeat(load_case_ids, rows_per_case) if load_case_ids else None,
+            "load_combination_id": (
+                np.repeat(load_combination_ids, rows_per_case) if load_combination_ids else None
+            ),
+            "position": np.tile(ELEMENT_RESULT_POSITIONS, num_cases * num_elements),
+        }
+        for k, column in enumerate(ELEMENT_FORCE_COLUMNS + ELEMENT_STRESS_COLUMNS):
+            columns[column] = values[:, k]
+        
+        self.result_writer.write(ElementResult, columns, num_cases * rows_per_case)
     
     def _store_node_results(
-        self, U_global: np.ndarray, load_case_id: Optional[str] = None, load_combination_id: Optional[str] = None
+        self,
+        U_global: np.ndarray,
+        reactions: np.ndarray,
+        load_case_ids: Optional[List[str]] = None,
+        load_combination_ids: Optional[List[str]] = None
     ) -> None:
         """
-        Store node displacements and reactions.
+        Store node displacements and support reactions, one row per node and load case or combination.
+        
+        ``U_global`` and ``reactions`` are (total_dof, n_cases); reactions are only stored for support nodes.
         """
-        # For each node
-        for i, node in enumerate(self.nodes):
-            dof_start = i * self.dof_per_node
-            
-            # Extract displacements
-            dx = U_global[dof_start]
-            dy = U_global[dof_start + 1]
-            dz = U_global[dof_start + 2]
-            rx = U_global[dof_start + 3]
-            ry = U_global[dof_start + 4]
-            rz = U_global[dof_start + 5]
-            
-            # For support nodes, calculate reactions
-            fx, fy, fz, mx, my, mz = None, None, None, None, None, None
-            if node.is_support:
-                # Reactions are calculated from the global stiffness matrix and displacements
-                # This is a simplified approach; in practice, you would use the element forces
-                pass
-            
-            # Store node result
-            node_result = NodeResult(
-                analysis_id=self.analysis_id,
-                node_id=node.id,
-                load_case_id=load_case_id,
-                load_combination_id=load_combination_id,
-                dx=dx,
-                dy=dy,
-                dz=dz,
-                rx=rx,
-                ry=ry,
-                rz=rz,
-                fx=fx,
-                fy=fy,
-                fz=fz,
-                mx=mx,
-                my=my,
-                mz=mz
-            )
-            self.db.add(node_result)
+        num_cases = U_global.shape[1]
+        displacements = U_global.T.reshape(num_cases, self.num_nodes, self.dof_per_node)
+        
+        support = self.snapshot.node_is_support[self.node_order]
+        reactions = np.where(support[:, None], reactions.T.reshape(displacements.shape), np.nan)
+        
+        if self.result_store is not None:
+            self.result_store.add_node_results(displacements, reactions, load_case_ids, load_combination_ids)
+            return
         
-        self.db.commit()
+        displacements = displacements.reshape(-1, self.dof_per_node)
+        reactions = reactions.reshape(-1, self.dof_per_node)
+        
+        columns = {
+            "analysis_id": self.analysis_id,
+            "node_id": np.tile([node.id for node in self.nodes], num_cases),
+            "load_case_id": np.repeat(load_case_ids, self.num_nodes) if load_case_ids else None,
+            "load_combination_id": (
+                np.repeat(load_combination_ids, self.num_nodes) if load_combination_ids else None
+            ),
+        }
+        for k, column in enumerate(NODE_DISPLACEMENT_COLUMNS):
+            columns[column] = displacements[:, k]
+        for k, column in enumerate(NODE_REACTION_COLUMNS):
+            columns[column] = reactions[:, k]
+        
+        self.result_writer.write(NodeResult, columns, num_cases * self.num_nodes)
     
-    def _combine_results(
-        self, load_combination_id: str, combination_cases: List[LoadCombinationCase]
-    ) -> None:
+    def _combine_results(self, U_global: np.ndarray, R_global: np.ndarray, forces: np.ndarray) -> None:
         """
         Combine results from multiple load cases according to load combination factors.
+        
+        All combinations are computed at once as products of the (n_combinations, n_cases)
+        factor matrix with the per-case displacement, reaction and element force arrays.
+        Stresses are recalculated from the combined forces.
         """
-        # Get all nodes and elements
-        nodes = self.db.query(Node).filter(Node.project_id == self.project_id).all()
-        elements = self.db.query(Element).filter(Element.project_id == self.project_id).all()
-        
-        # For each node
-        for node in nodes:
-            # Initialize combined results
-            dx, dy, dz = 0.0, 0.0, 0.0
-            rx, ry, rz = 0.0, 0.0, 0.0
-            fx, fy, fz = 0.0, 0.0, 0.0
-            mx, my, mz = 0.0, 0.0, 0.0
-            
-            # Combine results from each load case
-            for case in combination_cases:
-                # Get node result for this load case
-                node_result = self.db.query(NodeResult).filter(
-                    NodeResult.analysis_id == self.analysis_id,
-                    NodeResult.node_id == node.id,
-                    NodeResult.load_case_id == case.load_case_id
-                ).first()
-                
-                if node_result:
-                    # Apply load factor
-                    factor = case.factor
-                    
-                    # Add to combined results
-                    if node_result.dx is not None:
-                        dx += node_result.dx * factor
-                    if node_result.dy is not None:
-                        dy += node_result.dy * factor
-                    if node_result.dz is not None:
-                        dz += node_result.dz * factor
-                    if node_result.rx is not None:
-                        rx += node_result.rx * factor
-                    if node_result.ry is not None:
-                        ry += node_result.ry * factor
-                    if node_result.rz is not None:
-                        rz += node_result.rz * factor
-                    
-                    # Reactions
-                    if node_result.fx is not None:
-                        fx += node_result.fx * factor
-                    if node_result.fy is not None:
-                        fy += node_result.fy * factor
-                    if node_result.fz is not None:
-                        fz += node_result.fz * factor
-                    if node_result.mx is not None:
-                        mx += node_result.mx * factor
-                    if node_result.my is not None:
-                        my += node_result.my * factor
-                    if node_result.mz is not None:
-                        mz += node_result.mz * factor
-            
-            # Store combined node result
-            combined_node_result = NodeResult(
-                analysis_id=self.analysis_id,
-                node_id=node.id,
-                load_combination_id=load_combination_id,
-                dx=dx,
-                dy=dy,
-                dz=dz,
-                rx=rx,
-                ry=ry,
-                rz=rz,
-                fx=fx if node.is_support else None,
-                fy=fy if node.is_support else None,
-                fz=fz if node.is_support else None,
-                mx=mx if node.is_support else None,
-                my=my if node.is_support else None,
-                mz=mz if node.is_support else None
-            )
-            self.db.add(combined_node_result)
-        
-        # For each element and position (0.0 and 1.0)
-        for element in elements:
-            for position in [0.0, 1.0]:
-                # Initialize combined results
-                axial_force, shear_force_y, shear_force_z = 0.0, 0.0, 0.0
-                torsional_moment, bending_moment_y, bending_moment_z = 0.0, 0.0, 0.0
-                axial_stress, bending_stress_y, bending_stress_z = 0.0, 0.0, 0.0
-                von_mises_stress = 0.0
-                
-                # Combine results from each load case
-                for case in combination_cases:
-                    # Get element result for this load case and position
-                    element_result = self.db.query(ElementResult).filter(
-                        ElementResult.analysis_id == self.analysis_id,
-                        ElementResult.element_id == element.id,
-                        ElementResult.load_case_id == case.load_case_id,
-                        ElementResult.position == position
-                    ).first()
-                    
-                    if element_result:
-                        # Apply load factor
-                        factor = case.factor
-                        
-                        # Add to combined results
-                        if element_result.axial_force is not None:
-                            axial_force += element_result.axial_force * factor
-                        if element_result.shear_force_y is not None:
-                            shear_force_y += element_result.shear_force_y * factor
-                        if element_result.shear_force_z is not None:
-                            shear_force_z += element_result.shear_force_z * factor
-                        if element_result.torsional_moment is not None:
-                            torsional_moment += element_result.torsional_moment * factor
-                        if element_result.bending_moment_y is not None:
-                            bending_moment_y += element_result.bending_moment_y * factor
-                        if element_result.bending_moment_z is not None:
-                            bending_moment_z += element_result.bending_moment_z * factor
-                
-                # Calculate stresses
-                section = self.db.query(Section).filter(Section.id == element.section_id).first()
-                if section:
-                    axial_stress = axial_force / section.area
-                    bending_stress_y = bending_moment_y / section.elastic_modulus_y
-                    bending_stress_z = bending_moment_z / section.elastic_modulus_z
-                    von_mises_stress = np.sqrt(axial_stress**2 + 3 * (bending_stress_y**2 + bending_stress_z**2))
-                
-                # Store combined element result
-                combined_element_result = ElementResult(
-                    analysis_id=self.analysis_id,
-                    element_id=element.id,
-                    load_combination_id=load_combination_id,
-                    position=position,
-                    axial_force=axial_force,
-                    shear_force_y=shear_force_y,
-                    shear_force_z=shear_force_z,
-                    torsional_moment=torsional_moment,
-                    bending_moment_y=bending_moment_y,
-                    bending_moment_z=bending_moment_z,
-                    axial_stress=axial_stress,
-                    bending_stress_y=bending_stress_y,
-                    bending_stress_z=bending_stress_z,
-                    von_mises_stress=von_mises_stress
-                )
-                self.db.add(combined_element_result)
+        start = time.perf_counter()
+        
+        factors = self.snapshot.combination_factor_matrix()
+        U_combined = superpose(factors, U_global.T).T
+        R_combined = superpose(factors, R_global.T).T
+        forces_combined = superpose(factors, forces)
+        stresses_combined = self._calculate_element_stresses(forces_combined)
+        
+        logger.info(
+            f"Combined {len(self.load_cases)} load cases into {len(self.load_combinations)} "
+            f"combinations in {time.perf_counter() - start:.3f} s"
+        )
         
-        self.db.commit()
+        # Store combined node and element results
+        load_combination_ids = [load_combination.id for load_combination in self.load_combinations]
+        self._store_node_results(U_combined, R_combined, load_combination_ids=load_combination_ids)
+        self._store_element_results(
+            forces_combined, stresses_combined, load_combination_ids=load_combination_ids
+        )
     
     def _solve_eigenvalue_problem(
-        self, K: np.ndarray, M: np.ndarray
+        self, K: sp.csr_matrix, M: sp.csr_matrix, target_frequency: float = 0.0
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Solve the generalized eigenvalue problem for modal analysis.
+        Solve the generalized eigenvalue problem K*v = lambda*M*v for modal analysis.
+        
+        Only the requested number of modes closest to the target frequency (Hz) are
+        computed, using shift-invert Lanczos on the sparse symmetric K and M.
         """
-        # Solve the generalized eigenvalue problem: K*v = lambda*M*v
-        eigenvalues, eigenvectors = np.linalg.eig(np.linalg.inv(M) @ K)
+        num_modes = self.analysis.num_modes or 10
+        n = K.shape[0]
+        
+        if num_modes >= n - 1:
+            # Too few DOFs for ARPACK; solve the small dense symmetric problem directly
+            eigenvalues, eigenvectors = eigh(K.toarray(), M.toarray())
+        else:
+            # Shift around the target eigenvalue; a small negative shift keeps K - sigma*M
+            # positive definite even when K is singular
+            sigma = (2 * np.pi * target_frequency)**2 if target_frequency > 0 else -1.0
+            eigenvalues, eigenvectors = eigsh(
+                K.tocsc(), k=num_modes, M=M.tocsc(), sigma=sigma, which="LM"
+            )
         
         # Sort by eigenvalues (frequencies)
         idx = eigenvalues.argsort()
@@ -746,68 +1738,71 @@ class StructuralAnalysisSolver:
         return eigenvalues, eigenvectors
     
     def _store_modal_results(
-        self, eigenvalues: np.ndarray, eigenvectors: np.ndarray, bc_data: Dict[str, Any]
+        self,
+        eigenvalues: np.ndarray,
+        eigenvectors: np.ndarray,
+        bc_data: Dict[str, Any],
+        modal_masses: np.ndarray,
+        participation: np.ndarray
     ) -> None:
         """
         Store modal analysis results.
+        
+        ``modal_masses`` are the generalized masses and ``participation`` the
+        (n_modes, 3) participation factors for ground translations in X, Y and Z.
         """
         # Number of modes to store
         num_modes = min(len(eigenvalues), self.analysis.num_modes or 10)
         
-        # For each mode
+        # Frequencies and periods
+        omega = np.sqrt(eigenvalues[:num_modes])  # rad/s
+        frequency = omega / (2 * np.pi)  # Hz
+        period = 1 / frequency  # s
+        
+        # Full mode shapes, packed as float32 rows in node order
+        mode_shapes = self._recover_full_displacement_vector(eigenvectors[:, :num_modes], bc_data)
+        self.analysis.mode_shape_node_ids = [node.id for node in self.nodes]
+        
         for i in range(num_modes):
-            # Calculate frequency and period
-            omega = np.sqrt(eigenvalues[i])  # rad/s
-            frequency = omega / (2 * np.pi)  # Hz
-            period = 1 / frequency  # s
-            
-            # Recover full mode shape
-            mode_shape_reduced = eigenvectors[:, i]
-            mode_shape_full = np.zeros(self.total_dof)
-            for j, dof in enumerate(bc_data["free_dofs"]):
-                mode_shape_full[dof] = mode_shape_reduced[j]
-            
-            # Calculate modal mass and participation factors
-            # This is a simplified approach
-            modal_mass = 1.0  # Normalized
-            participation_x = 0.0
-            participation_y = 0.0
-            participation_z = 0.0
-            participation_rx = 0.0
-            participation_ry = 0.0
-            participation_rz = 0.0
-            
-            # Store mode shape as JSON
-            mode_shape_json = {}
-            for j, node in enumerate(self.nodes):
-                dof_start = j * self.dof_per_node
-                mode_shape_json[node.id] = [
-                    float(mode_shape_full[dof_start]),      # dx
-                    float(mode_shape_full[dof_start + 1]),  # dy
-                    float(mode_shape_full[dof_start + 2]),  # dz
-                    float(mode_shape_full[dof_start + 3]),  # rx
-                    float(mode_shape_full[dof_start + 4]),  # ry
-                    float(mode_shape_full[dof_start + 5])   # rz
-                ]
+            self.db.add(ModalResult(
+                analysis_id=self.analysis_id,
+                mode_number=i + 1,
+                frequency=float(frequency[i]),
+                period=float(period[i]),
+                modal_mass=float(modal_masses[i]),
+                participation_x=float(participation[i, 0]),
+                participation_y=float(participation[i, 1]),
+                participation_z=float(participation[i, 2]),
+                participation_rx=0.0,
+                participation_ry=0.0,
+                participation_rz=0.0,
+                mode_shape=encode_mode_shape(
+                    mode_shapes[:, i].reshape(self.num_nodes, self.dof_per_node), normalize=False
+                )
+            ))
+    
+    def _store_buckling_results(
+        self,
+        load_factors: np.ndarray,
+        modes: np.ndarray,
+        bc_data: Dict[str, Any],
+        load_case_id: Optional[str] = None,
+        load_combination_id: Optional[str] = None
+    ) -> None:
+        """
+        Store buckling load factors and float32 mode shapes for one reference load.
+        """
+        for i, load_factor in enumerate(load_factors):
+            mode_shape = self._recover_full_displacement_vector(modes[:, i], bc_data)
             
-            # Store modal result
-            modal_result = ModalResult(
+            self.db.add(BucklingResult(
                 analysis_id=self.analysis_id,
+                load_case_id=load_case_id,
+                load_combination_id=load_combination_id,
                 mode_number=i + 1,
-                frequency=float(frequency),
-                period=float(period),
-                modal_mass=modal_mass,
-                participation_x=participation_x,
-                participation_y=participation_y,
-                participation_z=participation_z,
-                participation_rx=participation_rx,
-                participation_ry=participation_ry,
-                participation_rz=participation_rz,
-                mode_shape=mode_shape_json
-            )
-            self.db.add(modal_result)
-        
-        self.db.commit()
+                load_factor=float(load_factor),
+                mode_shape=encode_mode_shape(mode_shape.reshape(self.num_nodes, self.dof_per_node))
+            ))
     
     def _get_element_dof_indices(self, element: Element) -> List[int]:
         """
@@ -830,42 +1825,7 @@ class StructuralAnalysisSolver:
         """
         Calculate the element stiffness matrix in local coordinates.
         """
-        # Simplified 3D beam element stiffness matrix
-        # This is a placeholder and should be replaced with a proper implementation
-        G = E / (2 * (1 + nu))  # Shear modulus
-        
-        # Initialize stiffness matrix
-        K = np.zeros((12, 12))
-        
-        # Axial terms
-        K[0, 0] = K[6, 6] = E * A / L
-        K[0, 6] = K[6, 0] = -E * A / L
-        
-        # Torsional terms
-        K[3, 3] = K[9, 9] = G * J / L
-        K[3, 9] = K[9, 3] = -G * J / L
-        
-        # Bending terms (y-axis)
-        K[1, 1] = K[7, 7] = 12 * E * Iz / L**3
-        K[1, 7] = K[7, 1] = -12 * E * Iz / L**3
-        K[1, 5] = K[5, 1] = 6 * E * Iz / L**2
-        K[1, 11] = K[11, 1] = 6 * E * Iz / L**2
-        K[5, 5] = K[11, 11] = 4 * E * Iz / L
-        K[5, 7] = K[7, 5] = -6 * E * Iz / L**2
-        K[5, 11] = K[11, 5] = 2 * E * Iz / L
-        K[7, 11] = K[11, 7] = -6 * E * Iz / L**2
-        
-        # Bending terms (z-axis)
-        K[2, 2] = K[8, 8] = 12 * E * Iy / L**3
-        K[2, 8] = K[8, 2] = -12 * E * Iy / L**3
-        K[2, 4] = K[4, 2] = -6 * E * Iy / L**2
-        K[2, 10] = K[10, 2] = -6 * E * Iy / L**2
-        K[4, 4] = K[10, 10] = 4 * E * Iy / L
-        K[4, 8] = K[8, 4] = 6 * E * Iy / L**2
-        K[4, 10] = K[10, 4] = 2 * E * Iy / L
-        K[8, 10] = K[10, 8] = 6 * E * Iy / L**2
-        
-        return K
+        return element_stiffness_matrices(L, E, A, Iy, Iz, J, nu)[0]
     
     def _calculate_element_mass_matrix(
         self, L: float, rho: float, A: float
@@ -873,34 +1833,7 @@ class StructuralAnalysisSolver:
         """
         Calculate the element mass matrix in local coordinates.
         """
-        # Simplified consistent mass matrix for a 3D beam element
-        # This is a placeholder and should be replaced with a proper implementation
-        m = rho * A * L  # Total mass of the element
-        
-        # Initialize mass matrix
-        M = np.zeros((12, 12))
-        
-        # Translational terms
-        M[0, 0] = M[6, 6] = m / 3
-        M[0, 6] = M[6, 0] = m / 6
-        
-        M[1, 1] = M[7, 7] = m / 3
-        M[1, 7] = M[7, 1] = m / 6
-        
-        M[2, 2] = M[8, 8] = m / 3
-        M[2, 8] = M[8, 2] = m / 6
-        
-        # Rotational terms (simplified)
-        M[3, 3] = M[9, 9] = m * L**2 / 3
-        M[3, 9] = M[9, 3] = m * L**2 / 6
-        
-        M[4, 4] = M[10, 10] = m * L**2 / 3
-        M[4, 10] = M[10, 4] = m * L**2 / 6
-        
-        M[5, 5] = M[11, 11] = m * L**2 / 3
-        M[5, 11] = M[11, 5] = m * L**2 / 6
-        
-        return M
+        return element_mass_matrices(L, rho, A)[0]
     
     def _calculate_transformation_matrix(
         self, dx: float, dy: float, dz: float, L: float, angle: float
@@ -908,50 +1841,7 @@ class StructuralAnalysisSolver:
         """
         Calculate the transformation matrix from local to global coordinates.
         """
-        # Direction cosines
-        if L < 1e-10:  # Avoid division by zero
-            L = 1e-10
-        
-        cx = dx / L
-        cy = dy / L
-        cz = dz / L
-        
-        # Handle special case of vertical element
-        if abs(cx) < 1e-10 and abs(cy) < 1e-10:
-            # Element is vertical, use a different approach
-            cx_p = 1.0
-            cy_p = 0.0
-            cz_p = 0.0
-        else:
-            # Normal case
-            # Calculate perpendicular direction
-            d = np.sqrt(cx**2 + cy**2)
-            cx_p = -cy / d
-            cy_p = cx / d
-            cz_p = 0.0
-        
-        # Apply rotation angle
-        angle_rad = np.radians(angle)
-        cos_a = np.cos(angle_rad)
-        sin_a = np.sin(angle_rad)
-        
-        cx_pp = cx_p * cos_a + (cy * cz_p - cz * cy_p) * sin_a
-        cy_pp = cy_p * cos_a + (cz * cx_p - cx * cz_p) * sin_a
-        cz_pp = cz_p * cos_a + (cx * cy_p - cy * cx_p) * sin_a
-        
-        # Create 3x3 rotation matrix
-        R = np.array([
-            [cx, cy, cz],
-            [cx_pp, cy_pp, cz_pp],
-            [cy * cz_pp - cz * cy_pp, cz * cx_pp - cx * cz_pp, cx * cy_pp - cy * cx_pp]
-        ])
-        
-        # Create 12x12 transformation matrix
-        T = np.zeros((12, 12))
-        for i in range(4):
-            T[3*i:3*i+3, 3*i:3*i+3] = R
-        
-        return T
+        return transformation_matrices(dx, dy, dz, L, angle or 0.0)[0]
 
 
 def run_analysis_task(db: Session, analysis_id: str) -> None:
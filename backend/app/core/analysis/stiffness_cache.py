@@ -0,0 +1,143 @@
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import numpy as np
+import scipy.sparse as sp
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+
+from app.core.config import settings
+from app.core.analysis.linear_solvers import Factorization
+
+logger = logging.getLogger(__name__)
+
+
+def model_hash(arrays: Iterable[np.ndarray]) -> str:
+    """
+    Hash the contents, dtypes and shapes of a sequence of arrays.
+    """
+    digest = hashlib.sha256()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.tobytes())
+
+    return digest.hexdigest()
+
+
+def cache_nbytes(value: Any) -> int:
+    """
+    Approximate memory held by a cached value (arrays, sparse matrices, factorizations and dicts of them).
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if sp.issparse(value):
+        value = value.tocsr()
+        return value.data.nbytes + value.indices.nbytes + value.indptr.nbytes
+    if isinstance(value, Factorization):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(cache_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(cache_nbytes(v) for v in value)
+
+    return 0
+
+
+class StiffnessCache:
+    """
+    Content-addressed LRU cache for assembled stiffness matrices and factorizations.
+
+    Entries are keyed by a hash of the model data they were built from and
+    evicted least-recently-used first once their total size exceeds
+    ``max_bytes``. Entries stored with ``persist=True`` (matrices, not
+    factorizations) are also written to ``directory``, if configured, and
+    reloaded from there after eviction or a restart.
+    """
+
+    def __init__(self, max_bytes: int, directory: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        return sum(self._sizes.values())
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return a cached entry, or None on a miss.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        value = self._load(key)
+        if value is not None:
+            self._insert(key, value)
+
+        return value
+
+    def put(self, key: str, value: Any, persist: bool = False) -> None:
+        """
+        Cache an entry in memory and, with ``persist``, in the on-disk tier.
+        """
+        self._insert(key, value)
+
+        if persist and self.directory:
+            self._save(key, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+
+    def _insert(self, key: str, value: Any) -> None:
+        size = cache_nbytes(value)
+        if size > self.max_bytes:
+            logger.info(f"Not caching {key[:12]}: {size / 1e6:.1f} MB exceeds the cache size")
+            return
+
+        with self._lock:
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._entries.move_to_end(key)
+
+            # Evict least recently used entries
+            while sum(self._sizes.values()) > self.max_bytes:
+                evicted, _ = self._entries.popitem(last=False)
+                self._sizes.pop(evicted)
+                logger.info(f"Evicted {evicted[:12]} from the stiffness cache")
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def _save(self, key: str, value: Any) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            staging = f"{self._path(key)}.tmp"
+            with open(staging, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(staging, self._path(key))
+        except OSError as e:
+            logger.warning(f"Could not write stiffness cache entry {key[:12]}: {str(e)}")
+
+    def _load(self, key: str) -> Optional[Any]:
+        if not self.directory or not os.path.exists(self._path(key)):
+            return None
+
+        try:
+            with open(self._path(key), "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logger.warning(f"Could not read stiffness cache entry {key[:12]}: {str(e)}")
+            return None
+
+
+stiffness_cache = StiffnessCache(settings.STIFFNESS_CACHE_MAX_BYTES, settings.STIFFNESS_CACHE_DIR)
@@ -0,0 +1,169 @@
+import hashlib
+import numpy as np
+import scipy.sparse as sp
+from collections import OrderedDict
+from typing import Dict, List
+
+from app.core.analysis.assembly import assemble_sparse_matrix, element_dof_indices
+from app.core.analysis.linear_solvers import SparseLUSolver
+
+
+class Substructure:
+    """
+    One occurrence of a substructure (e.g. a story) in the model.
+
+    ``elements`` and ``nodes`` are in the canonical order shared by all
+    repetitions of the substructure, and ``interior`` flags the nodes that are
+    condensed out.
+    """
+
+    def __init__(self, elements: np.ndarray, nodes: np.ndarray, interior: np.ndarray):
+        self.elements = elements
+        self.nodes = nodes
+        self.interior = interior
+
+    def dofs(self, node_mask: np.ndarray, dof_per_node: int = 6) -> np.ndarray:
+        """
+        Global DOFs of the selected nodes, in local order.
+        """
+        nodes = self.nodes[node_mask]
+        return (nodes[:, None] * dof_per_node + np.arange(dof_per_node)).ravel()
+
+
+class Superelement:
+    """
+    Statically condensed stiffness of a substructure, shared by all its repetitions.
+
+    The substructure stiffness is partitioned into interior (i) and boundary
+    (b) DOFs; the condensed boundary stiffness is the Schur complement
+    K_bb - K_bi K_ii^-1 K_ib, kept sparse since only the boundary DOFs coupled
+    to the interior are changed. K_ii is factorized once and reused to
+    condense interior loads and to recover interior displacements of every
+    repetition. Without interior DOFs the condensed stiffness is K_bb itself.
+    """
+
+    def __init__(self, K: sp.spmatrix, interior_dofs: np.ndarray, boundary_dofs: np.ndarray):
+        K = sp.csc_matrix(K)
+        self.K_ib = K[:, boundary_dofs].tocsr()[interior_dofs]
+        K_bb = K[:, boundary_dofs].tocsr()[boundary_dofs]
+
+        self.num_interior = len(interior_dofs)
+        self.num_boundary = len(boundary_dofs)
+        self.interior_factorization = None
+        self.condensed = K_bb.tocsr()
+
+        if self.num_interior:
+            K_ii = K[:, interior_dofs].tocsr()[interior_dofs]
+            self.interior_factorization = SparseLUSolver().factorize(K_ii)
+
+            coupled = np.flatnonzero(np.diff(sp.csc_matrix(self.K_ib).indptr))
+            K_ic = self.K_ib[:, coupled].toarray()
+            correction = K_ic.T @ self.interior_factorization.solve(K_ic)
+            self.condensed = (self.condensed - sp.csr_matrix(
+                (correction.ravel(), (np.repeat(coupled, len(coupled)), np.tile(coupled, len(coupled)))),
+                shape=K_bb.shape
+            )).tocsr()
+
+    def condense_loads(self, F_i: np.ndarray) -> np.ndarray:
+        """
+        Boundary load correction -K_bi K_ii^-1 F_i for interior loads.
+        """
+        if not self.num_interior:
+            return np.zeros((self.num_boundary,) + F_i.shape[1:])
+
+        return -(self.K_ib.T @ self.interior_factorization.solve(F_i))
+
+    def recover_interior(self, F_i: np.ndarray, U_b: np.ndarray) -> np.ndarray:
+        """
+        Interior displacements K_ii^-1 (F_i - K_ib U_b).
+        """
+        if not self.num_interior:
+            return np.zeros((0,) + U_b.shape[1:])
+
+        return self.interior_factorization.solve(F_i - self.K_ib @ U_b)
+
+
+def find_repeated_stories(
+    node_coordinates: np.ndarray,
+    element_nodes: np.ndarray,
+    element_properties: np.ndarray,
+    fixed_nodes: np.ndarray,
+    decimals: int = 6,
+) -> List[List[Substructure]]:
+    """
+    Split the model into stories and group identical stories.
+
+    An element belongs to the story at the higher of its two node levels, so a
+    story holds its floor framing and the columns below it, and is condensed
+    onto its interfaces: the floor nodes it shares with the stories above and
+    below (and fixed nodes) are boundary nodes, and nodes used only by the
+    elements of one story (e.g. intermediate beam nodes) are interior. A story
+    without interior nodes is still a superelement, its stiffness assembled
+    once for all repetitions. Stories are identical if they match after
+    translation to a common level, including element properties (one row per
+    element in ``element_properties``) and the interior pattern. Only groups
+    of two or more identical stories are returned, since a unique story gains
+    nothing from condensation.
+    """
+    element_nodes = np.asarray(element_nodes, dtype=np.int64)
+    coordinates = np.round(node_coordinates, decimals)
+    levels = coordinates[:, 2]
+
+    element_level = np.maximum(levels[element_nodes[:, 0]], levels[element_nodes[:, 1]])
+    story_levels, element_story = np.unique(element_level, return_inverse=True)
+
+    # Nodes touched by more than one story connect stories and stay on the boundary
+    node_story_pairs = np.unique(
+        np.stack([element_nodes.ravel(), np.repeat(element_story, 2)], axis=1), axis=0
+    )
+    shared = np.bincount(node_story_pairs[:, 0], minlength=len(coordinates)) > 1
+
+    groups: Dict[str, List[Substructure]] = OrderedDict()
+    for story, level in enumerate(story_levels):
+        elements = np.flatnonzero(element_story == story)
+        nodes = np.unique(element_nodes[elements])
+
+        # Canonical node order: by coordinates relative to the story level
+        relative = coordinates[nodes] - np.array([0.0, 0.0, level])
+        nodes = nodes[np.lexsort(relative.T[::-1])]
+        relative = coordinates[nodes] - np.array([0.0, 0.0, level])
+        interior = ~shared[nodes] & ~fixed_nodes[nodes]
+
+        # Canonical element order: by local connectivity
+        local = np.empty(len(coordinates), dtype=np.int64)
+        local[nodes] = np.arange(len(nodes))
+        connectivity = local[element_nodes[elements]]
+        order = np.lexsort(connectivity.T[::-1])
+        elements, connectivity = elements[order], connectivity[order]
+
+        digest = hashlib.sha256()
+        for array in (relative, interior, connectivity, element_properties[elements]):
+            digest.update(np.ascontiguousarray(array).tobytes())
+
+        groups.setdefault(digest.hexdigest(), []).append(Substructure(elements, nodes, interior))
+
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def build_superelement(
+    substructure: Substructure,
+    element_matrices: np.ndarray,
+    element_nodes: np.ndarray,
+    dof_per_node: int = 6,
+) -> Superelement:
+    """
+    Condense a substructure from its global-coordinate element matrices.
+    """
+    local = np.empty(int(element_nodes.max()) + 1, dtype=np.int64)
+    local[substructure.nodes] = np.arange(len(substructure.nodes))
+    connectivity = local[element_nodes[substructure.elements]]
+    local_dofs = element_dof_indices(connectivity[:, 0], connectivity[:, 1], dof_per_node)
+
+    K = assemble_sparse_matrix(
+        element_matrices[substructure.elements], local_dofs, len(substructure.nodes) * dof_per_node
+    )
+
+    node_dofs = np.arange(len(substructure.nodes) * dof_per_node).reshape(-1, dof_per_node)
+    return Superelement(
+        K, node_dofs[substructure.interior].ravel(), node_dofs[~substructure.interior].ravel()
+    )
@@ -0,0 +1,20 @@
+import numpy as np
+
+
+def superpose(factors: np.ndarray, case_results: np.ndarray) -> np.ndarray:
+    """
+    Combine per-load-case results linearly.
+
+    ``factors`` is the (n_combinations, n_cases) factor matrix and
+    ``case_results`` any (n_cases, n_entities, n_components, ...) array; the
+    result has shape (n_combinations, n_entities, n_components, ...).
+    """
+    factors = np.asarray(factors, dtype=float)
+    case_results = np.asarray(case_results, dtype=float)
+
+    if factors.shape[1] != case_results.shape[0]:
+        raise ValueError(
+            f"Factor matrix has {factors.shape[1]} load cases, results have {case_results.shape[0]}"
+        )
+
+    return np.tensordot(factors, case_results, axes=(1, 0))
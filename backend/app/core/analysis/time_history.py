@@ -0,0 +1,84 @@
+import numpy as np
+from typing import Iterator, Tuple
+
+DEFAULT_TIME_HISTORY_CHUNK_STEPS = 1000  # Steps integrated and written per chunk
+
+
+def duhamel_coefficients(omega: np.ndarray, damping_ratio: float, time_step: float) -> np.ndarray:
+    """
+    Build the exact recurrence for q'' + 2 zeta omega q' + omega^2 q = p(t) with p piecewise linear.
+
+    Returns (2, 4, n_modes) coefficients such that
+    [q, q']_(i+1) = c[:, 0] q_i + c[:, 1] q'_i + c[:, 2] p_i + c[:, 3] p_(i+1)
+    (Nigam and Jennings), valid for underdamped modes.
+    """
+    zeta = damping_ratio
+    root = np.sqrt(1 - zeta**2)
+    omega_d = omega * root
+    k = omega**2
+    dt = time_step
+
+    e = np.exp(-zeta * omega * dt)
+    s = np.sin(omega_d * dt)
+    c = np.cos(omega_d * dt)
+
+    displacement = [
+        e * (zeta / root * s + c),
+        e * s / omega_d,
+        (2 * zeta / (omega * dt) + e * (((1 - 2 * zeta**2) / (omega_d * dt) - zeta / root) * s
+                                        - (1 + 2 * zeta / (omega * dt)) * c)) / k,
+        (1 - 2 * zeta / (omega * dt) + e * ((2 * zeta**2 - 1) / (omega_d * dt) * s
+                                            + 2 * zeta / (omega * dt) * c)) / k,
+    ]
+    velocity = [
+        -e * omega / root * s,
+        e * (c - zeta / root * s),
+        (-1 / dt + e * ((omega / root + zeta / (dt * root)) * s + c / dt)) / k,
+        (1 - e * (zeta / root * s + c)) / (k * dt),
+    ]
+
+    return np.array([displacement, velocity])
+
+
+def integrate_modes(
+    omega: np.ndarray,
+    damping_ratio: float,
+    time_step: float,
+    ground_acceleration: np.ndarray,
+    participation: np.ndarray,
+    num_steps: int,
+    chunk_steps: int = DEFAULT_TIME_HISTORY_CHUNK_STEPS,
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Integrate all modes at once under a ground acceleration record, from rest.
+
+    The modal loads are -participation * ground acceleration, linear between
+    record samples (spaced ``time_step``) and zero after the record. Yields
+    (first step, (n, n_modes) modal displacements) for steps 0..num_steps in
+    chunks of ``chunk_steps``, so the caller never holds the whole history.
+    """
+    coefficients = duhamel_coefficients(omega, damping_ratio, time_step)
+    ground_acceleration = np.asarray(ground_acceleration, dtype=float)
+
+    q = np.zeros(len(omega))
+    v = np.zeros(len(omega))
+
+    for start in range(0, num_steps + 1, chunk_steps):
+        stop = min(start + chunk_steps, num_steps + 1)
+
+        # Ground acceleration at steps start-1..stop-1, zero before and after the record
+        samples = np.arange(start - 1, stop)
+        acceleration = np.zeros(len(samples))
+        inside = (samples >= 0) & (samples < len(ground_acceleration))
+        acceleration[inside] = ground_acceleration[samples[inside]]
+        loads = -acceleration[:, None] * participation[None, :]
+
+        chunk = np.empty((stop - start, len(omega)))
+        for i in range(stop - start):
+            if start + i > 0:
+                state = coefficients[:, 0] * q + coefficients[:, 1] * v
+                state += coefficients[:, 2] * loads[i] + coefficients[:, 3] * loads[i + 1]
+                q, v = state
+            chunk[i] = q
+
+        yield start, chunk
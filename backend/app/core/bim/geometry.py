@@ -7,6 +7,7 @@ from app.models.element import Element, ElementType
 from app.models.node import Node
 from app.models.section import Section, SectionType
 from app.models.material import Material
+from app.core.snapshot import ModelSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -21,21 +22,24 @@ def generate_bim_geometry(
     Generate BIM geometry for elements.
     """
     try:
+        # Load model data in bulk
+        snapshot = ModelSnapshot(db, project_id)
+        
         # Get elements
-        query = db.query(Element).filter(Element.project_id == project_id)
+        elements = snapshot.elements
         if element_ids:
-            query = query.filter(Element.id.in_(element_ids))
-        elements = query.all()
+            requested = set(element_ids)
+            elements = [element for element in elements if element.id in requested]
         
         # Generate geometry for each element
         geometries = []
         
         for element in elements:
             # Get element properties
-            start_node = db.query(Node).filter(Node.id == element.start_node_id).first()
-            end_node = db.query(Node).filter(Node.id == element.end_node_id).first()
-            section = db.query(Section).filter(Section.id == element.section_id).first()
-            material = db.query(Material).filter(Material.id == element.material_id).first()
+            start_node = snapshot.node(element.start_node_id)
+            end_node = snapshot.node(element.end_node_id)
+            section = snapshot.section(element.section_id)
+            material = snapshot.material(element.material_id)
             
             if not start_node or not end_node or not section or not material:
                 continue
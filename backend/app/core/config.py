@@ -29,11 +29,29 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = os.getenv("POSTGRES_PASSWORD", "postgres")
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "strumind")
     POSTGRES_PORT: str = os.getenv("POSTGRES_PORT", "5432")
-    DATABASE_URI: Optional[PostgresDsn] = None
     
-    # SQLite settings (for optional local/lightweight storage)
+    # SQLite settings (for optional local/lightweight storage), declared before DATABASE_URI
+    # so that its validator sees them
     SQLITE_DB: str = os.getenv("SQLITE_DB", "strumind.db")
     USE_SQLITE: bool = os.getenv("USE_SQLITE", "False").lower() == "true"
+    DATABASE_URI: Optional[Union[PostgresDsn, str]] = None
+
+    # Analysis result persistence
+    RESULT_BATCH_SIZE: int = int(os.getenv("RESULT_BATCH_SIZE", "5000"))
+    RESULTS_DIR: str = os.getenv("RESULTS_DIR", "results")  # Columnar result stores
+
+    # Stiffness matrix and factorization cache
+    STIFFNESS_CACHE_MAX_BYTES: int = int(os.getenv("STIFFNESS_CACHE_MAX_BYTES", str(512 * 1024**2)))
+    STIFFNESS_CACHE_DIR: Optional[str] = os.getenv("STIFFNESS_CACHE_DIR")  # On-disk tier, disabled if unset
+    INCREMENTAL_MAX_RANK: int = int(os.getenv("INCREMENTAL_MAX_RANK", "150"))  # Refactorize above this update rank
+
+    # Parallel analysis
+    ANALYSIS_WORKERS: int = int(os.getenv("ANALYSIS_WORKERS", "0"))  # Worker processes, 0 for one per CPU
+    ASSEMBLY_WORKERS: int = int(os.getenv("ASSEMBLY_WORKERS", "0"))  # 0 to use ANALYSIS_WORKERS
+    ASSEMBLY_CHUNK_SIZE: int = int(os.getenv("ASSEMBLY_CHUNK_SIZE", "50000"))  # Elements per assembly task
+
+    # Time history analysis
+    TIME_HISTORY_CHUNK_STEPS: int = int(os.getenv("TIME_HISTORY_CHUNK_STEPS", "1000"))  # Steps per written chunk
 
     @field_validator("DATABASE_URI", mode="before")
     def assemble_db_connection(cls, v: Optional[str], values) -> Any:
@@ -45,7 +63,7 @@ class Settings(BaseSettings):
             username=values.data.get("POSTGRES_USER"),
             password=values.data.get("POSTGRES_PASSWORD"),
             host=values.data.get("POSTGRES_SERVER"),
-            port=values.data.get("POSTGRES_PORT"),
+            port=int(values.data.get("POSTGRES_PORT")),
             path=f"{values.data.get('POSTGRES_DB') or ''}",
         )
 
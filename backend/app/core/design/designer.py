@@ -11,6 +11,8 @@ from app.models.element import Element, ElementType
 from app.models.analysis import Analysis, ElementResult
 from app.models.material import Material, MaterialType
 from app.models.section import Section, SectionType
+from app.core.snapshot import ModelSnapshot
+from app.core.analysis.result_store import ResultStore
 
 logger = logging.getLogger(__name__)
 
@@ -39,14 +41,15 @@ class StructuralDesigner:
         if not self.analysis:
             raise ValueError(f"Analysis with ID {self.analysis_id} not found")
         
-        # Load model data
-        self.elements = db.query(Element).filter(Element.project_id == self.project_id).all()
+        # Load model data in bulk
+        self.snapshot = ModelSnapshot(db, self.project_id)
+        self.elements = self.snapshot.elements
         
         # Load combinations to consider
         self.load_combination_ids = self.design.load_combination_ids or []
         
         # Element mapping for easy access
-        self.element_map = {element.id: i for i, element in enumerate(self.elements)}
+        self.element_map = self.snapshot.element_index
     
     def run_design(self) -> None:
         """
@@ -131,29 +134,56 @@ class StructuralDesigner:
         
         self.db.commit()
     
+    def _get_element_results_by_element(self) -> Dict[str, List[ElementResult]]:
+        """
+        Get the analysis results for the design load combinations, grouped by element ID.
+        
+        Results of analyses saved to a columnar result store are read from the store.
+        """
+        if not self.load_combination_ids:
+            return {}
+        
+        store_path = self.db.query(Analysis.result_store_path).filter(Analysis.id == self.analysis_id).scalar()
+        if ResultStore.exists(store_path):
+            store = ResultStore(store_path)
+            results = [
+                result
+                for load_combination_id in self.load_combination_ids
+                for result in store.element_results(
+                    self.analysis_id, load_combination_id=load_combination_id, limit=None
+                )
+            ]
+        else:
+            results = self.db.query(ElementResult).filter(
+                ElementResult.analysis_id == self.analysis_id,
+                ElementResult.load_combination_id.in_(self.load_combination_ids)
+            ).all()
+        
+        results_by_element: Dict[str, List[ElementResult]] = {}
+        for result in results:
+            results_by_element.setdefault(result.element_id, []).append(result)
+        
+        return results_by_element
+    
     def _run_aisc_360_16_design(self) -> None:
         """
         Run AISC 360-16 design checks.
         """
+        # Get analysis results for all elements in one query
+        results_by_element = self._get_element_results_by_element()
+        
         # For each element
         for element in self.elements:
             # Get element properties
-            material = self.db.query(Material).filter(Material.id == element.material_id).first()
-            section = self.db.query(Section).filter(Section.id == element.section_id).first()
+            material = self.snapshot.material(element.material_id)
+            section = self.snapshot.section(element.section_id)
             
-            # Skip non-steel elements
-            if material.material_type != MaterialType.STEEL:
+            # Skip elements with missing properties and non-steel elements
+            if not material or not section or material.material_type != MaterialType.STEEL:
                 continue
             
             # Get analysis results for this element
-            element_results = []
-            for load_combination_id in self.load_combination_ids:
-                results = self.db.query(ElementResult).filter(
-                    ElementResult.analysis_id == self.analysis_id,
-                    ElementResult.element_id == element.id,
-                    ElementResult.load_combination_id == load_combination_id
-                ).all()
-                element_results.extend(results)
+            element_results = results_by_element.get(element.id, [])
             
             # If no results, skip
             if not element_results:
@@ -0,0 +1,267 @@
+import logging
+import numpy as np
+from typing import List, Dict, Optional
+from sqlalchemy.orm import Session
+
+from app.models.node import Node
+from app.models.element import Element
+from app.models.load import Load, LoadCase, LoadCombination, LoadCombinationCase
+from app.models.material import Material
+from app.models.section import Section
+
+logger = logging.getLogger(__name__)
+
+RESTRAINT_COLUMNS = (
+    "restraint_x", "restraint_y", "restraint_z", "restraint_rx", "restraint_ry", "restraint_rz"
+)
+SPRING_COLUMNS = ("spring_x", "spring_y", "spring_z", "spring_rx", "spring_ry", "spring_rz")
+LOAD_COLUMNS = ("fx", "fy", "fz", "mx", "my", "mz")
+
+
+class ModelSnapshot:
+    """
+    In-memory, struct-of-arrays view of a project's structural model.
+
+    Nodes, elements, sections, materials, loads and load combinations are read
+    with one bulk query per table. Numeric properties are exposed as NumPy
+    columns indexed by node/element order, and the ORM rows are kept in
+    id-keyed maps for code that needs names or other descriptive fields.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        project_id: str,
+        load_case_ids: Optional[List[str]] = None,
+        load_combination_ids: Optional[List[str]] = None,
+    ):
+        """
+        Load the model data for a project.
+        """
+        self.project_id = project_id
+
+        # Bulk load model tables
+        self.nodes = db.query(Node).filter(Node.project_id == project_id).all()
+        self.elements = db.query(Element).filter(Element.project_id == project_id).all()
+        self.sections = db.query(Section).filter(Section.project_id == project_id).all()
+        self.materials = db.query(Material).filter(Material.project_id == project_id).all()
+
+        # Load cases, their loads and load combinations
+        self.load_cases = []
+        self.loads = []
+        if load_case_ids:
+            self.load_cases = db.query(LoadCase).filter(LoadCase.id.in_(load_case_ids)).all()
+            self.loads = db.query(Load).filter(
+                Load.project_id == project_id,
+                Load.load_case_id.in_(load_case_ids)
+            ).all()
+
+        self.load_combinations = []
+        combination_cases = []
+        if load_combination_ids:
+            self.load_combinations = db.query(LoadCombination).filter(
+                LoadCombination.id.in_(load_combination_ids)
+            ).all()
+            combination_cases = db.query(LoadCombinationCase).filter(
+                LoadCombinationCase.load_combination_id.in_(load_combination_ids)
+            ).all()
+
+        # Id-keyed maps
+        self.node_index = {node.id: i for i, node in enumerate(self.nodes)}
+        self.element_index = {element.id: i for i, element in enumerate(self.elements)}
+        self.section_index = {section.id: i for i, section in enumerate(self.sections)}
+        self.material_index = {material.id: i for i, material in enumerate(self.materials)}
+        self.load_case_index = {load_case.id: i for i, load_case in enumerate(self.load_cases)}
+
+        self.combination_cases: Dict[str, List[LoadCombinationCase]] = {
+            load_combination.id: [] for load_combination in self.load_combinations
+        }
+        for case in combination_cases:
+            self.combination_cases.setdefault(case.load_combination_id, []).append(case)
+
+        self._build_node_columns()
+        self._build_property_columns()
+        self._build_element_columns()
+        self._build_load_columns()
+
+        logger.info(
+            f"Loaded model snapshot for project {project_id}: {len(self.nodes)} nodes, "
+            f"{len(self.elements)} elements, {len(self.loads)} loads"
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def num_elements(self) -> int:
+        return len(self.elements)
+
+    def _build_node_columns(self) -> None:
+        """
+        Build node coordinate, restraint and spring columns.
+        """
+        self.node_coordinates = np.array(
+            [[node.x, node.y, node.z] for node in self.nodes], dtype=float
+        ).reshape(-1, 3)
+        self.node_is_support = np.array([bool(node.is_support) for node in self.nodes], dtype=bool)
+
+        # Restraints only apply to nodes flagged as supports
+        self.node_restraints = np.array(
+            [[bool(getattr(node, column)) for column in RESTRAINT_COLUMNS] for node in self.nodes],
+            dtype=bool
+        ).reshape(-1, 6) & self.node_is_support[:, None]
+
+        self.node_springs = np.array(
+            [[getattr(node, column) or 0.0 for column in SPRING_COLUMNS] for node in self.nodes],
+            dtype=float
+        ).reshape(-1, 6)
+
+    def _build_property_columns(self) -> None:
+        """
+        Build section and material property columns.
+        """
+        self.section_area = np.array([s.area for s in self.sections], dtype=float)
+        self.section_moment_of_inertia_y = np.array([s.moment_of_inertia_y for s in self.sections], dtype=float)
+        self.section_moment_of_inertia_z = np.array([s.moment_of_inertia_z for s in self.sections], dtype=float)
+        self.section_torsional_constant = np.array([s.torsional_constant for s in self.sections], dtype=float)
+        self.section_elastic_modulus_y = np.array([s.elastic_modulus_y for s in self.sections], dtype=float)
+        self.section_elastic_modulus_z = np.array([s.elastic_modulus_z for s in self.sections], dtype=float)
+
+        self.material_elastic_modulus = np.array([m.elastic_modulus for m in self.materials], dtype=float)
+        self.material_poisson_ratio = np.array([m.poisson_ratio for m in self.materials], dtype=float)
+        self.material_density = np.array([m.density for m in self.materials], dtype=float)
+
+    def _build_element_columns(self) -> None:
+        """
+        Build element connectivity and property index columns.
+
+        References that cannot be resolved within the project are stored as -1.
+        """
+        self.element_nodes = np.array(
+            [
+                [self.node_index.get(e.start_node_id, -1), self.node_index.get(e.end_node_id, -1)]
+                for e in self.elements
+            ],
+            dtype=np.int64
+        ).reshape(-1, 2)
+        self.element_section = np.array(
+            [self.section_index.get(e.section_id, -1) for e in self.elements], dtype=np.int64
+        )
+        self.element_material = np.array(
+            [self.material_index.get(e.material_id, -1) for e in self.elements], dtype=np.int64
+        )
+        self.element_angle = np.array([e.angle or 0.0 for e in self.elements], dtype=float)
+
+        self.element_is_valid = (
+            (self.element_nodes >= 0).all(axis=1)
+            & (self.element_section >= 0)
+            & (self.element_material >= 0)
+        )
+
+    def _build_load_columns(self) -> None:
+        """
+        Build nodal load columns (one row per nodal load).
+        """
+        nodal_loads = [
+            load for load in self.loads
+            if load.node_id and load.node_id in self.node_index
+        ]
+
+        self.nodal_load_case = np.array(
+            [self.load_case_index.get(load.load_case_id, -1) for load in nodal_loads], dtype=np.int64
+        )
+        self.nodal_load_node = np.array(
+            [self.node_index[load.node_id] for load in nodal_loads], dtype=np.int64
+        )
+        self.nodal_load_values = np.array(
+            [[getattr(load, column) or 0.0 for column in LOAD_COLUMNS] for load in nodal_loads],
+            dtype=float
+        ).reshape(-1, 6)
+
+    def node(self, node_id: str) -> Optional[Node]:
+        index = self.node_index.get(node_id)
+        return self.nodes[index] if index is not None else None
+
+    def section(self, section_id: str) -> Optional[Section]:
+        index = self.section_index.get(section_id)
+        return self.sections[index] if index is not None else None
+
+    def material(self, material_id: str) -> Optional[Material]:
+        index = self.material_index.get(material_id)
+        return self.materials[index] if index is not None else None
+
+    def check_elements(self) -> None:
+        """
+        Raise if any element references a node, section or material outside the project.
+        """
+        if not self.element_is_valid.all():
+            invalid = [self.elements[i].id for i in np.flatnonzero(~self.element_is_valid)]
+            raise ValueError(
+                f"Elements reference missing nodes, sections or materials: {', '.join(invalid[:10])}"
+            )
+
+    def element_properties(self) -> Dict[str, np.ndarray]:
+        """
+        Gather per-element geometry and properties as arrays in element order.
+        """
+        start = self.node_coordinates[self.element_nodes[:, 0]]
+        end = self.node_coordinates[self.element_nodes[:, 1]]
+        delta = end - start
+
+        section = self.element_section
+        material = self.element_material
+
+        return {
+            "dx": delta[:, 0],
+            "dy": delta[:, 1],
+            "dz": delta[:, 2],
+            "L": np.sqrt((delta**2).sum(axis=1)),
+            "E": self.material_elastic_modulus[material],
+            "nu": self.material_poisson_ratio[material],
+            "rho": self.material_density[material],
+            "A": self.section_area[section],
+            "Iy": self.section_moment_of_inertia_y[section],
+            "Iz": self.section_moment_of_inertia_z[section],
+            "J": self.section_torsional_constant[section],
+            "Sy": self.section_elastic_modulus_y[section],
+            "Sz": self.section_elastic_modulus_z[section],
+            "angle": self.element_angle,
+        }
+
+    def nodal_load_matrix(
+        self, dof_per_node: int = 6, node_position: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Build the (n_dof, n_load_cases) matrix of nodal loads, one column per load case.
+
+        ``node_position`` maps snapshot node indices to DOF-numbering positions
+        when the nodes have been renumbered.
+        """
+        F = np.zeros((self.num_nodes * dof_per_node, len(self.load_cases)))
+
+        valid = self.nodal_load_case >= 0
+        load_nodes = self.nodal_load_node[valid]
+        if node_position is not None:
+            load_nodes = node_position[load_nodes]
+        dofs = load_nodes[:, None] * dof_per_node + np.arange(dof_per_node)
+        cases = np.broadcast_to(self.nodal_load_case[valid, None], dofs.shape)
+        np.add.at(F, (dofs, cases), self.nodal_load_values[valid])
+
+        return F
+
+    def combination_factor_matrix(self) -> np.ndarray:
+        """
+        Build the (n_load_combinations, n_load_cases) matrix of combination factors.
+
+        Combination cases that reference load cases outside the snapshot are ignored.
+        """
+        factors = np.zeros((len(self.load_combinations), len(self.load_cases)))
+
+        for i, load_combination in enumerate(self.load_combinations):
+            for case in self.combination_cases.get(load_combination.id, []):
+                j = self.load_case_index.get(case.load_case_id)
+                if j is not None:
+                    factors[i, j] += case.factor
+
+        return factors
@@ -1,8 +1,10 @@
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 
 from app.crud.base import CRUDBase
-from app.models.analysis import Analysis, AnalysisType, NodeResult, ElementResult, ModalResult
+from app.core.analysis.result_store import ResultStore
+from app.core.analysis.mode_shapes import mode_shape_by_node, mode_shape_rows
+from app.models.analysis import Analysis, AnalysisType, NodeResult, ElementResult, ModalResult, BucklingResult
 from app.schemas.analysis import AnalysisCreate, AnalysisUpdate
 
 
@@ -52,6 +54,14 @@ class CRUDAnalysis(CRUDBase[Analysis, AnalysisCreate, AnalysisUpdate]):
         
         return query.offset(skip).limit(limit).all()
     
+    def _result_store_path(self, db: Session, analysis_id: str) -> Optional[str]:
+        """
+        Get the result store location of an analysis, if it has one on disk.
+        """
+        store_path = db.query(self.model.result_store_path).filter(self.model.id == analysis_id).scalar()
+        
+        return store_path if ResultStore.exists(store_path) else None
+    
     def get_node_results(
         self,
         db: Session,
@@ -65,7 +75,15 @@ class CRUDAnalysis(CRUDBase[Analysis, AnalysisCreate, AnalysisUpdate]):
     ) -> List[NodeResult]:
         """
         Get node results for an analysis.
+        
+        Results of analyses saved to a columnar result store are read from the store.
         """
+        store_path = self._result_store_path(db, analysis_id)
+        if store_path:
+            return ResultStore(store_path).node_results(
+                analysis_id, node_id, load_case_id, load_combination_id, skip, limit
+            )
+        
         query = db.query(NodeResult).filter(NodeResult.analysis_id == analysis_id)
         
         if node_id:
@@ -92,7 +110,15 @@ class CRUDAnalysis(CRUDBase[Analysis, AnalysisCreate, AnalysisUpdate]):
     ) -> List[ElementResult]:
         """
         Get element results for an analysis.
+        
+        Results of analyses saved to a columnar result store are read from the store.
         """
+        store_path = self._result_store_path(db, analysis_id)
+        if store_path:
+            return ResultStore(store_path).element_results(
+                analysis_id, element_id, load_case_id, load_combination_id, skip, limit
+            )
+        
         query = db.query(ElementResult).filter(ElementResult.analysis_id == analysis_id)
         
         if element_id:
@@ -113,13 +139,135 @@ class CRUDAnalysis(CRUDBase[Analysis, AnalysisCreate, AnalysisUpdate]):
         analysis_id: str,
         skip: int = 0,
         limit: int = 100,
-    ) -> List[ModalResult]:
+        include_mode_shapes: bool = True,
+    ) -> List[Dict[str, Any]]:
         """
-        Get modal results for an analysis.
+        Get modal results for an analysis, with the binary mode shapes unpacked by node ID.
+        
+        With ``include_mode_shapes`` False the mode shapes are not loaded at all.
         """
+        node_ids = []
         query = db.query(ModalResult).filter(ModalResult.analysis_id == analysis_id)
         
-        return query.order_by(ModalResult.mode_number).offset(skip).limit(limit).all()
+        if include_mode_shapes:
+            node_ids = db.query(self.model.mode_shape_node_ids).filter(self.model.id == analysis_id).scalar() or []
+        else:
+            query = query.options(defer(ModalResult.mode_shape))
+        
+        results = query.order_by(ModalResult.mode_number).offset(skip).limit(limit).all()
+        
+        return [
+            {
+                "id": result.id,
+                "created_at": result.created_at,
+                "updated_at": result.updated_at,
+                "analysis_id": result.analysis_id,
+                "mode_number": result.mode_number,
+                "frequency": result.frequency,
+                "period": result.period,
+                "modal_mass": result.modal_mass,
+                "participation_x": result.participation_x,
+                "participation_y": result.participation_y,
+                "participation_z": result.participation_z,
+                "participation_rx": result.participation_rx,
+                "participation_ry": result.participation_ry,
+                "participation_rz": result.participation_rz,
+                "mode_shape": mode_shape_by_node(result.mode_shape, node_ids) if include_mode_shapes else None,
+            }
+            for result in results
+        ]
+    
+    def get_mode_shape(
+        self,
+        db: Session,
+        *,
+        analysis_id: str,
+        mode_number: int,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get one modal mode shape, for all nodes or only the given node IDs.
+        
+        Only the packed float32 mode shape of the requested mode is read; the
+        returned ``values`` are its (n_nodes, 6) rows as an array, in the order
+        of the returned ``node_ids`` (unknown node IDs are skipped).
+        """
+        data = db.query(ModalResult.mode_shape).filter(
+            ModalResult.analysis_id == analysis_id,
+            ModalResult.mode_number == mode_number
+        ).scalar()
+        if data is None:
+            return None
+        
+        stored_node_ids = db.query(self.model.mode_shape_node_ids).filter(self.model.id == analysis_id).scalar() or []
+        found, values = mode_shape_rows(data, stored_node_ids, node_ids)
+        
+        return {
+            "analysis_id": analysis_id,
+            "mode_number": mode_number,
+            "node_ids": found,
+            "values": values,
+        }
+    
+    def get_buckling_results(
+        self,
+        db: Session,
+        *,
+        analysis_id: str,
+        load_case_id: Optional[str] = None,
+        load_combination_id: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get buckling results for an analysis, with the binary mode shapes unpacked by node ID.
+        """
+        node_ids = db.query(self.model.mode_shape_node_ids).filter(self.model.id == analysis_id).scalar() or []
+        query = db.query(BucklingResult).filter(BucklingResult.analysis_id == analysis_id)
+        
+        if load_case_id:
+            query = query.filter(BucklingResult.load_case_id == load_case_id)
+        
+        if load_combination_id:
+            query = query.filter(BucklingResult.load_combination_id == load_combination_id)
+        
+        results = query.order_by(
+            BucklingResult.load_case_id, BucklingResult.load_combination_id, BucklingResult.mode_number
+        ).offset(skip).limit(limit).all()
+        
+        return [
+            {
+                "id": result.id,
+                "created_at": result.created_at,
+                "updated_at": result.updated_at,
+                "analysis_id": result.analysis_id,
+                "load_case_id": result.load_case_id,
+                "load_combination_id": result.load_combination_id,
+                "mode_number": result.mode_number,
+                "load_factor": result.load_factor,
+                "mode_shape": mode_shape_by_node(result.mode_shape, node_ids),
+            }
+            for result in results
+        ]
+    
+    def get_time_history(
+        self,
+        db: Session,
+        *,
+        analysis_id: str,
+        node_id: Optional[str] = None,
+        element_id: Optional[str] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the recorded displacement history of a node or force history of an element.
+        """
+        store_path = self._result_store_path(db, analysis_id)
+        if not store_path:
+            return None
+        
+        return ResultStore(store_path).history(node_id, element_id, start, stop)
 
 
 # Create instance for export
@@ -227,10 +375,65 @@ def get_modal_results(
     analysis_id: str,
     skip: int = 0,
     limit: int = 100,
-) -> List[ModalResult]:
+    include_mode_shapes: bool = True,
+) -> List[Dict[str, Any]]:
     return analysis.get_modal_results(
         db=db,
         analysis_id=analysis_id,
         skip=skip,
         limit=limit,
-    )
\ No newline at end of file
+        include_mode_shapes=include_mode_shapes,
+    )
+
+
+def get_mode_shape(
+    db: Session,
+    *,
+    analysis_id: str,
+    mode_number: int,
+    node_ids: Optional[List[str]] = None,
+) -> Optional[Dict[str, Any]]:
+    return analysis.get_mode_shape(
+        db=db,
+        analysis_id=analysis_id,
+        mode_number=mode_number,
+        node_ids=node_ids,
+    )
+
+
+def get_buckling_results(
+    db: Session,
+    *,
+    analysis_id: str,
+    load_case_id: Optional[str] = None,
+    load_combination_id: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+) -> List[Dict[str, Any]]:
+    return analysis.get_buckling_results(
+        db=db,
+        analysis_id=analysis_id,
+        load_case_id=load_case_id,
+        load_combination_id=load_combination_id,
+        skip=skip,
+        limit=limit,
+    )
+
+
+def get_time_history(
+    db: Session,
+    *,
+    analysis_id: str,
+    node_id: Optional[str] = None,
+    element_id: Optional[str] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    return analysis.get_time_history(
+        db=db,
+        analysis_id=analysis_id,
+        node_id=node_id,
+        element_id=element_id,
+        start=start,
+        stop=stop,
+    )
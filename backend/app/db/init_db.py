@@ -1,8 +1,12 @@
 import logging
+from collections import defaultdict
 
+from sqlalchemy import JSON, LargeBinary, column, inspect, table, text
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.db.session import Base, engine
+from app.core.analysis.mode_shapes import encode_mode_shape
 from app.models import (
     node,
     element,
@@ -17,14 +21,104 @@ from app.models import (
 logger = logging.getLogger(__name__)
 
 
+def _add_missing_columns(connection: Connection) -> None:
+    """
+    Add model columns missing from existing tables, filled with their scalar defaults.
+
+    ``create_all`` creates missing tables but leaves the columns of existing ones unchanged.
+    """
+    inspector = inspect(connection)
+    quote = connection.dialect.identifier_preparer.quote
+
+    for model_table in Base.metadata.sorted_tables:
+        if not inspector.has_table(model_table.name):
+            continue
+
+        existing = {c["name"] for c in inspector.get_columns(model_table.name)}
+        for model_column in model_table.columns:
+            if model_column.name in existing:
+                continue
+
+            # Enum types are separate schema objects on some databases (e.g. PostgreSQL)
+            if hasattr(model_column.type, "create"):
+                model_column.type.create(connection, checkfirst=True)
+            column_type = model_column.type.compile(dialect=connection.dialect)
+            connection.execute(text(
+                f"ALTER TABLE {quote(model_table.name)} ADD COLUMN {quote(model_column.name)} {column_type}"
+            ))
+            if model_column.default is not None and model_column.default.is_scalar:
+                connection.execute(model_table.update().values({model_column.name: model_column.default.arg}))
+
+            logger.info(f"Added column {model_table.name}.{model_column.name}")
+
+
+def _convert_legacy_mode_shapes(connection: Connection) -> None:
+    """
+    Convert modal mode shapes stored as JSON {node_id: [dx, dy, dz, rx, ry, rz]} to float32 binaries.
+
+    The node order of every analysis is taken from its first legacy mode shape
+    and stored in Analysis.mode_shape_node_ids.
+    """
+    inspector = inspect(connection)
+    if not inspector.has_table("modalresult"):
+        return
+
+    mode_shape_type = next(c["type"] for c in inspector.get_columns("modalresult") if c["name"] == "mode_shape")
+    if isinstance(mode_shape_type, LargeBinary):
+        return
+
+    quote = connection.dialect.identifier_preparer.quote
+    binary_type = LargeBinary().compile(dialect=connection.dialect)
+    connection.execute(text(f"ALTER TABLE modalresult RENAME COLUMN mode_shape TO {quote('mode_shape_legacy')}"))
+    connection.execute(text(f"ALTER TABLE modalresult ADD COLUMN mode_shape {binary_type}"))
+
+    legacy = table(
+        "modalresult", column("id"), column("analysis_id"),
+        column("mode_shape_legacy", JSON), column("mode_shape", LargeBinary)
+    )
+    analyses = table("analysis", column("id"), column("mode_shape_node_ids", JSON))
+
+    rows = defaultdict(list)
+    for row in connection.execute(legacy.select().order_by(legacy.c.analysis_id)):
+        rows[row.analysis_id].append(row)
+
+    for analysis_id, results in rows.items():
+        node_ids = next((list(r.mode_shape_legacy) for r in results if r.mode_shape_legacy), [])
+        connection.execute(
+            analyses.update().where(analyses.c.id == analysis_id).values(mode_shape_node_ids=node_ids)
+        )
+        for result in results:
+            if not result.mode_shape_legacy:
+                continue
+            values = [result.mode_shape_legacy.get(node_id, [0.0] * 6) for node_id in node_ids]
+            connection.execute(
+                legacy.update().where(legacy.c.id == result.id).values(
+                    mode_shape=encode_mode_shape(values, normalize=False)
+                )
+            )
+
+    connection.execute(text(f"ALTER TABLE modalresult DROP COLUMN {quote('mode_shape_legacy')}"))
+    logger.info(f"Converted the mode shapes of {len(rows)} modal analyses to float32 binaries")
+
+
+def upgrade_db(bind: Engine = engine) -> None:
+    """
+    Bring the tables of an existing database up to the current models.
+    """
+    with bind.begin() as connection:
+        _add_missing_columns(connection)
+        _convert_legacy_mode_shapes(connection)
+
+
 def init_db() -> None:
     """
-    Initialize the database by creating all tables.
+    Initialize the database by creating all tables and upgrading existing ones.
     """
     try:
         # Create all tables
         Base.metadata.create_all(bind=engine)
+        upgrade_db()
         logger.info("Database tables created successfully")
     except SQLAlchemyError as e:
         logger.error(f"Error creating database tables: {e}")
-        raise
\ No newline at end of file
+        raise
@@ -6,7 +6,9 @@ from app.models.material import Material, MaterialType
 from app.models.section import Section, SectionType
 from app.models.load import Load, LoadCase, LoadCombination, LoadCombinationCase, LoadType
 from app.models.analysis import (
-    Analysis, AnalysisType, NodeResult, ElementResult, ModalResult
+    Analysis, AnalysisType, LinearSolverType, PreconditionerType,
+    AccelerationType, ModalCombinationType, TimeIntegrationType, NonlinearSolverType,
+    NodeResult, ElementResult, ModalResult, BucklingResult
 )
 from app.models.design import (
     Design, DesignCode, DesignMethod, ElementDesignResult
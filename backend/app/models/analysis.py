@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, ForeignKey, Integer, Enum, Boolean, DateTime, JSON
+from sqlalchemy import Column, String, Float, ForeignKey, Integer, Enum, Boolean, DateTime, JSON, LargeBinary
 from sqlalchemy.orm import relationship
 import enum
 from datetime import datetime
@@ -16,6 +16,43 @@ class AnalysisType(str, enum.Enum):
     P_DELTA = "p_delta"
 
 
+class LinearSolverType(str, enum.Enum):
+    AUTO = "auto"
+    DENSE_CHOLESKY = "dense_cholesky"
+    SPARSE_LU = "sparse_lu"
+    ITERATIVE = "iterative"
+    MATRIX_FREE_PCG = "matrix_free_pcg"
+    DOMAIN_DECOMPOSITION = "domain_decomposition"
+
+
+class PreconditionerType(str, enum.Enum):
+    JACOBI = "jacobi"
+    BLOCK_JACOBI = "block_jacobi"
+
+
+class ModalCombinationType(str, enum.Enum):
+    CQC = "cqc"
+    SRSS = "srss"
+
+
+class TimeIntegrationType(str, enum.Enum):
+    MODAL = "modal"
+    NEWMARK = "newmark"
+    HHT_ALPHA = "hht_alpha"
+
+
+class NonlinearSolverType(str, enum.Enum):
+    NEWTON_RAPHSON = "newton_raphson"
+    MODIFIED_NEWTON = "modified_newton"
+    BFGS = "bfgs"
+
+
+class AccelerationType(str, enum.Enum):
+    NONE = "none"
+    AITKEN = "aitken"
+    ANDERSON = "anderson"
+
+
 class Analysis(BaseModel):
     """
     Analysis model for storing analysis configurations and results.
@@ -29,6 +66,38 @@ class Analysis(BaseModel):
     include_large_deformation = Column(Boolean, default=False)
     include_shear_deformation = Column(Boolean, default=True)
     
+    # Linear solver backend (AUTO selects from model size and available memory)
+    linear_solver = Column(Enum(LinearSolverType), default=LinearSolverType.AUTO)
+    
+    # Iterative solver options
+    preconditioner = Column(Enum(PreconditionerType), default=PreconditionerType.BLOCK_JACOBI)
+    solver_tolerance = Column(Float, nullable=True)  # Relative residual
+    solver_max_iterations = Column(Integer, nullable=True)
+    
+    # Domain decomposition options (defaults to one subdomain per worker)
+    num_subdomains = Column(Integer, nullable=True)
+    
+    # Re-solve with low-rank updates of a cached factorization when only some elements changed
+    incremental_reanalysis = Column(Boolean, default=False)
+    
+    # Condense repeated stories to their boundary DOFs before the global solve
+    use_superelements = Column(Boolean, default=False)
+    
+    # P-Delta iteration options
+    p_delta_constant_kg = Column(Boolean, default=False)  # Factorize K + Kg once per load case/combination
+    p_delta_acceleration = Column(Enum(AccelerationType), default=AccelerationType.ANDERSON)
+    p_delta_tolerance = Column(Float, nullable=True)  # Relative displacement change
+    p_delta_max_iterations = Column(Integer, nullable=True)
+    
+    # Nonlinear static options
+    nonlinear_solver = Column(Enum(NonlinearSolverType), default=NonlinearSolverType.NEWTON_RAPHSON)
+    load_steps = Column(Integer, nullable=True)  # Initial load increments; default 10
+    refactorize_interval = Column(Integer, nullable=True)  # Iterations per tangent factorization (modified Newton, BFGS)
+    line_search = Column(Boolean, default=False)
+    arc_length = Column(Boolean, default=False)  # Arc-length control after the first load step
+    nonlinear_tolerance = Column(Float, nullable=True)  # Residual relative to the applied load
+    nonlinear_max_iterations = Column(Integer, nullable=True)  # Per load step
+    
     # Load cases/combinations to analyze
     load_case_ids = Column(JSON, nullable=True)  # List of load case IDs
     load_combination_ids = Column(JSON, nullable=True)  # List of load combination IDs
@@ -37,18 +106,51 @@ class Analysis(BaseModel):
     is_complete = Column(Boolean, default=False)
     run_date = Column(DateTime, nullable=True)
     
-    # For modal analysis
+    # Solver statistics from the last run (backend, DOF count, timings)
+    solver_statistics = Column(JSON, nullable=True)
+    
+    # Columnar result store (opt-in); node and element results are then read from files
+    use_result_store = Column(Boolean, default=False)
+    result_store_path = Column(String(1024), nullable=True)
+    
+    # For modal and buckling analysis
     num_modes = Column(Integer, nullable=True)
+    mode_shape_node_ids = Column(JSON, nullable=True)  # Node IDs in the row order of binary mode shapes
+    
+    # For response spectrum analysis
+    spectrum = Column(JSON, nullable=True)  # [[period (s), spectral acceleration], ...]
+    spectrum_scale_factor = Column(Float, default=1.0)  # Converts spectrum values to model acceleration units
+    spectrum_directions = Column(JSON, nullable=True)  # Subset of ["x", "y", "z"]; combined by SRSS
+    damping_ratio = Column(Float, default=0.05)
+    modal_combination = Column(Enum(ModalCombinationType), default=ModalCombinationType.CQC)
     
     # For time history analysis
     time_step = Column(Float, nullable=True)
     num_steps = Column(Integer, nullable=True)
+    ground_motion = Column(JSON, nullable=True)  # Ground accelerations sampled every time_step
+    ground_motion_direction = Column(String(1), default="x")  # x, y or z
+    ground_motion_scale_factor = Column(Float, default=1.0)  # Converts the record to model acceleration units
+    history_node_ids = Column(JSON, nullable=True)  # Nodes with recorded displacements, all if not set
+    history_element_ids = Column(JSON, nullable=True)  # Elements with recorded forces, none if not set
+    time_integration = Column(Enum(TimeIntegrationType), default=TimeIntegrationType.MODAL)
+    hht_alpha = Column(Float, nullable=True)  # In [-1/3, 0]; default -0.05
+    rayleigh_mass_coefficient = Column(Float, nullable=True)  # Matched to damping_ratio if not set
+    rayleigh_stiffness_coefficient = Column(Float, nullable=True)
+    checkpoint_interval = Column(Integer, nullable=True)  # Steps between direct integration checkpoints
     
     # Relationships
     project = relationship("Project", back_populates="analyses")
     node_results = relationship("NodeResult", back_populates="analysis", cascade="all, delete-orphan")
     element_results = relationship("ElementResult", back_populates="analysis", cascade="all, delete-orphan")
     modal_results = relationship("ModalResult", back_populates="analysis", cascade="all, delete-orphan")
+    buckling_results = relationship("BucklingResult", back_populates="analysis", cascade="all, delete-orphan")
+    
+    @property
+    def has_result_store(self) -> bool:
+        """
+        Whether node and element results of the last run are in a columnar result store.
+        """
+        return self.result_store_path is not None
 
 
 class NodeResult(BaseModel):
@@ -138,8 +240,29 @@ class ModalResult(BaseModel):
     participation_ry = Column(Float, nullable=True)
     participation_rz = Column(Float, nullable=True)
     
-    # Mode shape data (stored as JSON)
-    mode_shape = Column(JSON, nullable=True)  # {node_id: [dx, dy, dz, rx, ry, rz], ...}
+    # Mass-normalized mode shape as float32 (n_nodes, 6) rows in the order of Analysis.mode_shape_node_ids
+    mode_shape = Column(LargeBinary, nullable=True)
     
     # Relationships
-    analysis = relationship("Analysis", back_populates="modal_results")
\ No newline at end of file
+    analysis = relationship("Analysis", back_populates="modal_results")
+
+
+class BucklingResult(BaseModel):
+    """
+    Buckling result model for storing the load factors and mode shapes of a buckling analysis.
+    """
+    analysis_id = Column(String(36), ForeignKey("analysis.id", ondelete="CASCADE"), nullable=False)
+    load_case_id = Column(String(36), ForeignKey("loadcase.id", ondelete="CASCADE"), nullable=True)
+    load_combination_id = Column(String(36), ForeignKey("loadcombination.id", ondelete="CASCADE"), nullable=True)
+    
+    # Buckling properties
+    mode_number = Column(Integer, nullable=False)
+    load_factor = Column(Float, nullable=False)  # Multiple of the reference load
+    
+    # Mode shape as float32 (n_nodes, 6) rows in the order of Analysis.mode_shape_node_ids
+    mode_shape = Column(LargeBinary, nullable=True)
+    
+    # Relationships
+    analysis = relationship("Analysis", back_populates="buckling_results")
+    load_case = relationship("LoadCase", foreign_keys=[load_case_id])
+    load_combination = relationship("LoadCombination", foreign_keys=[load_combination_id])
@@ -19,5 +19,7 @@ class Project(BaseModel):
     materials = relationship("Material", back_populates="project", cascade="all, delete-orphan")
     sections = relationship("Section", back_populates="project", cascade="all, delete-orphan")
     loads = relationship("Load", back_populates="project", cascade="all, delete-orphan")
+    load_cases = relationship("LoadCase", back_populates="project", cascade="all, delete-orphan")
+    load_combinations = relationship("LoadCombination", back_populates="project", cascade="all, delete-orphan")
     analyses = relationship("Analysis", back_populates="project", cascade="all, delete-orphan")
     designs = relationship("Design", back_populates="project", cascade="all, delete-orphan")
\ No newline at end of file
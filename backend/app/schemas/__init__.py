@@ -21,7 +21,8 @@ from app.schemas.load import (
 )
 from app.schemas.analysis import (
     AnalysisBase, AnalysisCreate, AnalysisUpdate, AnalysisResponse, AnalysisRunRequest,
-    NodeResultResponse, ElementResultResponse, ModalResultResponse
+    NodeResultResponse, ElementResultResponse, ModalResultResponse, ModeShapeResponse, BucklingResultResponse,
+    TimeHistoryResponse
 )
 from app.schemas.design import (
     DesignBase, DesignCreate, DesignUpdate, DesignResponse, DesignRunRequest,
@@ -2,7 +2,10 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel, Field
 
-from app.models.analysis import AnalysisType
+from app.models.analysis import (
+    AnalysisType, LinearSolverType, PreconditionerType, AccelerationType, ModalCombinationType,
+    TimeIntegrationType, NonlinearSolverType
+)
 from app.schemas.base import BaseSchema
 
 
@@ -18,6 +21,33 @@ class AnalysisBase(BaseModel):
     include_large_deformation: bool = Field(False, description="Include large deformation effects")
     include_shear_deformation: bool = Field(True, description="Include shear deformation")
     
+    # Linear solver backend
+    linear_solver: LinearSolverType = Field(LinearSolverType.AUTO, description="Linear solver backend")
+    preconditioner: PreconditionerType = Field(PreconditionerType.BLOCK_JACOBI, description="Preconditioner for iterative solvers")
+    solver_tolerance: Optional[float] = Field(None, description="Relative residual tolerance for iterative solvers")
+    solver_max_iterations: Optional[int] = Field(None, description="Iteration limit for iterative solvers")
+    num_subdomains: Optional[int] = Field(None, description="Number of subdomains for domain decomposition (default: one per worker)")
+    incremental_reanalysis: bool = Field(False, description="Reuse the previous factorization with low-rank updates when few elements changed")
+    use_superelements: bool = Field(False, description="Condense repeated stories into superelements before the global solve")
+    
+    # P-Delta options
+    p_delta_constant_kg: bool = Field(False, description="Factorize K + Kg once per load case/combination and iterate on the residual")
+    p_delta_acceleration: AccelerationType = Field(AccelerationType.ANDERSON, description="Acceleration of the P-Delta iterations")
+    p_delta_tolerance: Optional[float] = Field(None, description="Relative displacement change for P-Delta convergence")
+    p_delta_max_iterations: Optional[int] = Field(None, description="Iteration limit for P-Delta analysis")
+    
+    # Nonlinear static options
+    nonlinear_solver: NonlinearSolverType = Field(NonlinearSolverType.NEWTON_RAPHSON, description="Newton-Raphson, modified Newton or BFGS")
+    load_steps: Optional[int] = Field(None, description="Initial number of load increments")
+    refactorize_interval: Optional[int] = Field(None, description="Iterations per tangent factorization (modified Newton, BFGS)")
+    line_search: bool = Field(False, description="Use line search in load-controlled steps")
+    arc_length: bool = Field(False, description="Use arc-length control after the first load step")
+    nonlinear_tolerance: Optional[float] = Field(None, description="Residual relative to the applied load")
+    nonlinear_max_iterations: Optional[int] = Field(None, description="Maximum iterations per load step")
+    
+    # Result storage
+    use_result_store: bool = Field(False, description="Store node and element results in a columnar result store")
+    
     # Load cases/combinations to analyze
     load_case_ids: Optional[List[str]] = Field(None, description="List of load case IDs")
     load_combination_ids: Optional[List[str]] = Field(None, description="List of load combination IDs")
@@ -25,9 +55,26 @@ class AnalysisBase(BaseModel):
     # For modal analysis
     num_modes: Optional[int] = Field(None, description="Number of modes to calculate")
     
+    # For response spectrum analysis
+    spectrum: Optional[List[List[float]]] = Field(None, description="Design spectrum as [[period (s), spectral acceleration], ...]")
+    spectrum_scale_factor: float = Field(1.0, description="Factor converting spectrum values to model acceleration units")
+    spectrum_directions: Optional[List[str]] = Field(None, description="Excitation directions (x, y, z), combined by SRSS")
+    damping_ratio: float = Field(0.05, description="Modal damping ratio")
+    modal_combination: ModalCombinationType = Field(ModalCombinationType.CQC, description="Modal combination method")
+    
     # For time history analysis
     time_step: Optional[float] = Field(None, description="Time step (s)")
     num_steps: Optional[int] = Field(None, description="Number of time steps")
+    ground_motion: Optional[List[float]] = Field(None, description="Ground accelerations sampled every time step")
+    ground_motion_direction: str = Field("x", description="Ground motion direction (x, y or z)")
+    ground_motion_scale_factor: float = Field(1.0, description="Factor converting the record to model acceleration units")
+    history_node_ids: Optional[List[str]] = Field(None, description="Nodes with recorded displacement histories (all if not set)")
+    history_element_ids: Optional[List[str]] = Field(None, description="Elements with recorded force histories")
+    time_integration: TimeIntegrationType = Field(TimeIntegrationType.MODAL, description="Modal superposition or direct integration")
+    hht_alpha: Optional[float] = Field(None, description="HHT-alpha parameter in [-1/3, 0]")
+    rayleigh_mass_coefficient: Optional[float] = Field(None, description="Mass proportional Rayleigh damping coefficient")
+    rayleigh_stiffness_coefficient: Optional[float] = Field(None, description="Stiffness proportional Rayleigh damping coefficient")
+    checkpoint_interval: Optional[int] = Field(None, description="Steps between direct integration checkpoints")
 
 
 class AnalysisCreate(AnalysisBase):
@@ -49,6 +96,33 @@ class AnalysisUpdate(BaseModel):
     include_large_deformation: Optional[bool] = Field(None, description="Include large deformation effects")
     include_shear_deformation: Optional[bool] = Field(None, description="Include shear deformation")
     
+    # Linear solver backend
+    linear_solver: Optional[LinearSolverType] = Field(None, description="Linear solver backend")
+    preconditioner: Optional[PreconditionerType] = Field(None, description="Preconditioner for iterative solvers")
+    solver_tolerance: Optional[float] = Field(None, description="Relative residual tolerance for iterative solvers")
+    solver_max_iterations: Optional[int] = Field(None, description="Iteration limit for iterative solvers")
+    num_subdomains: Optional[int] = Field(None, description="Number of subdomains for domain decomposition (default: one per worker)")
+    incremental_reanalysis: Optional[bool] = Field(None, description="Reuse the previous factorization with low-rank updates when few elements changed")
+    use_superelements: Optional[bool] = Field(None, description="Condense repeated stories into superelements before the global solve")
+    
+    # P-Delta options
+    p_delta_constant_kg: Optional[bool] = Field(None, description="Factorize K + Kg once per load case/combination and iterate on the residual")
+    p_delta_acceleration: Optional[AccelerationType] = Field(None, description="Acceleration of the P-Delta iterations")
+    p_delta_tolerance: Optional[float] = Field(None, description="Relative displacement change for P-Delta convergence")
+    p_delta_max_iterations: Optional[int] = Field(None, description="Iteration limit for P-Delta analysis")
+    
+    # Nonlinear static options
+    nonlinear_solver: Optional[NonlinearSolverType] = Field(None, description="Newton-Raphson, modified Newton or BFGS")
+    load_steps: Optional[int] = Field(None, description="Initial number of load increments")
+    refactorize_interval: Optional[int] = Field(None, description="Iterations per tangent factorization (modified Newton, BFGS)")
+    line_search: Optional[bool] = Field(None, description="Use line search in load-controlled steps")
+    arc_length: Optional[bool] = Field(None, description="Use arc-length control after the first load step")
+    nonlinear_tolerance: Optional[float] = Field(None, description="Residual relative to the applied load")
+    nonlinear_max_iterations: Optional[int] = Field(None, description="Maximum iterations per load step")
+    
+    # Result storage
+    use_result_store: Optional[bool] = Field(None, description="Store node and element results in a columnar result store")
+    
     # Load cases/combinations to analyze
     load_case_ids: Optional[List[str]] = Field(None, description="List of load case IDs")
     load_combination_ids: Optional[List[str]] = Field(None, description="List of load combination IDs")
@@ -56,9 +130,26 @@ class AnalysisUpdate(BaseModel):
     # For modal analysis
     num_modes: Optional[int] = Field(None, description="Number of modes to calculate")
     
+    # For response spectrum analysis
+    spectrum: Optional[List[List[float]]] = Field(None, description="Design spectrum as [[period (s), spectral acceleration], ...]")
+    spectrum_scale_factor: Optional[float] = Field(None, description="Factor converting spectrum values to model acceleration units")
+    spectrum_directions: Optional[List[str]] = Field(None, description="Excitation directions (x, y, z), combined by SRSS")
+    damping_ratio: Optional[float] = Field(None, description="Modal damping ratio")
+    modal_combination: Optional[ModalCombinationType] = Field(None, description="Modal combination method")
+    
     # For time history analysis
     time_step: Optional[float] = Field(None, description="Time step (s)")
     num_steps: Optional[int] = Field(None, description="Number of time steps")
+    ground_motion: Optional[List[float]] = Field(None, description="Ground accelerations sampled every time step")
+    ground_motion_direction: Optional[str] = Field(None, description="Ground motion direction (x, y or z)")
+    ground_motion_scale_factor: Optional[float] = Field(None, description="Factor converting the record to model acceleration units")
+    history_node_ids: Optional[List[str]] = Field(None, description="Nodes with recorded displacement histories (all if not set)")
+    history_element_ids: Optional[List[str]] = Field(None, description="Elements with recorded force histories")
+    time_integration: Optional[TimeIntegrationType] = Field(None, description="Modal superposition or direct integration")
+    hht_alpha: Optional[float] = Field(None, description="HHT-alpha parameter in [-1/3, 0]")
+    rayleigh_mass_coefficient: Optional[float] = Field(None, description="Mass proportional Rayleigh damping coefficient")
+    rayleigh_stiffness_coefficient: Optional[float] = Field(None, description="Stiffness proportional Rayleigh damping coefficient")
+    checkpoint_interval: Optional[int] = Field(None, description="Steps between direct integration checkpoints")
 
 
 class AnalysisResponse(AnalysisBase, BaseSchema):
@@ -68,6 +159,8 @@ class AnalysisResponse(AnalysisBase, BaseSchema):
     project_id: str = Field(..., description="Project ID")
     is_complete: bool = Field(False, description="Whether the analysis is complete")
     run_date: Optional[datetime] = Field(None, description="Date and time of analysis run")
+    solver_statistics: Optional[Dict[str, Any]] = Field(None, description="Solver statistics from the last run")
+    has_result_store: bool = Field(False, description="Whether results are read from a columnar result store")
 
 
 class AnalysisRunRequest(BaseModel):
@@ -148,5 +241,45 @@ class ModalResultResponse(BaseSchema):
     participation_ry: Optional[float] = Field(None, description="Participation factor around Y axis")
     participation_rz: Optional[float] = Field(None, description="Participation factor around Z axis")
     
-    # Mode shape data
-    mode_shape: Optional[Dict[str, List[float]]] = Field(None, description="Mode shape data")
\ No newline at end of file
+    # Mode shape data, mass-normalized
+    mode_shape: Optional[Dict[str, List[float]]] = Field(None, description="Mode shape data")
+
+
+class ModeShapeResponse(BaseModel):
+    """
+    Schema for one mode shape as rows of node values.
+    """
+    analysis_id: str = Field(..., description="Analysis ID")
+    mode_number: int = Field(..., description="Mode number")
+    node_ids: List[str] = Field(..., description="Node IDs in row order")
+    values: List[List[float]] = Field(..., description="Mode shape rows (dx, dy, dz, rx, ry, rz) per node")
+
+
+class BucklingResultResponse(BaseSchema):
+    """
+    Schema for buckling result response.
+    """
+    analysis_id: str = Field(..., description="Analysis ID")
+    load_case_id: Optional[str] = Field(None, description="Reference load case ID")
+    load_combination_id: Optional[str] = Field(None, description="Reference load combination ID")
+    mode_number: int = Field(..., description="Mode number")
+    load_factor: float = Field(..., description="Buckling load factor (multiple of the reference load)")
+    
+    # Mode shape data, scaled to a largest component of 1
+    mode_shape: Optional[Dict[str, List[float]]] = Field(None, description="Mode shape data")
+
+
+class TimeHistoryResponse(BaseModel):
+    """
+    Schema for a node displacement or element force time history.
+    """
+    node_id: Optional[str] = Field(None, description="Node ID")
+    element_id: Optional[str] = Field(None, description="Element ID")
+    times: List[float] = Field(..., description="Step times (s)")
+    
+    # Node displacements (dx, dy, dz, rx, ry, rz) per step
+    displacements: Optional[List[List[float]]] = Field(None, description="Node displacement history")
+    
+    # Element end forces per step and position, columns as in element results
+    positions: Optional[List[float]] = Field(None, description="Relative positions along the element")
+    forces: Optional[List[List[List[float]]]] = Field(None, description="Element force history")
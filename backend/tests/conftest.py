@@ -0,0 +1,208 @@
+import os
+import tempfile
+
+# Run against a throwaway SQLite database and result directory; set before the app reads its settings
+_directory = tempfile.mkdtemp(prefix="strumind-tests-")
+os.environ["USE_SQLITE"] = "true"
+os.environ["SQLITE_DB"] = os.path.join(_directory, "test.db")
+os.environ["RESULTS_DIR"] = os.path.join(_directory, "results")
+os.environ.pop("STIFFNESS_CACHE_DIR", None)
+
+import numpy as np
+import pytest
+
+from app.db.init_db import init_db
+from app.db.session import SessionLocal
+from app.models import (
+    Project, Node, Element, ElementType, Material, MaterialType, Section, SectionType,
+    Load, LoadType, LoadCase, LoadCombination, LoadCombinationCase, Analysis, AnalysisType
+)
+from app.core.analysis.solver import StructuralAnalysisSolver
+from app.core.analysis.stiffness_cache import stiffness_cache
+
+# Steel in N-mm-tonne-s units
+E = 200000.0
+NU = 0.3
+DENSITY = 7.85e-9
+AREA = 8000.0
+IY = 2e7
+IZ = 8e7
+J = 5e5
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    init_db()
+
+
+@pytest.fixture(autouse=True)
+def clear_stiffness_cache():
+    stiffness_cache.clear()
+    yield
+    stiffness_cache.clear()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+class Model:
+    """
+    A project under construction with one steel material and section.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.project = Project(name="test")
+        db.add(self.project)
+        db.flush()
+
+        self.material = Material(
+            project_id=self.project.id, name="S355", material_type=MaterialType.STEEL, density=DENSITY,
+            elastic_modulus=E, poisson_ratio=NU, yield_strength=355.0, ultimate_strength=510.0
+        )
+        db.add(self.material)
+        db.flush()
+
+        self.section = Section(
+            project_id=self.project.id, name="W", section_type=SectionType.I_SECTION,
+            material_id=self.material.id, area=AREA, moment_of_inertia_y=IY, moment_of_inertia_z=IZ,
+            torsional_constant=J, elastic_modulus_y=2e5, elastic_modulus_z=6e5
+        )
+        db.add(self.section)
+        db.flush()
+
+        self.load_cases = []
+        self.load_combinations = []
+
+    def node(self, x, y, z, restraints=(False,) * 6):
+        node = Node(
+            project_id=self.project.id, name=f"N{x}-{y}-{z}", x=x, y=y, z=z, is_support=any(restraints),
+            restraint_x=restraints[0], restraint_y=restraints[1], restraint_z=restraints[2],
+            restraint_rx=restraints[3], restraint_ry=restraints[4], restraint_rz=restraints[5]
+        )
+        self.db.add(node)
+        self.db.flush()
+        return node
+
+    def element(self, start, end, element_type=ElementType.BEAM):
+        element = Element(
+            project_id=self.project.id, name=f"E{start.name}-{end.name}", element_type=element_type,
+            start_node_id=start.id, end_node_id=end.id, section_id=self.section.id,
+            material_id=self.material.id, angle=0.0
+        )
+        self.db.add(element)
+        return element
+
+    def load_case(self, name, nodal_loads):
+        """
+        Add a load case from {node: (fx, fy, fz)}.
+        """
+        load_case = LoadCase(project_id=self.project.id, name=name)
+        self.db.add(load_case)
+        self.db.flush()
+        for node, (fx, fy, fz) in nodal_loads.items():
+            self.db.add(Load(
+                project_id=self.project.id, load_case_id=load_case.id, load_type=LoadType.POINT,
+                node_id=node.id, fx=fx, fy=fy, fz=fz
+            ))
+        self.load_cases.append(load_case)
+        return load_case
+
+    def load_combination(self, name, factors):
+        """
+        Add a load combination from {load_case: factor}.
+        """
+        combination = LoadCombination(project_id=self.project.id, name=name)
+        self.db.add(combination)
+        self.db.flush()
+        for load_case, factor in factors.items():
+            self.db.add(LoadCombinationCase(
+                load_combination_id=combination.id, load_case_id=load_case.id, factor=factor
+            ))
+        self.load_combinations.append(combination)
+        return combination
+
+    def analysis(self, analysis_type=AnalysisType.LINEAR_STATIC, **options):
+        """
+        Create an analysis of all load cases and combinations.
+        """
+        self.db.commit()
+        analysis = Analysis(
+            project_id=self.project.id, name=analysis_type.value, analysis_type=analysis_type,
+            load_case_ids=[load_case.id for load_case in self.load_cases],
+            load_combination_ids=[combination.id for combination in self.load_combinations],
+            **options
+        )
+        self.db.add(analysis)
+        self.db.commit()
+        return analysis
+
+    def run(self, analysis_type=AnalysisType.LINEAR_STATIC, clear_cache=True, **options):
+        """
+        Create and run an analysis of all load cases and combinations.
+
+        The stiffness cache is cleared first unless ``clear_cache`` is False.
+        """
+        analysis = self.analysis(analysis_type, **options)
+        if clear_cache:
+            stiffness_cache.clear()
+        StructuralAnalysisSolver(self.db, analysis.id).run_analysis()
+        self.db.refresh(analysis)
+        return analysis
+
+
+@pytest.fixture
+def model(db):
+    return Model(db)
+
+
+@pytest.fixture
+def frame(model):
+    """
+    A 4-story, 2 x 2 bay moment frame with lateral and gravity load cases and one combination.
+
+    Every beam has one intermediate node. Returns the model and its nodes by (i, j, story).
+    """
+    bay, height, bays, stories = 6000.0, 3500.0, 2, 4
+    nodes = {}
+    for k in range(stories + 1):
+        for j in range(bays + 1):
+            for i in range(bays + 1):
+                nodes[(i, j, k)] = model.node(i * bay, j * bay, k * height, (k == 0,) * 6)
+
+    for k in range(1, stories + 1):
+        for j in range(bays + 1):
+            for i in range(bays + 1):
+                model.element(nodes[(i, j, k - 1)], nodes[(i, j, k)], ElementType.COLUMN)
+                for di, dj in ((1, 0), (0, 1)):
+                    if i + di > bays or j + dj > bays:
+                        continue
+                    start, end = nodes[(i, j, k)], nodes[(i + di, j + dj, k)]
+                    middle = model.node((start.x + end.x) / 2, (start.y + end.y) / 2, start.z)
+                    model.element(start, middle)
+                    model.element(middle, end)
+
+    lateral = model.load_case("Lateral", {nodes[(0, 0, k)]: (10000.0 * k, 0.0, 0.0) for k in range(1, stories + 1)})
+    gravity = model.load_case("Gravity", {
+        node: (0.0, 0.0, -50000.0) for (i, j, k), node in nodes.items() if k > 0
+    })
+    model.load_combination("1.2G + 1.6L", {gravity: 1.2, lateral: 1.6})
+
+    return model, nodes
+
+
+def node_displacements(db, analysis):
+    """
+    Displacements (dx, dy, dz, rx, ry, rz) of all node results, in a stable order.
+    """
+    from app.crud.analysis import get_node_results
+
+    results = get_node_results(db, analysis_id=analysis.id, limit=10**9)
+    results = sorted(results, key=lambda r: (r.node_id, r.load_case_id or "", r.load_combination_id or ""))
+    return np.array([[r.dx, r.dy, r.dz, r.rx, r.ry, r.rz] for r in results])
@@ -0,0 +1,63 @@
+import numpy as np
+
+from app.core.analysis.assembly import (
+    assemble_element_kernel_parallel, assemble_sparse_matrix, assemble_sparse_matrix_parallel, element_dof_indices
+)
+from app.core.analysis.kernels import element_mass_kernel, element_stiffness_kernel
+from app.core.config import settings
+
+from conftest import node_displacements
+
+
+def chain_data(num_elements=50, seed=0):
+    rng = np.random.default_rng(seed)
+    d = rng.normal(size=(num_elements, 3)) * 1000.0
+    data = {
+        "dx": d[:, 0], "dy": d[:, 1], "dz": d[:, 2], "L": np.linalg.norm(d, axis=1),
+        "angle": rng.uniform(0, 90, num_elements), "E": np.full(num_elements, 200000.0),
+        "nu": np.full(num_elements, 0.3), "rho": np.full(num_elements, 7.85e-9),
+        "A": rng.uniform(1000, 10000, num_elements), "Iy": rng.uniform(1e6, 1e8, num_elements),
+        "Iz": rng.uniform(1e6, 1e8, num_elements), "J": rng.uniform(1e5, 1e6, num_elements),
+    }
+    dofs = element_dof_indices(np.arange(num_elements), np.arange(1, num_elements + 1))
+    return data, dofs, 6 * (num_elements + 1)
+
+
+def test_parallel_kernel_assembly_matches_serial():
+    data, dofs, total_dof = chain_data()
+    serial = element_stiffness_kernel(data)
+    K_serial = assemble_sparse_matrix(serial["K_global"], dofs, total_dof)
+
+    K, stacks = assemble_element_kernel_parallel(
+        element_stiffness_kernel, data, dofs, total_dof, chunk_size=7, max_workers=2, keep=("T", "K_local")
+    )
+    assert abs(K - K_serial).max() <= 1e-12 * abs(K_serial).max()
+    assert np.array_equal(stacks["T"], serial["T"])
+    assert np.array_equal(stacks["K_local"], serial["K_local"])
+    # The kept stacks are copied out of shared memory, not views of released blocks or files
+    assert all(type(stack) is np.ndarray and stack.flags.owndata for stack in stacks.values())
+
+    M, _ = assemble_element_kernel_parallel(
+        element_mass_kernel, data, dofs, total_dof, chunk_size=7, max_workers=2, assemble="M_global"
+    )
+    M_serial = assemble_sparse_matrix(element_mass_kernel(data)["M_global"], dofs, total_dof)
+    assert abs(M - M_serial).max() <= 1e-12 * abs(M_serial).max()
+
+
+def test_parallel_matrix_assembly_matches_serial():
+    data, dofs, total_dof = chain_data()
+    K_elements = element_stiffness_kernel(data)["K_global"]
+
+    K = assemble_sparse_matrix_parallel(K_elements, dofs, total_dof, chunk_size=7, max_workers=2)
+    K_serial = assemble_sparse_matrix(K_elements, dofs, total_dof)
+    assert abs(K - K_serial).max() <= 1e-12 * abs(K_serial).max()
+
+
+def test_chunked_analysis_matches_serial(frame, monkeypatch):
+    model, _ = frame
+    expected = node_displacements(model.db, model.run())
+
+    monkeypatch.setattr(settings, "ASSEMBLY_CHUNK_SIZE", 16)
+    monkeypatch.setattr(settings, "ASSEMBLY_WORKERS", 2)
+    analysis = model.run()
+    assert np.allclose(node_displacements(model.db, analysis), expected, atol=1e-12 * np.abs(expected).max())
@@ -0,0 +1,44 @@
+import numpy as np
+import scipy.sparse as sp
+
+from app.core.analysis.buckling import buckling_load_factors
+from app.core.analysis.linear_solvers import SparseLUSolver
+from app.crud.analysis import get_buckling_results
+from app.models import AnalysisType, ElementType
+
+from conftest import E, IY, IZ
+
+FIXED = (True,) * 6
+
+
+def test_cantilever_column_euler_loads(model):
+    height, segments, P = 4000.0, 16, 1000.0
+    nodes = [model.node(0.0, 0.0, height * i / segments, FIXED if i == 0 else (False,) * 6) for i in range(segments + 1)]
+    for start, end in zip(nodes, nodes[1:]):
+        model.element(start, end, ElementType.COLUMN)
+    load_case = model.load_case("Axial", {nodes[-1]: (0.0, 0.0, -P)})
+    analysis = model.run(AnalysisType.BUCKLING, num_modes=3)
+
+    results = get_buckling_results(model.db, analysis_id=analysis.id, load_case_id=load_case.id)
+    load_factors = [result["load_factor"] for result in results]
+
+    # The first modes are the Euler loads about the weak and the strong axis
+    euler = [np.pi**2 * E * I / (4 * height**2) / P for I in sorted((IY, IZ))]
+    assert np.allclose(load_factors[:2], euler, rtol=1e-3)
+    assert len(results[0]["mode_shape"]) == len(nodes)
+
+
+def test_load_factors_match_dense_generalized_eigenproblem():
+    n = 40
+    K = sp.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(n, n), format="csr") * 100.0
+    diagonal = -np.ones(n)
+    diagonal[0] = 0.5  # One stiffening term gives a negative load factor that is dropped
+    Kg = sp.diags(diagonal, format="csr")
+
+    load_factors, modes = buckling_load_factors(K, Kg, SparseLUSolver().factorize(K), 4)
+
+    lam = np.linalg.eigvals(np.linalg.solve(-Kg.toarray(), K.toarray())).real
+    expected = np.sort(lam[lam > 0])[:4]
+    assert np.allclose(load_factors, expected)
+    for load_factor, mode in zip(load_factors, modes.T):
+        assert np.allclose((K + load_factor * Kg) @ mode, 0.0, atol=1e-8 * np.abs(K @ mode).max())
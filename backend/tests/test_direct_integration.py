@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from app.core.analysis import direct_integration
+from app.core.analysis.solver import StructuralAnalysisSolver
+from app.crud.analysis import get_time_history
+from app.models import AnalysisType
+from app.models.analysis import TimeIntegrationType
+
+TIME_STEP = 0.01
+NUM_STEPS = 600
+
+
+def ground_motion():
+    t = np.arange(NUM_STEPS) * TIME_STEP
+    return (3000.0 * np.sin(5 * t) * np.exp(-0.3 * t)).tolist()
+
+
+def histories(db, analysis, node, element):
+    displacements = get_time_history(db, analysis_id=analysis.id, node_id=node.id)["displacements"]
+    forces = get_time_history(db, analysis_id=analysis.id, element_id=element.id)["forces"]
+    return np.array(displacements), np.array(forces)
+
+
+def test_undamped_newmark_matches_modal_superposition(frame):
+    model, nodes = frame
+    top = nodes[(2, 2, 4)]
+    options = dict(
+        time_step=TIME_STEP, ground_motion=ground_motion(), ground_motion_direction="y",
+        history_node_ids=[top.id], damping_ratio=0.0, num_modes=10000
+    )
+
+    modal = model.run(AnalysisType.TIME_HISTORY, **options)
+    newmark = model.run(
+        AnalysisType.TIME_HISTORY, time_integration=TimeIntegrationType.NEWMARK,
+        rayleigh_mass_coefficient=0.0, rayleigh_stiffness_coefficient=0.0, **options
+    )
+
+    expected = np.array(get_time_history(model.db, analysis_id=modal.id, node_id=top.id)["displacements"])
+    result = np.array(get_time_history(model.db, analysis_id=newmark.id, node_id=top.id)["displacements"])
+    assert np.abs(result - expected).max() < 0.02 * np.abs(expected).max()
+
+
+def test_hht_resumes_from_a_checkpoint(frame, monkeypatch):
+    model, nodes = frame
+    top, element = nodes[(2, 2, 4)], model.project.elements[0]
+    options = dict(
+        time_step=TIME_STEP, ground_motion=ground_motion(), ground_motion_direction="y",
+        history_node_ids=[top.id], history_element_ids=[element.id],
+        time_integration=TimeIntegrationType.HHT_ALPHA, checkpoint_interval=150, num_modes=4
+    )
+    reference = model.run(AnalysisType.TIME_HISTORY, **options)
+
+    # Interrupt a run after its second checkpoint
+    analysis = model.analysis(AnalysisType.TIME_HISTORY, **options)
+    step = direct_integration.HHTIntegrator.step
+    calls = []
+
+    def interrupted_step(self, *args):
+        calls.append(None)
+        if len(calls) == 400:
+            raise RuntimeError("worker stopped")
+        return step(self, *args)
+
+    monkeypatch.setattr(direct_integration.HHTIntegrator, "step", interrupted_step)
+    with pytest.raises(RuntimeError):
+        StructuralAnalysisSolver(model.db, analysis.id).run_analysis()
+    monkeypatch.setattr(direct_integration.HHTIntegrator, "step", step)
+
+    # The rerun starts from the last checkpoint and reproduces the uninterrupted histories
+    StructuralAnalysisSolver(model.db, analysis.id).run_analysis()
+    model.db.refresh(analysis)
+    statistics = analysis.solver_statistics["time_history"]
+    assert statistics["first_step"] == 300
+    assert np.isclose(statistics["peak_displacement"], reference.solver_statistics["time_history"]["peak_displacement"])
+
+    for result, expected in zip(histories(model.db, analysis, top, element), histories(model.db, reference, top, element)):
+        assert result.shape == expected.shape
+        assert np.allclose(result, expected, rtol=1e-9, atol=1e-9 * np.abs(expected).max())
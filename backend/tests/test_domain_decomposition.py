@@ -0,0 +1,69 @@
+import numpy as np
+
+from app.core.analysis import domain_decomposition
+from app.core.analysis.domain_decomposition import partition_nodes, solve_domain_decomposition
+from app.core.analysis.solver import StructuralAnalysisSolver
+from app.models.analysis import LinearSolverType
+
+from conftest import node_displacements
+
+
+def test_partition_nodes_balances_a_chain():
+    element_nodes = np.stack([np.arange(99), np.arange(1, 100)], axis=1)
+    parts = partition_nodes(element_nodes, 100, 4)
+
+    assert sorted(np.bincount(parts)) == [25, 25, 25, 25]
+    # Every part of a chain is contiguous, so only three elements cross parts
+    assert (parts[element_nodes[:, 0]] != parts[element_nodes[:, 1]]).sum() == 3
+
+
+def test_domain_decomposition_matches_direct_solve(frame, monkeypatch):
+    model, _ = frame
+    # Form the Schur complements over several column blocks
+    monkeypatch.setattr(domain_decomposition, "SCHUR_BLOCK_COLUMNS", 7)
+    expected = node_displacements(model.db, model.run())
+
+    for num_subdomains in (2, 3):
+        analysis = model.run(linear_solver=LinearSolverType.DOMAIN_DECOMPOSITION, num_subdomains=num_subdomains)
+        statistics = analysis.solver_statistics
+
+        assert statistics["linear_solver"] == LinearSolverType.DOMAIN_DECOMPOSITION.value
+        assert statistics["subdomains"] == num_subdomains
+        assert 0 < statistics["interface_dof"] < statistics["num_dof"]
+        assert np.allclose(node_displacements(model.db, analysis), expected, atol=1e-9 * np.abs(expected).max())
+
+
+def test_degenerate_subdomains_match_direct_solve(model):
+    # Three nodes cannot form eight parts. Elements run towards the support, so the
+    # support's part starts no element and is empty, and the element ending at the
+    # support has no interior DOFs
+    nodes = [model.node(1000.0 * i, 0.0, 0.0, (i == 0,) * 6) for i in range(3)]
+    for start, end in zip(nodes, nodes[1:]):
+        model.element(end, start)
+    model.load_case("Tip", {nodes[-1]: (1000.0, 2000.0, -3000.0)})
+    expected = node_displacements(model.db, model.run())
+
+    analysis = model.run(linear_solver=LinearSolverType.DOMAIN_DECOMPOSITION, num_subdomains=8)
+    statistics = analysis.solver_statistics
+
+    assert statistics["subdomains"] == 3
+    assert statistics["interface_dof"] == 6
+    assert np.allclose(node_displacements(model.db, analysis), expected, atol=1e-9 * np.abs(expected).max())
+
+
+def test_interface_solve_follows_the_solver_overrides(frame):
+    model, _ = frame
+    solver = StructuralAnalysisSolver(model.db, model.run().id)
+    K_elements, dof_indices = solver._calculate_element_stiffness_matrices()
+    K_ff = solver._partition_matrix(solver._assemble_global_stiffness_matrix())[0]
+    free_mask = ~solver.constrained_mask
+    F_global = np.zeros((solver.total_dof, 2))
+    F_global[free_mask] = np.random.default_rng(0).normal(size=(free_mask.sum(), 2))
+
+    U_global, statistics = solve_domain_decomposition(
+        K_elements, dof_indices, solver.node_position[solver.snapshot.element_nodes], free_mask, F_global, 3,
+        max_workers=2, linear_solver=LinearSolverType.ITERATIVE, tolerance=1e-12
+    )
+
+    assert statistics["interface_solver"] == LinearSolverType.ITERATIVE.value
+    assert np.allclose(K_ff @ U_global[free_mask], F_global[free_mask], atol=1e-6 * np.abs(F_global).max())
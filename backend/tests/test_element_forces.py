@@ -0,0 +1,31 @@
+import numpy as np
+
+from app.crud.analysis import get_element_results
+
+from conftest import AREA
+
+FIXED = (True,) * 6
+
+
+def test_cantilever_end_forces_and_stresses(model):
+    length, segments, P, H = 3000.0, 3, 1000.0, 5000.0
+    nodes = [model.node(length * i / segments, 0.0, 0.0, FIXED if i == 0 else (False,) * 6) for i in range(segments + 1)]
+    elements = [model.element(start, end) for start, end in zip(nodes, nodes[1:])]
+    model.load_case("Tip", {nodes[-1]: (H, 0.0, -P)})
+    analysis = model.run()
+
+    def results(element):
+        rows = get_element_results(model.db, analysis_id=analysis.id, element_id=element.id)
+        return {row.position: row for row in rows}
+
+    root, tip = results(elements[0]), results(elements[-1])
+
+    # Tension H and shear P throughout; moment P * (length - x)
+    for row in (*root.values(), *tip.values()):
+        assert np.isclose(abs(row.axial_force), H)
+        assert np.isclose(abs(row.shear_force_z), P)
+        assert np.isclose(row.axial_stress, row.axial_force / AREA)
+    assert np.isclose(abs(root[0.0].bending_moment_y), P * length)
+    assert np.isclose(abs(root[1.0].bending_moment_y), P * length * (segments - 1) / segments)
+    assert abs(tip[1.0].bending_moment_y) < 1e-6 * P * length
+    assert np.isclose(root[0.0].von_mises_stress, np.hypot(root[0.0].axial_stress, np.sqrt(3) * root[0.0].bending_stress_y))
@@ -0,0 +1,77 @@
+import numpy as np
+
+from app.core.analysis.kernels import (
+    element_mass_kernel, element_stiffness_kernel, element_stiffness_matrices, rotation_matrices
+)
+
+
+def element_data(n=20, seed=0):
+    rng = np.random.default_rng(seed)
+    d = rng.normal(size=(n, 3)) * 1000.0
+    d[0] = (0.0, 0.0, 3000.0)  # Vertical element
+    L = np.linalg.norm(d, axis=1)
+    return {
+        "dx": d[:, 0], "dy": d[:, 1], "dz": d[:, 2], "L": L, "angle": rng.uniform(0, 90, n),
+        "E": np.full(n, 200000.0), "nu": np.full(n, 0.3), "rho": np.full(n, 7.85e-9),
+        "A": rng.uniform(1000, 10000, n), "Iy": rng.uniform(1e6, 1e8, n), "Iz": rng.uniform(1e6, 1e8, n),
+        "J": rng.uniform(1e5, 1e6, n)
+    }
+
+
+def rigid_body_modes(d):
+    """
+    The six rigid body displacement fields of an element with its start node at the origin.
+    """
+    modes = np.zeros((12, 6))
+    for axis in range(3):
+        modes[axis, axis] = modes[6 + axis, axis] = 1.0
+        rotation = np.zeros(3)
+        rotation[axis] = 1.0
+        modes[3 + axis, 3 + axis] = modes[9 + axis, 3 + axis] = 1.0
+        modes[6:9, 3 + axis] = np.cross(rotation, d)
+    return modes
+
+
+def test_rotation_matrices_are_orthonormal():
+    data = element_data()
+    R = rotation_matrices(data["dx"], data["dy"], data["dz"], data["L"], data["angle"])
+
+    assert np.allclose(R @ np.swapaxes(R, 1, 2), np.eye(3), atol=1e-12)
+    assert np.allclose(np.linalg.det(R), 1.0)
+    assert np.allclose(R[:, 0], np.stack([data["dx"], data["dy"], data["dz"]], axis=1) / data["L"][:, None])
+
+
+def test_batched_kernel_matches_single_elements():
+    data = element_data()
+    batched = element_stiffness_kernel(data)
+
+    for i in range(len(data["L"])):
+        single = element_stiffness_kernel({key: value[i:i + 1] for key, value in data.items()})
+        assert np.allclose(single["K_global"][0], batched["K_global"][i])
+
+    K = element_stiffness_matrices(3000.0, 200000.0, 8000.0, 2e7, 8e7, 5e5, 0.3)[0]
+    assert np.isclose(K[0, 0], 200000.0 * 8000.0 / 3000.0)
+    assert np.isclose(K[2, 2], 12 * 200000.0 * 2e7 / 3000.0**3)
+    assert np.isclose(K[1, 1], 12 * 200000.0 * 8e7 / 3000.0**3)
+
+
+def test_global_stiffness_is_symmetric_with_rigid_body_null_space():
+    data = element_data()
+    K = element_stiffness_kernel(data)["K_global"]
+
+    assert np.allclose(K, np.swapaxes(K, 1, 2))
+    for i in range(len(K)):
+        d = np.array([data["dx"][i], data["dy"][i], data["dz"][i]])
+        forces = K[i] @ rigid_body_modes(d)
+        assert np.abs(forces).max() <= 1e-8 * np.abs(K[i]).max()
+
+
+def test_mass_kernel_conserves_translational_mass():
+    data = element_data()
+    M = element_mass_kernel(data)["M_global"]
+    mass = data["rho"] * data["A"] * data["L"]
+
+    for axis in range(3):
+        translation = np.zeros(12)
+        translation[[axis, 6 + axis]] = 1.0
+        assert np.allclose(translation @ M @ translation, mass)
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from app.core.analysis.linear_solvers import (
+    DenseCholeskySolver, Factorization, IterativeSolver, LinearSolver, SparseLUSolver, factorize,
+    select_linear_solver
+)
+from app.models.analysis import LinearSolverType
+
+
+def laplacian(n=30):
+    """
+    The 2D five-point Laplacian on an n x n grid, symmetric positive definite.
+    """
+    T = sp.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(n, n))
+    return (sp.kron(sp.identity(n), T) + sp.kron(T, sp.identity(n))).tocsr()
+
+
+def test_backends_agree_on_a_positive_definite_system():
+    K = laplacian()
+    F = np.random.default_rng(0).normal(size=(K.shape[0], 3))
+
+    for backend in (DenseCholeskySolver(), SparseLUSolver(), IterativeSolver(tolerance=1e-12)):
+        U = backend.factorize(K).solve(F)
+        assert np.allclose(K @ U, F, atol=1e-8)
+
+
+def test_iterative_solves_report_only_their_own_iterations():
+    factorization = IterativeSolver(tolerance=1e-10).factorize(laplacian())
+    F = np.ones((900, 2))
+
+    factorization.solve(F)
+    first = list(factorization.iterations)
+    factorization.solve(F)
+
+    assert len(first) == 2 and all(iterations > 0 for iterations in first)
+    assert factorization.iterations == first
+
+
+def test_automatic_selection_follows_size_and_memory():
+    K = laplacian()
+
+    assert isinstance(select_linear_solver(K, memory=2**34), DenseCholeskySolver)
+    assert isinstance(select_linear_solver(K, memory=2 * 8 * K.shape[0]**2), SparseLUSolver)
+    assert isinstance(select_linear_solver(K, memory=1000), IterativeSolver)
+    assert isinstance(select_linear_solver(K, LinearSolverType.SPARSE_LU), SparseLUSolver)
+    assert isinstance(select_linear_solver(K, LinearSolverType.MATRIX_FREE_PCG), IterativeSolver)
+
+
+def test_indefinite_systems_use_pivoting_lu():
+    K = (laplacian() - 1.0 * sp.identity(900)).tocsr()  # Shifted past the lowest eigenvalues
+    F = np.ones(K.shape[0])
+
+    for override in (None, LinearSolverType.DENSE_CHOLESKY, LinearSolverType.ITERATIVE):
+        factorization, backend, _ = factorize(K, override, indefinite=True)
+        assert isinstance(backend, SparseLUSolver)
+        assert np.allclose(K @ factorization.solve(F), F)
+
+    with pytest.raises(np.linalg.LinAlgError):
+        DenseCholeskySolver().factorize(K)
+
+
+def test_backend_interfaces_are_abstract():
+    with pytest.raises(TypeError):
+        Factorization()
+    with pytest.raises(TypeError):
+        LinearSolver()
+
+    class Incomplete(LinearSolver):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,38 @@
+import numpy as np
+
+from app.core.analysis.matrix_free import ElementOperator
+from app.core.analysis.solver import StructuralAnalysisSolver
+from app.models.analysis import LinearSolverType, PreconditionerType
+
+from conftest import node_displacements
+
+
+def test_element_operator_matches_assembled_stiffness(frame):
+    model, _ = frame
+    analysis = model.run()
+    solver = StructuralAnalysisSolver(model.db, analysis.id)
+
+    K_elements, dof_indices = solver._calculate_element_stiffness_matrices()
+    operator = ElementOperator(K_elements, dof_indices, ~solver.constrained_mask)
+    K_global = solver._assemble_global_stiffness_matrix()
+    K_ff = solver._partition_matrix(K_global)[0]
+
+    v = np.random.default_rng(0).normal(size=operator.num_free)
+    assert np.allclose(operator.matvec(v), K_ff @ v)
+    assert np.allclose(operator.diagonal(), K_ff.diagonal())
+
+    node = np.flatnonzero(~solver.constrained_mask.reshape(-1, 6).any(axis=1))[0]
+    dofs = slice(6 * node, 6 * node + 6)
+    assert np.allclose(operator.nodal_blocks()[node], K_global[dofs, dofs].toarray())
+
+
+def test_matrix_free_pcg_matches_direct_solve(frame):
+    model, _ = frame
+    direct = node_displacements(model.db, model.run())
+
+    for preconditioner in (PreconditionerType.JACOBI, PreconditionerType.BLOCK_JACOBI):
+        analysis = model.run(
+            linear_solver=LinearSolverType.MATRIX_FREE_PCG, preconditioner=preconditioner, solver_tolerance=1e-12
+        )
+        assert analysis.solver_statistics["linear_solver"] == LinearSolverType.MATRIX_FREE_PCG.value
+        assert np.allclose(node_displacements(model.db, analysis), direct, rtol=1e-6, atol=1e-8 * np.abs(direct).max())
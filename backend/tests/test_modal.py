@@ -0,0 +1,37 @@
+import numpy as np
+from scipy.linalg import eigh
+
+from app.core.analysis.solver import StructuralAnalysisSolver
+from app.crud.analysis import get_modal_results
+from app.models import AnalysisType
+
+from conftest import AREA, DENSITY, E, IY, IZ
+
+FIXED = (True,) * 6
+
+
+def test_cantilever_fundamental_frequencies(model):
+    length, segments = 3000.0, 20
+    nodes = [model.node(length * i / segments, 0.0, 0.0, FIXED if i == 0 else (False,) * 6) for i in range(segments + 1)]
+    for start, end in zip(nodes, nodes[1:]):
+        model.element(start, end)
+    analysis = model.run(AnalysisType.MODAL, num_modes=6)
+    modes = get_modal_results(model.db, analysis_id=analysis.id, include_mode_shapes=False)
+
+    # The first bending mode in each plane is the one with the largest participation in that direction
+    for direction, I in (("z", IY), ("y", IZ)):
+        mode = max(modes, key=lambda mode: abs(mode[f"participation_{direction}"]))
+        expected = 1.8751**2 / (2 * np.pi) * np.sqrt(E * I / (DENSITY * AREA * length**4))
+        assert np.isclose(mode["frequency"], expected, rtol=0.01)
+
+
+def test_shift_invert_modes_match_dense_eigensolution(frame):
+    model, _ = frame
+    analysis = model.run(AnalysisType.MODAL, num_modes=6)
+    solver = StructuralAnalysisSolver(model.db, analysis.id)
+
+    eigenvalues, _, M_reduced, _ = solver._solve_modes()
+    K_reduced = solver._partition_matrix(solver._get_stiffness_matrices()["K_global"])[0]
+    expected = eigh(K_reduced.toarray(), M_reduced.toarray(), eigvals_only=True)[:6]
+
+    assert np.allclose(eigenvalues, expected, rtol=1e-8)
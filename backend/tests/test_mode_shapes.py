@@ -0,0 +1,66 @@
+import numpy as np
+
+from app.core.analysis.mode_shapes import (
+    MODE_SHAPE_DTYPE, decode_mode_shape, encode_mode_shape, mode_shape_by_node, mode_shape_rows
+)
+from app.crud.analysis import get_modal_results, get_mode_shape
+from app.models import AnalysisType
+
+
+def test_encoding_round_trips_normalized_float32():
+    mode_shape = np.random.default_rng(0).normal(size=(5, 6))
+    mode_shape[3, 4] = -10.0
+
+    data = encode_mode_shape(mode_shape)
+    assert len(data) == mode_shape.size * np.dtype(MODE_SHAPE_DTYPE).itemsize
+
+    decoded = decode_mode_shape(data)
+    assert decoded.shape == (5, 6)
+    assert np.abs(decoded).max() == 1.0
+    assert np.allclose(decoded, mode_shape / 10.0, rtol=1e-6)
+
+    assert np.allclose(decode_mode_shape(encode_mode_shape(mode_shape, normalize=False)), mode_shape, rtol=1e-6)
+    assert not decode_mode_shape(encode_mode_shape(np.zeros((2, 6)))).any()
+    assert decode_mode_shape(None) is None
+
+
+def test_rows_are_selected_by_node_id():
+    mode_shape = np.arange(18, dtype=float).reshape(3, 6)
+    data = encode_mode_shape(mode_shape, normalize=False)
+    node_ids = ["a", "b", "c"]
+
+    assert mode_shape_by_node(data, node_ids)["b"] == list(range(6, 12))
+    assert mode_shape_by_node(None, node_ids) is None
+
+    found, rows = mode_shape_rows(data, node_ids, ["c", "missing", "a"])
+    assert found == ["c", "a"]
+    assert np.array_equal(rows, mode_shape[[2, 0]])
+
+    found, rows = mode_shape_rows(data, node_ids)
+    assert found == node_ids
+    assert np.array_equal(rows, mode_shape)
+
+
+def test_stored_mode_shapes_match_modal_results(frame, db):
+    model, nodes = frame
+    analysis = model.run(AnalysisType.MODAL, num_modes=4)
+
+    results = get_modal_results(db, analysis_id=analysis.id)
+    assert [result["mode_number"] for result in results] == [1, 2, 3, 4]
+    assert all(result["mode_shape"].keys() == results[0]["mode_shape"].keys() for result in results)
+    assert all(result["mode_shape"] is None for result in get_modal_results(
+        db, analysis_id=analysis.id, include_mode_shapes=False
+    ))
+
+    roof = [nodes[(i, 0, 4)].id for i in range(3)] + ["missing"]
+    shape = get_mode_shape(db, analysis_id=analysis.id, mode_number=2, node_ids=roof)
+    assert shape["node_ids"] == roof[:3]
+    assert np.array_equal(shape["values"], np.array([results[1]["mode_shape"][node_id] for node_id in roof[:3]]))
+
+    # Modal shapes keep their scale; supports do not move
+    full = get_mode_shape(db, analysis_id=analysis.id, mode_number=2)
+    assert len(full["node_ids"]) == len(nodes) + 2 * 3 * 2 * 4
+    assert np.array_equal(full["values"], np.array([results[1]["mode_shape"][node_id] for node_id in full["node_ids"]]))
+    base = [full["node_ids"].index(node.id) for (i, j, k), node in nodes.items() if k == 0]
+    assert not full["values"][base].any()
+    assert get_mode_shape(db, analysis_id=analysis.id, mode_number=99) is None
@@ -0,0 +1,34 @@
+import numpy as np
+
+from app.core.analysis.solver import StructuralAnalysisSolver
+from app.crud.analysis import get_node_results
+
+
+def test_load_cases_share_one_factorization(frame, monkeypatch):
+    model, nodes = frame
+    calls = []
+    factorize = StructuralAnalysisSolver._factorize_stiffness_matrix
+
+    def counting_factorize(self, K_reduced):
+        calls.append(K_reduced.shape)
+        return factorize(self, K_reduced)
+
+    monkeypatch.setattr(StructuralAnalysisSolver, "_factorize_stiffness_matrix", counting_factorize)
+    analysis = model.run()
+
+    assert len(calls) == 1
+    assert len(get_node_results(model.db, analysis_id=analysis.id, limit=None)) > 0
+
+    # Each column matches an analysis of its load case alone
+    all_cases = model.load_cases
+    top = nodes[(2, 2, 4)]
+    for load_case in all_cases:
+        model.load_cases, model.load_combinations = [load_case], []
+        single = model.run()
+        expected = get_node_results(model.db, analysis_id=single.id, node_id=top.id)[0]
+        result = get_node_results(model.db, analysis_id=analysis.id, node_id=top.id, load_case_id=load_case.id)[0]
+        assert np.allclose(
+            [result.dx, result.dy, result.dz, result.rx, result.ry, result.rz],
+            [expected.dx, expected.dy, expected.dz, expected.rx, expected.ry, expected.rz],
+            rtol=1e-10, atol=1e-12
+        )
@@ -0,0 +1,86 @@
+import numpy as np
+import scipy.sparse as sp
+
+from app.core.analysis.linear_solvers import SparseLUSolver
+from app.core.analysis.nonlinear import MAX_STEP_CUTS, solve_nonlinear
+from app.crud.analysis import get_node_results
+from app.models import AnalysisType
+from app.models.analysis import NonlinearSolverType
+
+from conftest import node_displacements
+
+FIXED = (True,) * 6
+
+
+def stiffening_spring():
+    return (lambda u: u + u**5), (lambda u: sp.csr_matrix(np.diag(1 + 5 * u**4)))
+
+
+def test_step_cuts_are_counted_per_step_and_steps_regrow():
+    internal_force, tangent = stiffening_spring()
+    U, statistics = solve_nonlinear(
+        internal_force, tangent, SparseLUSolver().factorize, np.array([200.0]), load_steps=1, max_iterations=6
+    )
+
+    assert statistics["converged"]
+    assert np.isclose(internal_force(U)[0], 200.0, rtol=1e-6)
+    assert statistics["step_cuts"] == MAX_STEP_CUTS
+
+    # After the cuts of the first step the increment doubles back to the full load
+    load_factors = np.array([0.0] + [step["load_factor"] for step in statistics["steps"]])
+    increments = np.diff(load_factors)
+    assert increments[-1] > 100 * increments[0]
+    assert load_factors[-1] == 1.0
+
+
+def test_failed_factorization_cuts_the_step():
+    internal_force, tangent = stiffening_spring()
+    calls = []
+
+    def factorize_matrix(K):
+        calls.append(None)
+        if len(calls) == 1:
+            raise RuntimeError("factorization failed")
+        return SparseLUSolver().factorize(K)
+
+    U, statistics = solve_nonlinear(internal_force, tangent, factorize_matrix, np.array([2.0]), load_steps=2)
+    assert statistics["converged"]
+    assert statistics["step_cuts"] == 1
+    assert np.isclose(internal_force(U)[0], 2.0, rtol=1e-6)
+
+
+def test_small_deformation_cantilever_matches_linear_analysis(model):
+    length, segments, P = 3000.0, 6, 1000.0
+    nodes = [model.node(length * i / segments, 0.0, 0.0, FIXED if i == 0 else (False,) * 6) for i in range(segments + 1)]
+    for start, end in zip(nodes, nodes[1:]):
+        model.element(start, end)
+    model.load_case("Tip", {nodes[-1]: (0.0, P, -P)})
+
+    linear = model.run()
+    expected = node_displacements(model.db, linear)
+    for method in NonlinearSolverType:
+        analysis = model.run(AnalysisType.NONLINEAR_STATIC, nonlinear_solver=method)
+        assert analysis.solver_statistics["nonlinear"]["converged"]
+        assert np.allclose(node_displacements(model.db, analysis), expected, atol=1e-8 * np.abs(expected).max())
+
+
+def test_shallow_arch_snaps_through(model):
+    span, rise, segments, P = 10000.0, 150.0, 20, 60000.0
+    nodes = []
+    for i in range(segments + 1):
+        x, end = span * i / segments, i in (0, segments)
+        nodes.append(model.node(x, 0.0, rise * np.sin(np.pi * x / span), (end, True, end, True, False, True)))
+    for start, end in zip(nodes, nodes[1:]):
+        model.element(start, end)
+    crown = nodes[segments // 2]
+    model.load_case("Crown", {crown: (0.0, 0.0, -P)})
+
+    deflections = []
+    for options in ({}, {"nonlinear_solver": NonlinearSolverType.BFGS}, {"arc_length": True}):
+        analysis = model.run(AnalysisType.NONLINEAR_STATIC, include_large_deformation=True, load_steps=10, **options)
+        assert analysis.solver_statistics["nonlinear"]["converged"]
+        deflections.append(get_node_results(model.db, analysis_id=analysis.id, node_id=crown.id)[0].dz)
+
+    # The crown passes through the chord to the inverted equilibrium
+    assert all(deflection < -2 * rise for deflection in deflections)
+    assert np.allclose(deflections, deflections[0], rtol=1e-4)
@@ -0,0 +1,42 @@
+import numpy as np
+
+from app.crud.analysis import get_node_results
+from app.models import AnalysisType, ElementType
+from app.models.analysis import AccelerationType
+
+from conftest import E
+
+FIXED = (True,) * 6
+
+
+def test_cantilever_column_amplification(model):
+    height, segments, lateral = 4000.0, 10, 1000.0
+    nodes = [model.node(0.0, 0.0, height * i / segments, FIXED if i == 0 else (False,) * 6) for i in range(segments + 1)]
+    for start, end in zip(nodes, nodes[1:]):
+        model.element(start, end, ElementType.COLUMN)
+
+    # Bending stiffness for sway in X and Y from the linear tip deflections
+    model.load_case("Lateral", {nodes[-1]: (lateral, lateral, 0.0)})
+    linear = model.run()
+    result = get_node_results(model.db, analysis_id=linear.id, node_id=nodes[-1].id)[0]
+    tip = np.array([result.dx, result.dy])
+    I = lateral * height**3 / (3 * E * tip)
+
+    # Compression of 30% of the lower Euler load with the same lateral loads
+    P = 0.3 * np.pi**2 * E * I.min() / (4 * height**2)
+    model.load_cases = []
+    model.load_case("Lateral and axial", {nodes[-1]: (lateral, lateral, -P)})
+    kL = height * np.sqrt(P / (E * I))
+    amplification = 3 * (np.tan(kL) - kL) / kL**3
+
+    for options in (
+        {},
+        {"p_delta_acceleration": AccelerationType.AITKEN},
+        {"p_delta_constant_kg": True, "p_delta_max_iterations": 200},
+    ):
+        analysis = model.run(AnalysisType.P_DELTA, p_delta_tolerance=1e-10, **options)
+        history = analysis.solver_statistics["p_delta"]["load_cases"][model.load_cases[0].id]
+        assert history["converged"]
+
+        result = get_node_results(model.db, analysis_id=analysis.id, node_id=nodes[-1].id)[0]
+        assert np.allclose(np.array([result.dx, result.dy]) / tip, amplification, rtol=0.01)
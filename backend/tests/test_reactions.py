@@ -0,0 +1,30 @@
+import numpy as np
+
+from app.crud.analysis import get_node_results
+
+
+def test_support_reactions_balance_applied_loads(frame):
+    model, nodes = frame
+    analysis = model.run()
+    supports = {node.id: node for key, node in nodes.items() if key[2] == 0}
+    coordinates = {node.id: np.array([node.x, node.y, node.z]) for node in nodes.values()}
+
+    for load_case in model.load_cases:
+        applied = np.zeros(3)
+        applied_moment = np.zeros(3)
+        for load in load_case.loads:
+            force = np.array([load.fx or 0.0, load.fy or 0.0, load.fz or 0.0])
+            applied += force
+            applied_moment += np.cross(coordinates[load.node_id], force)
+
+        reaction = np.zeros(3)
+        reaction_moment = np.zeros(3)
+        for node_id, node in supports.items():
+            result = get_node_results(model.db, analysis_id=analysis.id, node_id=node_id, load_case_id=load_case.id)[0]
+            force = np.array([result.fx, result.fy, result.fz])
+            reaction += force
+            reaction_moment += np.cross(coordinates[node_id], force) + np.array([result.mx, result.my, result.mz])
+
+        scale = np.abs(applied).max()
+        assert np.allclose(reaction, -applied, atol=1e-6 * scale)
+        assert np.allclose(reaction_moment, -applied_moment, atol=1e-6 * scale * 1e4)
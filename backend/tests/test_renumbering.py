@@ -0,0 +1,50 @@
+import numpy as np
+import scipy.sparse as sp
+
+from app.core.analysis.renumbering import (
+    bandwidth_and_profile, inverse_permutation, node_adjacency_matrix, reverse_cuthill_mckee_order
+)
+
+
+def shuffled_grid(nx=12, ny=12, seed=0):
+    """
+    Element node pairs of a quadrilateral grid with randomly numbered nodes.
+    """
+    index = np.arange(nx * ny).reshape(ny, nx)
+    pairs = np.concatenate([
+        np.stack([index[:, :-1].ravel(), index[:, 1:].ravel()], axis=1),
+        np.stack([index[:-1, :].ravel(), index[1:, :].ravel()], axis=1),
+    ])
+    labels = np.random.default_rng(seed).permutation(nx * ny)
+    return labels[pairs], nx * ny
+
+
+def dof_matrix_bandwidth_and_profile(element_nodes, node_position, dof_per_node=6):
+    adjacency = node_adjacency_matrix(node_position[element_nodes], len(node_position))
+    pattern = sp.kron(adjacency + sp.identity(len(node_position)), np.ones((dof_per_node, dof_per_node))).tocsr()
+    rows, cols = pattern.nonzero()
+    lower = cols <= rows
+    first_column = np.arange(pattern.shape[0])
+    np.minimum.at(first_column, rows[lower], cols[lower])
+    distance = np.arange(pattern.shape[0]) - first_column
+    return int(np.abs(rows - cols).max()), int(distance.sum())
+
+
+def test_bandwidth_and_profile_match_the_assembled_pattern():
+    element_nodes, num_nodes = shuffled_grid()
+    for position in (np.arange(num_nodes), inverse_permutation(reverse_cuthill_mckee_order(element_nodes, num_nodes))):
+        assert bandwidth_and_profile(element_nodes, position) == dof_matrix_bandwidth_and_profile(element_nodes, position)
+
+
+def test_reverse_cuthill_mckee_reduces_bandwidth():
+    element_nodes, num_nodes = shuffled_grid()
+    order = reverse_cuthill_mckee_order(element_nodes, num_nodes)
+
+    assert np.array_equal(np.sort(order), np.arange(num_nodes))
+    assert np.array_equal(order[inverse_permutation(order)], np.arange(num_nodes))
+
+    bandwidth_before, profile_before = bandwidth_and_profile(element_nodes, np.arange(num_nodes))
+    bandwidth_after, profile_after = bandwidth_and_profile(element_nodes, inverse_permutation(order))
+    assert bandwidth_after <= 6 * 13 + 5
+    assert bandwidth_after < bandwidth_before / 4
+    assert profile_after < profile_before / 4
@@ -0,0 +1,72 @@
+import numpy as np
+
+from app.core.analysis.response_spectrum import (
+    cqc_correlation, combine_modal_responses, influence_vectors, participation_factors, spectral_accelerations
+)
+from app.core.analysis.solver import StructuralAnalysisSolver
+from app.crud.analysis import get_node_results
+from app.models import AnalysisType
+from app.models.analysis import ModalCombinationType
+
+SPECTRUM = [[0.0, 2000.0], [0.5, 6000.0], [1.0, 3000.0], [4.0, 750.0]]
+
+
+def test_cqc_correlation_limits():
+    omega = np.array([10.0, 10.5, 40.0])
+    rho = cqc_correlation(omega, 0.05)
+
+    assert np.allclose(np.diag(rho), 1.0)
+    assert np.allclose(rho, rho.T)
+    assert rho[0, 1] > 0.5 and rho[0, 2] < 0.01
+    assert np.allclose(cqc_correlation(omega, 0.0), np.eye(3))
+    assert np.allclose(cqc_correlation(np.array([10.0, 10.0]), 0.0), 1.0)
+
+
+def test_identity_correlation_is_srss():
+    responses = np.random.default_rng(0).normal(size=(5, 4, 3))
+    assert np.allclose(combine_modal_responses(responses, np.eye(5)), np.sqrt((responses**2).sum(axis=0)))
+
+
+def test_spectral_accelerations_clamp_outside_the_spectrum():
+    periods = np.array([0.25, 2.5, 10.0])
+    assert np.allclose(spectral_accelerations(periods, SPECTRUM[::-1], scale=2.0), [8000.0, 3750.0, 1500.0])
+
+
+def test_all_modes_capture_the_total_mass(frame):
+    model, _ = frame
+    analysis = model.run(
+        AnalysisType.RESPONSE_SPECTRUM, num_modes=10000, spectrum=SPECTRUM, spectrum_directions=["x", "y"]
+    )
+    participation = analysis.solver_statistics["response_spectrum"]["mass_participation"]
+    assert np.isclose(participation["x"], 1.0) and np.isclose(participation["y"], 1.0)
+
+
+def test_combined_displacements_match_mode_by_mode_reference(frame):
+    model, nodes = frame
+    for combination in (ModalCombinationType.CQC, ModalCombinationType.SRSS):
+        analysis = model.run(
+            AnalysisType.RESPONSE_SPECTRUM, num_modes=12, spectrum=SPECTRUM, spectrum_directions=["x", "y"],
+            modal_combination=combination
+        )
+        solver = StructuralAnalysisSolver(model.db, analysis.id)
+        eigenvalues, modes, M, bc_data = solver._solve_modes()
+
+        # Reference: peak modal responses combined pair by pair, then directions by SRSS
+        omega = np.sqrt(eigenvalues)
+        Sa = spectral_accelerations(2 * np.pi / omega, SPECTRUM)
+        _, gamma, _ = participation_factors(modes, M, influence_vectors(solver.free_dofs, ["x", "y"]))
+        total = np.zeros(solver.total_dof)
+        for direction in range(2):
+            U = solver._recover_full_displacement_vector(modes, bc_data) * (gamma[:, direction] * Sa / omega**2)
+            for i in range(len(omega)):
+                for j in range(len(omega)):
+                    if combination == ModalCombinationType.SRSS and i != j:
+                        continue
+                    rho = cqc_correlation(omega[[i, j]], 0.05)[0, 1] if i != j else 1.0
+                    total += rho * U[:, i] * U[:, j]
+        expected = np.sqrt(total).reshape(-1, 6)
+
+        top = nodes[(2, 2, 4)]
+        result = get_node_results(model.db, analysis_id=analysis.id, node_id=top.id)[0]
+        row = expected[solver.node_map[top.id]]
+        assert np.allclose([result.dx, result.dy, result.dz], row[:3], rtol=1e-8, atol=1e-12)
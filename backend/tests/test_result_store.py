@@ -0,0 +1,72 @@
+import os
+
+import numpy as np
+
+from app.core.analysis.result_store import ResultStore
+from app.core.design.designer import StructuralDesigner
+from app.crud.analysis import get_element_results, get_node_results
+from app.models import ElementResult, NodeResult
+from app.models.design import Design, DesignCode, DesignMethod, ElementDesignResult
+from app.schemas.analysis import AnalysisResponse
+
+NODE_COLUMNS = ("dx", "dy", "dz", "rx", "ry", "rz", "fx", "fy", "fz", "mx", "my", "mz")
+ELEMENT_COLUMNS = ("position", "axial_force", "bending_moment_y", "bending_moment_z", "von_mises_stress")
+ALL = 10**6
+
+
+def node_rows(db, analysis, **selection):
+    rows = get_node_results(db, analysis_id=analysis.id, limit=ALL, **selection)
+    rows = sorted(rows, key=lambda r: (r.node_id, r.load_case_id or "", r.load_combination_id or ""))
+    return np.array([[np.nan if getattr(r, c) is None else getattr(r, c) for c in NODE_COLUMNS] for r in rows])
+
+
+def element_rows(db, analysis, **selection):
+    rows = get_element_results(db, analysis_id=analysis.id, limit=ALL, **selection)
+    rows = sorted(rows, key=lambda r: (r.element_id, r.load_case_id or "", r.load_combination_id or "", r.position))
+    return np.array([[getattr(r, c) for c in ELEMENT_COLUMNS] for r in rows])
+
+
+def test_result_store_matches_database_results(frame):
+    model, nodes = frame
+    database = model.run()
+    stored = model.run(use_result_store=True)
+
+    assert ResultStore.exists(stored.result_store_path)
+    assert os.path.isdir(stored.result_store_path)
+    assert stored.has_result_store and not database.has_result_store
+    assert "result_store_path" not in AnalysisResponse.model_validate(stored).model_dump()
+    assert model.db.query(NodeResult).filter(NodeResult.analysis_id == stored.id).count() == 0
+    assert model.db.query(ElementResult).filter(ElementResult.analysis_id == stored.id).count() == 0
+
+    assert np.allclose(node_rows(model.db, stored), node_rows(model.db, database), equal_nan=True)
+    assert np.allclose(element_rows(model.db, stored), element_rows(model.db, database))
+
+    # Filters and paging behave like the database query
+    combination = model.load_combinations[0]
+    top = nodes[(1, 1, 4)]
+    selection = {"node_id": top.id, "load_combination_id": combination.id}
+    assert np.allclose(node_rows(model.db, stored, **selection), node_rows(model.db, database, **selection), equal_nan=True)
+    assert len(get_element_results(model.db, analysis_id=stored.id, skip=5, limit=7)) == 7
+
+
+def test_design_reads_forces_from_the_result_store(frame):
+    model, _ = frame
+    checks = []
+    for use_result_store in (False, True):
+        analysis = model.run(use_result_store=use_result_store)
+        design = Design(
+            project_id=model.project.id, name="design", design_code=DesignCode.AISC_360_16,
+            design_method=DesignMethod.LRFD, analysis_id=analysis.id,
+            load_combination_ids=[combination.id for combination in model.load_combinations]
+        )
+        model.db.add(design)
+        model.db.commit()
+        StructuralDesigner(model.db, design.id).run_design()
+
+        results = model.db.query(ElementDesignResult).filter(ElementDesignResult.design_id == design.id).all()
+        checks.append(sorted((result.element_id, result.combined_check) for result in results))
+
+    assert len(checks[0]) > 0
+    assert [element_id for element_id, _ in checks[1]] == [element_id for element_id, _ in checks[0]]
+    assert np.allclose([check for _, check in checks[1]], [check for _, check in checks[0]])
+    assert max(check for _, check in checks[0]) > 0
@@ -0,0 +1,34 @@
+import numpy as np
+
+from app.core.analysis.result_writer import ResultWriter
+from app.models import Analysis, AnalysisType, NodeResult
+
+
+def test_writer_batches_rows_and_stores_nan_as_null(model):
+    node = model.node(0.0, 0.0, 0.0)
+    analysis = Analysis(project_id=model.project.id, name="writer", analysis_type=AnalysisType.LINEAR_STATIC)
+    model.db.add(analysis)
+    model.db.commit()
+
+    dx = np.arange(20, dtype=float)
+    dx[3] = np.nan
+    writer = ResultWriter(model.db, batch_size=7)
+    writer.write(NodeResult, {"analysis_id": analysis.id, "node_id": node.id, "dx": dx, "dy": list(range(20))}, 20)
+
+    rows = model.db.query(NodeResult).filter(NodeResult.analysis_id == analysis.id).all()
+    assert writer.rows_written == 20
+    assert len(rows) == 20 and len({row.id for row in rows}) == 20
+    assert sorted(row.dy for row in rows) == list(range(20))
+    assert sum(row.dx is None for row in rows) == 1
+
+    # Nothing is committed by the writer
+    model.db.rollback()
+    assert model.db.query(NodeResult).filter(NodeResult.analysis_id == analysis.id).count() == 0
+
+
+def test_analysis_reports_the_rows_it_wrote(frame):
+    model, _ = frame
+    analysis = model.run()
+
+    assert analysis.solver_statistics["result_rows"] == len(analysis.node_results) + len(analysis.element_results)
+    assert len(analysis.node_results) == 3 * len(model.project.nodes)
@@ -0,0 +1,60 @@
+import numpy as np
+from sqlalchemy import event
+
+from app.core.snapshot import ModelSnapshot
+from app.db.session import engine
+
+
+def count_queries(function):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        result = function()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return result, len(statements)
+
+
+def test_snapshot_loads_model_with_a_fixed_number_of_queries(frame):
+    model, nodes = frame
+    model.db.commit()
+    load_case_ids = [load_case.id for load_case in model.load_cases]
+    combination_ids = [combination.id for combination in model.load_combinations]
+    model.db.expire_all()
+
+    snapshot, queries = count_queries(lambda: ModelSnapshot(
+        model.db, model.project.id, load_case_ids=load_case_ids, load_combination_ids=combination_ids
+    ))
+
+    assert snapshot.num_nodes > 50 and snapshot.num_elements > 50
+    assert queries <= 10
+
+
+def test_snapshot_columns_match_the_model(frame):
+    model, nodes = frame
+    model.db.commit()
+    lateral, gravity = model.load_cases
+    snapshot = ModelSnapshot(
+        model.db, model.project.id,
+        load_case_ids=[lateral.id, gravity.id],
+        load_combination_ids=[combination.id for combination in model.load_combinations]
+    )
+    snapshot.check_elements()
+
+    properties = snapshot.element_properties()
+    element = snapshot.elements[0]
+    start, end = snapshot.node(element.start_node_id), snapshot.node(element.end_node_id)
+    assert np.isclose(properties["L"][0], np.linalg.norm([end.x - start.x, end.y - start.y, end.z - start.z]))
+    assert np.allclose(properties["A"], model.section.area)
+
+    F = snapshot.nodal_load_matrix()
+    columns = {load_case.id: j for j, load_case in enumerate(snapshot.load_cases)}
+    assert np.isclose(F[0::6, columns[lateral.id]].sum(), 10000.0 * (1 + 2 + 3 + 4))
+    assert np.isclose(F[2::6, columns[gravity.id]].sum(), -50000.0 * sum(1 for key in nodes if key[2] > 0))
+
+    factors = snapshot.combination_factor_matrix()
+    assert np.allclose(factors[0, [columns[lateral.id], columns[gravity.id]]], [1.6, 1.2])
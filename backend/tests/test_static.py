@@ -0,0 +1,35 @@
+import numpy as np
+import scipy.sparse as sp
+
+from app.core.analysis.solver import StructuralAnalysisSolver
+from app.crud.analysis import get_node_results
+
+from conftest import E, IY, IZ
+
+FIXED = (True,) * 6
+
+
+def test_cantilever_tip_deflection(model):
+    length, segments, P = 3000.0, 6, 1000.0
+    nodes = [model.node(length * i / segments, 0.0, 0.0, FIXED if i == 0 else (False,) * 6) for i in range(segments + 1)]
+    for start, end in zip(nodes, nodes[1:]):
+        model.element(start, end)
+    model.load_case("Tip", {nodes[-1]: (0.0, P, -P)})
+    analysis = model.run()
+
+    tip = get_node_results(model.db, analysis_id=analysis.id, node_id=nodes[-1].id)[0]
+    assert np.isclose(tip.dz, -P * length**3 / (3 * E * IY), rtol=1e-6)
+    assert np.isclose(tip.dy, P * length**3 / (3 * E * IZ), rtol=1e-6)
+
+
+def test_global_stiffness_is_sparse_and_symmetric(frame):
+    model, _ = frame
+    model.db.commit()
+    analysis = model.run()
+    solver = StructuralAnalysisSolver(model.db, analysis.id)
+    K = solver._assemble_global_stiffness_matrix()
+
+    assert sp.issparse(K)
+    assert K.shape == (solver.total_dof, solver.total_dof)
+    assert K.nnz < 0.1 * solver.total_dof**2
+    assert abs(K - K.T).max() <= 1e-9 * abs(K).max()
@@ -0,0 +1,52 @@
+import numpy as np
+import scipy.sparse as sp
+
+from app.core.analysis.stiffness_cache import StiffnessCache, cache_nbytes, model_hash
+
+from conftest import node_displacements
+
+
+def test_model_hash_covers_contents_dtype_and_shape():
+    a = np.arange(6, dtype=float)
+
+    assert model_hash([a]) == model_hash([a.copy()])
+    assert model_hash([a]) != model_hash([a.reshape(2, 3)])
+    assert model_hash([a]) != model_hash([a.astype(np.float32)])
+    assert model_hash([a]) != model_hash([a + 1e-12])
+
+
+def test_cache_evicts_least_recently_used_and_reloads_from_disk(tmp_path):
+    entry = np.zeros(100)  # 800 bytes
+    cache = StiffnessCache(max_bytes=2000, directory=str(tmp_path))
+
+    cache.put("a", entry, persist=True)
+    cache.put("b", entry)
+    cache.get("a")
+    cache.put("c", entry)
+    assert cache.nbytes == 1600
+    assert cache.get("b") is None  # Evicted, and not persisted
+
+    cache.put("too large", np.zeros(1000))
+    assert cache.get("too large") is None
+
+    cache.clear()
+    assert np.array_equal(cache.get("a"), entry)  # Reloaded from the on-disk tier
+    assert cache_nbytes({"K": sp.identity(10, format="csr"), "T": entry}) == 10 * 8 + 10 * 4 + 11 * 4 + 800
+
+
+def test_unchanged_model_reuses_stiffness_and_factorization(frame):
+    model, _ = frame
+    first = model.run()
+    second = model.run(clear_cache=False)
+
+    assert first.solver_statistics["stiffness_cache"] == "miss"
+    assert first.solver_statistics["factorization_cache"] == "miss"
+    assert second.solver_statistics["stiffness_cache"] == "hit"
+    assert second.solver_statistics["factorization_cache"] == "hit"
+    assert np.array_equal(node_displacements(model.db, second), node_displacements(model.db, first))
+
+    # Any change to the stiffness data is a different model
+    model.section.area *= 2
+    third = model.run(clear_cache=False)
+    assert third.solver_statistics["stiffness_cache"] == "miss"
+    assert not np.allclose(node_displacements(model.db, third), node_displacements(model.db, first))
@@ -0,0 +1,64 @@
+import numpy as np
+import scipy.sparse as sp
+
+from app.core.analysis.solver import StructuralAnalysisSolver
+from app.core.analysis.superelements import Superelement, find_repeated_stories
+
+from conftest import node_displacements
+
+
+def test_condensation_is_the_schur_complement():
+    rng = np.random.default_rng(0)
+    A = sp.random(30, 30, density=0.15, random_state=0) + 30 * sp.identity(30)
+    K = (A + A.T).tocsr()
+    interior, boundary = np.arange(10, 30), np.arange(10)
+
+    superelement = Superelement(K, interior, boundary)
+    K_dense = K.toarray()
+    K_ii, K_ib = K_dense[np.ix_(interior, interior)], K_dense[np.ix_(interior, boundary)]
+    schur = K_dense[np.ix_(boundary, boundary)] - K_ib.T @ np.linalg.solve(K_ii, K_ib)
+    assert np.allclose(superelement.condensed.toarray(), schur)
+
+    # Condensed loads and interior recovery reproduce the full solution
+    F = rng.normal(size=30)
+    U = np.linalg.solve(K_dense, F)
+    U_b = np.linalg.solve(schur, F[boundary] + superelement.condense_loads(F[interior]))
+    assert np.allclose(U_b, U[boundary])
+    assert np.allclose(superelement.recover_interior(F[interior], U_b), U[interior])
+
+
+def test_regular_frame_condenses_all_stories_below_the_roof(frame):
+    model, _ = frame
+    analysis = model.run()
+    solver = StructuralAnalysisSolver(model.db, analysis.id)
+
+    groups = solver._find_substructures()
+    assert len(groups) == 1
+    assert len(groups[0]) == 4 - 1
+    assert all(substructure.interior.any() for substructure in groups[0])
+
+
+def test_superelement_solve_matches_direct_solve(frame):
+    model, _ = frame
+    expected = node_displacements(model.db, model.run())
+    analysis = model.run(use_superelements=True)
+
+    assert analysis.solver_statistics["superelements"] == 1
+    assert analysis.solver_statistics["substructures"] == 3
+    assert np.allclose(node_displacements(model.db, analysis), expected, atol=1e-9 * np.abs(expected).max())
+
+
+def test_stories_without_interior_nodes_are_grouped():
+    # Three identical stories of four columns and a beam ring, without intermediate nodes
+    corners = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+    coordinates = np.array([[x, y, z] for z in range(4) for x, y in corners])
+    elements = []
+    for level in range(1, 4):
+        elements += [(4 * (level - 1) + i, 4 * level + i) for i in range(4)]
+        elements += [(4 * level + i, 4 * level + (i + 1) % 4) for i in range(4)]
+    elements = np.array(elements)
+    fixed = coordinates[:, 2] == 0
+
+    groups = find_repeated_stories(coordinates, elements, np.ones((len(elements), 1)), fixed)
+    assert [len(group) for group in groups] == [2]
+    assert not any(substructure.interior.any() for substructure in groups[0])
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from app.core.analysis.superposition import superpose
+from app.crud.analysis import get_element_results, get_node_results
+
+NODE_COLUMNS = ("dx", "dy", "dz", "rx", "ry", "rz", "fx", "fy", "fz", "mx", "my", "mz")
+ELEMENT_COLUMNS = ("axial_force", "shear_force_y", "shear_force_z", "torsional_moment", "bending_moment_y", "bending_moment_z")
+
+
+def test_superpose_shapes_and_mismatch():
+    factors = np.array([[1.2, 1.6], [1.0, 0.0]])
+    results = np.random.default_rng(0).normal(size=(2, 5, 3))
+
+    combined = superpose(factors, results)
+    assert combined.shape == (2, 5, 3)
+    assert np.allclose(combined[0], 1.2 * results[0] + 1.6 * results[1])
+
+    with pytest.raises(ValueError):
+        superpose(factors, results[:1])
+
+
+def test_combinations_equal_factored_load_cases(frame):
+    model, _ = frame
+    analysis = model.run()
+    lateral, gravity = model.load_cases
+    combination = model.load_combinations[0]
+
+    def node_values(**selection):
+        rows = sorted(get_node_results(model.db, analysis_id=analysis.id, limit=None, **selection), key=lambda r: r.node_id)
+        return np.array([[getattr(r, column) or 0.0 for column in NODE_COLUMNS] for r in rows])
+
+    def element_values(**selection):
+        rows = get_element_results(model.db, analysis_id=analysis.id, limit=None, **selection)
+        rows = sorted(rows, key=lambda r: (r.element_id, r.position))
+        return np.array([[getattr(r, column) for column in ELEMENT_COLUMNS] for r in rows])
+
+    for values in (node_values, element_values):
+        expected = 1.6 * values(load_case_id=lateral.id) + 1.2 * values(load_case_id=gravity.id)
+        combined = values(load_combination_id=combination.id)
+        assert np.allclose(combined, expected, atol=1e-9 * np.abs(expected).max())
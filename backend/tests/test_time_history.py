@@ -0,0 +1,66 @@
+import numpy as np
+from scipy.sparse.linalg import spsolve
+
+from app.core.analysis.solver import StructuralAnalysisSolver
+from app.core.analysis.time_history import integrate_modes
+from app.crud.analysis import get_time_history
+from app.models import AnalysisType
+
+
+def step_response(t, omega, zeta, acceleration):
+    """
+    Displacement of an SDOF oscillator at rest under a constant ground acceleration from t = 0.
+    """
+    omega_d = omega * np.sqrt(1 - zeta**2)
+    decay = np.exp(-zeta * omega * t) * (np.cos(omega_d * t) + zeta / np.sqrt(1 - zeta**2) * np.sin(omega_d * t))
+    return -acceleration / omega**2 * (1 - decay)
+
+
+def test_duhamel_recurrence_is_exact_for_a_step():
+    omega, zeta, dt, num_steps = np.array([3.0, 20.0]), 0.05, 0.01, 500
+    record = np.ones(num_steps + 1) * 100.0
+    record[0] = 0.0  # Ramp to the step over the first interval
+
+    history = np.concatenate([chunk for _, chunk in integrate_modes(omega, zeta, dt, record, np.ones(2), num_steps)])
+
+    # A ramp over [0, dt] is the average of steps starting uniformly in [0, dt]
+    t = np.arange(1, num_steps + 1) * dt
+    for mode in range(2):
+        exact = np.mean([step_response(t - s, omega[mode], zeta, 100.0) for s in np.linspace(0, dt, 2001)], axis=0)
+        assert history[0, mode] == 0.0
+        assert np.allclose(history[1:, mode], exact, rtol=1e-5, atol=1e-5 * np.abs(exact).max())
+
+
+def test_chunks_do_not_change_the_history():
+    omega, record = np.array([2.0, 7.0, 30.0]), np.sin(np.arange(300) * 0.05)
+    participation = np.array([1.0, -0.5, 0.2])
+    whole = np.concatenate([chunk for _, chunk in integrate_modes(omega, 0.02, 0.01, record, participation, 400)])
+    chunked = list(integrate_modes(omega, 0.02, 0.01, record, participation, 400, chunk_steps=37))
+
+    assert [start for start, _ in chunked] == list(range(0, 401, 37))
+    assert np.array_equal(np.concatenate([chunk for _, chunk in chunked]), whole)
+
+
+def test_constant_ground_acceleration_settles_to_the_static_solution(frame):
+    model, nodes = frame
+    dt, num_steps, acceleration = 0.01, 3000, 1000.0
+    top = nodes[(2, 2, 4)]
+    analysis = model.run(
+        AnalysisType.TIME_HISTORY, num_modes=10000, time_step=dt, ground_motion=[acceleration] * num_steps,
+        ground_motion_direction="y", history_node_ids=[top.id]
+    )
+    history = get_time_history(model.db, analysis_id=analysis.id, node_id=top.id)
+    assert len(history["times"]) == num_steps + 1
+
+    # Static response to the inertia forces -M r a
+    solver = StructuralAnalysisSolver(model.db, analysis.id)
+    K_ff = solver._partition_matrix(solver._get_stiffness_matrices()["K_global"])[0]
+    M_ff = solver._partition_matrix(solver._assemble_global_mass_matrix())[0]
+    r = (solver.free_dofs % 6 == 1).astype(float)
+    U = np.zeros(solver.total_dof)
+    U[solver.free_dofs] = spsolve(K_ff.tocsc(), -acceleration * (M_ff @ r))
+    expected = U.reshape(-1, 6)[solver.node_map[top.id]]
+
+    # The load ramps back to zero over the step after the record, so compare the last step inside it
+    final = np.array(history["displacements"][num_steps - 1])
+    assert np.allclose(final, expected, rtol=1e-4, atol=1e-6 * np.abs(expected).max())
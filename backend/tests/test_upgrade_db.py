@@ -0,0 +1,57 @@
+import json
+
+import numpy as np
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.crud.analysis import get_mode_shape
+from app.db.init_db import upgrade_db
+from app.db.session import Base
+from app.models import Analysis, AnalysisType, Project
+
+
+def test_upgrade_converts_a_legacy_database(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        db.add(Project(id="p", name="legacy"))
+        db.add(Analysis(id="a", project_id="p", name="modal", analysis_type=AnalysisType.MODAL))
+        db.commit()
+
+    # Roll the schema back to JSON mode shapes and no result store or mode shape node order columns
+    with engine.begin() as connection:
+        for statement in (
+            "ALTER TABLE analysis DROP COLUMN mode_shape_node_ids",
+            "ALTER TABLE analysis DROP COLUMN result_store_path",
+            "ALTER TABLE analysis DROP COLUMN use_result_store",
+            "ALTER TABLE modalresult DROP COLUMN mode_shape",
+            "ALTER TABLE modalresult ADD COLUMN mode_shape JSON",
+        ):
+            connection.execute(text(statement))
+
+        legacy = {"n1": [0.0, 0.5, 0.0, 0.0, 0.0, 0.1], "n2": [0.0, 1.5, 0.0, 0.0, 0.0, 0.2]}
+        for mode_number, mode_shape in ((1, legacy), (2, None)):
+            connection.execute(text(
+                "INSERT INTO modalresult "
+                "(id, created_at, updated_at, analysis_id, mode_number, frequency, period, modal_mass, mode_shape) "
+                "VALUES (:id, '2024-01-01', '2024-01-01', 'a', :mode_number, 1.0, 1.0, 1.0, :mode_shape)"
+            ), {"id": f"m{mode_number}", "mode_number": mode_number, "mode_shape": json.dumps(mode_shape)})
+
+    upgrade_db(engine)
+    upgrade_db(engine)  # Upgrading an up-to-date database changes nothing
+
+    db = sessionmaker(bind=engine)()
+    try:
+        analysis = db.get(Analysis, "a")
+        assert analysis.mode_shape_node_ids == ["n1", "n2"]
+        assert analysis.use_result_store is False and not analysis.has_result_store
+        assert analysis.analysis_type == AnalysisType.MODAL
+        assert db.get(Project, "p").name == "legacy"
+
+        shape = get_mode_shape(db, analysis_id="a", mode_number=1, node_ids=["n2"])
+        assert shape["node_ids"] == ["n2"]
+        assert np.allclose(shape["values"], [legacy["n2"]])
+        assert get_mode_shape(db, analysis_id="a", mode_number=2) is None
+    finally:
+        db.close()
+        engine.dispose()